@@ -0,0 +1,411 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.CrossoverOperators import crossover_masks, repair_lectures
+from ag_timetable.ScheduleGA import MAX_DUPLICATE_MUTATIONS, ScheduleGA, Individual
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+class BatchedScheduleGA(ScheduleGA):
+    """
+    ScheduleGA variant that keeps the whole population in one integer array.
+
+    The population is a (pop_size, terms, days, slots_per_day) array of subject ids. Each
+    generation is scored with one batched NumPy pass, and selection, elitism,
+    crossover and mutation work on row indices of that array, so no per-individual
+    Python objects are created while evolving. Tournament competitors are drawn with
+    replacement.
+
+    Attributes:
+        genes (np.ndarray): Population genomes, one row per individual.
+        fitness (np.ndarray): Fitness of each row of `genes`.
+        conflicts (np.ndarray): Conflict count of each row of `genes`.
+    """
+    def __init__(
+        self,
+        subjects: List[CourseSubject],
+        pop_size: int = 50,
+        generations: int = 100,
+        use_tournament: bool = True,
+        crossover_prob: float = 0.9,
+        elitism_size: int = 2,
+        mutation_rate: float = 0.1,
+        tournament_size: int = 3,
+        **options
+    ):
+        """
+        Initialize the batched genetic algorithm; arguments match ScheduleGA, and its
+        other keyword options (stopping criteria, checkpoint settings, grid shape,
+        local search, greedy_init, seed, memo, duplicate, replacement, mutation and
+        crossover settings) are passed through. use_genome is implied.
+
+        Raises:
+            ValueError: for workers above 1 (whole generations are scored in one
+                in-process NumPy pass, so a worker pool would sit idle), or for any
+                setting ScheduleGA rejects.
+        """
+        if options.get("workers", 1) > 1:
+            raise ValueError("BatchedScheduleGA scores generations in-process; workers must be 1.")
+        super().__init__(subjects, pop_size, generations, use_tournament, crossover_prob,
+                         elitism_size, mutation_rate, tournament_size, use_genome=True, **options)
+
+    @property
+    def population(self) -> List[ScheduleGenome]:
+        # genome views over the rows of `genes`, for code written against ScheduleGA
+        return [ScheduleGenome(self.catalog, row, self.shape) for row in self.genes]
+
+    def _init_population(self):
+        """
+        Fill every row with a random placement of each term's lectures, except the
+        first greedy_init share of rows, which are built greedily.
+
+        Raises:
+            ValueError: if a term has more lectures than free slots.
+        """
+        # NumPy generator for the array operators, seeded like the GA's own random.Random
+        self._rng = np.random.default_rng(self.seed)
+        terms, cells = self.shape.terms, self.shape.slots_per_term
+        self._template = template = np.zeros((terms, cells), dtype=np.int16)
+        for term in range(1, terms + 1):
+            ids = self.catalog.term_subject_ids(term)
+            lectures = np.repeat(np.array(ids, dtype=np.int16), self.catalog.lecture_count[ids])
+            if len(lectures) > cells:
+                name = self.catalog.names[int(lectures[cells])]
+                raise ValueError(f"Not enough available slots to assign '{name}' in term {term}.")
+            template[term - 1, :len(lectures)] = lectures
+        self.genes = self._random_rows(self.pop_size)
+        for row in range(round(self.greedy_init * self.pop_size)):
+            genome = ScheduleGenome(self.catalog, shape=self.shape)
+            genome.assign_subjects_greedily(self.rng)
+            self.genes[row] = genome.genes
+        self.conflicts, self.fitness = self._score(self.genes)
+        # children of one steady-state step, reused by every step
+        self._child_buffer = np.empty((self.offspring_per_step,) + self.shape.dims, dtype=np.int16)
+
+    def _random_rows(self, n: int) -> np.ndarray:
+        # an independent random permutation of each term's cells per individual
+        order = np.argsort(self._rng.random((n,) + self._template.shape), axis=2)
+        genes = np.take_along_axis(np.broadcast_to(self._template, order.shape), order, axis=2)
+        return genes.reshape((n,) + self.shape.dims)
+
+    def _score(self, genes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # one batched pass over the given rows (those missing from the memo, if enabled); returns (conflicts, fitness)
+        if self.memo is None:
+            conflicts, _, _, _, fitness = ScheduleGenome.evaluate_population(self.catalog, genes)
+            self.evaluations += len(genes)
+            return conflicts, fitness
+        # the memo is shared with ScheduleGA.evaluate, so it holds full FitnessBreakdowns
+        keys = [row.tobytes() for row in genes]
+        known = [self.memo.get(key) for key in keys]
+        missing = [i for i, result in enumerate(known) if result is None]
+        if missing:
+            results = ScheduleGenome.evaluate_breakdowns(self.catalog, genes[missing])
+            self.evaluations += len(missing)
+            for i, result in zip(missing, results):
+                known[i] = result
+                self.memo.put(keys[i], result)
+        return (np.array([r.conflicts for r in known], dtype=np.int64),
+                np.array([r.fitness for r in known], dtype=np.float64))
+
+    def _select_rows(self, n: int) -> np.ndarray:
+        """
+        Select n parent row indices with tournament or roulette selection.
+        """
+        if self.use_tournament:
+            competitors = self._rng.integers(0, len(self.genes), (n, self.tournament_size))
+            best = np.argmax(self.fitness[competitors], axis=1)
+            return competitors[np.arange(n), best]
+        cumulative = np.cumsum(self.fitness)
+        picks = self._rng.uniform(0, cumulative[-1], n)
+        return np.minimum(np.searchsorted(cumulative, picks), len(self.genes) - 1)
+
+    def _repair_rows(self, children: np.ndarray, from_p1: np.ndarray):
+        """
+        Restore the lecture counts, in place, of child terms built from the days of
+        both parents (see CrossoverOperators.repair_lectures).
+
+        Args:
+            children: child rows.
+            from_p1: (rows, terms, days) crossover masks the children were built with.
+        """
+        mixed = from_p1.any(axis=2) & ~from_p1.all(axis=2)
+        for row, term in np.argwhere(mixed):
+            cells = children[row, term].reshape(-1)
+            repaired = cells.tolist()
+            repair_lectures(repaired, self._term_lectures[term], self.rng)
+            cells[:] = repaired
+
+    def _mutate_rows(self, children: np.ndarray) -> List[Tuple[int, str]]:
+        """
+        Apply the ScheduleGA mutation to a random subset of rows in place: one of the
+        mutation operators per row, or with the legacy mutation two cells drawn and
+        swapped when they fall in the same term.
+
+        Returns:
+            (row, operator) for every row mutated by an operator; empty for the legacy
+            mutation.
+        """
+        rows = np.flatnonzero(self._rng.random(len(children)) < self.mutation_rate)
+        flat = children.reshape(len(children), -1)
+        if self._mutator is not None:
+            return [(int(row), self._mutator.mutate_genes(flat[row])) for row in rows]
+        idx1 = self._rng.integers(0, flat.shape[1], len(rows))
+        idx2 = self._rng.integers(0, flat.shape[1] - 1, len(rows))
+        idx2 += idx2 >= idx1
+        per_term = self.shape.slots_per_term
+        same = idx1 // per_term == idx2 // per_term
+        rows, idx1, idx2 = rows[same], idx1[same], idx2[same]
+        flat[rows, idx1], flat[rows, idx2] = flat[rows, idx2], flat[rows, idx1]
+        return []
+
+    def _credit_rows(self, mutated: List[Tuple[int, str]], parent1: np.ndarray, parent2: np.ndarray,
+                     cross: np.ndarray, child_fitness: np.ndarray):
+        """
+        Report the fitness of scored child rows to the mutation operators that made them.
+
+        Args:
+            mutated: (row, operator) pairs from _mutate_rows.
+            parent1, parent2, cross: parent rows and crossover flag of every child; the
+                parents' fitness must still be in `fitness`.
+            child_fitness: fitness of every child.
+        """
+        if not mutated:
+            return
+        improved = 0
+        for row, operator in mutated:
+            baseline = self.fitness[parent1[row]]
+            if cross[row]:
+                baseline = max(baseline, self.fitness[parent2[row]])
+            self._mutator.record(operator, float(baseline), float(child_fitness[row]))
+            improved += child_fitness[row] > baseline
+        self._profiler.count("mutations", len(mutated))
+        self._profiler.count("improving_mutations", int(improved))
+
+    def _dedupe_rows(self, children: np.ndarray, existing: np.ndarray) -> List[int]:
+        """
+        Apply the duplicate policy in place to child rows equal to a row of `existing`
+        (the elites, or the whole population in steady-state mode) or to an earlier
+        child: replace them with random rows, or swap two cells of a random term until
+        they are unique (at most MAX_DUPLICATE_MUTATIONS times).
+
+        Returns:
+            The rows replaced by random ones.
+        """
+        replaced = []
+        seen = {row.tobytes() for row in existing}
+        flat = children.reshape(len(children), -1)
+        per_term = self.shape.slots_per_term
+        for i, row in enumerate(flat):
+            key = row.tobytes()
+            if key in seen:
+                self._profiler.count("duplicates")
+                if self.duplicates == "replace":
+                    children[i] = self._random_rows(1)[0]
+                    replaced.append(i)
+                    key = row.tobytes()
+                else:
+                    for _ in range(MAX_DUPLICATE_MUTATIONS):
+                        a, b = int(self._rng.integers(self.shape.terms)) * per_term \
+                            + self._rng.choice(per_term, 2, replace=False)
+                        row[a], row[b] = row[b], row[a]
+                        key = row.tobytes()
+                        if key not in seen:
+                            break
+            seen.add(key)
+        return replaced
+
+    def _next_generation(self) -> Tuple[np.ndarray, int]:
+        """
+        Replace the population array with the next generation.
+
+        Returns:
+            A tuple (fitness of every row, fewest conflicts of any row).
+        """
+        if self.replacement == "steady_state":
+            return self._steady_state_generation()
+        prof = self._profiler
+        n_elite = min(self.elitism_size, self.pop_size)
+        n_children = self.pop_size - n_elite
+        elite = np.argsort(-self.fitness, kind="stable")[:n_elite]
+        prof.lap("sorting")
+        parent1 = self._select_rows(n_children)
+        parent2 = self._select_rows(n_children)
+        prof.lap("selection")
+        # blocks drawn from parent1; no crossover means all of them are
+        cross = self._rng.random(n_children) < self.crossover_prob
+        from_p1 = crossover_masks(self.crossover, self.shape, self._rng, n_children)
+        from_p1[~cross] = True
+        children = np.where(from_p1[..., None], self.genes[parent1], self.genes[parent2])
+        self._repair_rows(children, from_p1)
+        prof.lap("crossover")
+        mutated = self._mutate_rows(children)
+        prof.lap("mutation")
+        if self.duplicates != "keep":
+            replaced = self._dedupe_rows(children, self.genes[elite])
+            mutated = [(row, operator) for row, operator in mutated if row not in replaced]
+            prof.lap("deduplication")
+        prof.count("individuals_created", n_children)
+        if self._local_search is not None and self.local_search_targets != "elites":
+            child_conflicts, child_fitness = self._improve_children(children, mutated, parent1, parent2, cross)
+        else:
+            child_conflicts, child_fitness = self._score(children)
+            prof.lap("evaluation")
+            self._credit_rows(mutated, parent1, parent2, cross, child_fitness)
+        self.genes = np.concatenate((self.genes[elite], children))
+        self.fitness = np.concatenate((self.fitness[elite], child_fitness))
+        self.conflicts = np.concatenate((self.conflicts[elite], child_conflicts))
+        prof.lap("copy")
+        if self._local_search is not None and self.local_search_targets != "offspring":
+            self._improve_rows(range(n_elite))
+        prof.lap("local_search")
+        return self.fitness, int(self.conflicts.min())
+
+    def _steady_state_generation(self) -> Tuple[np.ndarray, int]:
+        """
+        Run one generation's worth of steady-state steps on the population array.
+
+        Every step breeds offspring_per_step children into a preallocated buffer,
+        scores them and writes them over the worst rows, so no population-sized
+        array is allocated.
+
+        Returns:
+            A tuple (fitness of every row, fewest conflicts of any row).
+        """
+        prof = self._profiler
+        remaining = self.pop_size - self.elitism_size
+        while remaining > 0:
+            n = min(self.offspring_per_step, remaining)
+            children = self._child_buffer[:n]
+            parent1 = self._select_rows(n)
+            parent2 = self._select_rows(n)
+            prof.lap("selection")
+            cross = self._rng.random(n) < self.crossover_prob
+            from_p1 = crossover_masks(self.crossover, self.shape, self._rng, n)
+            from_p1[~cross] = True
+            np.take(self.genes, parent1, axis=0, out=children)
+            for i in np.flatnonzero(cross):
+                np.copyto(children[i], self.genes[parent2[i]], where=~from_p1[i, :, :, None])
+            self._repair_rows(children, from_p1)
+            prof.lap("crossover")
+            mutated = self._mutate_rows(children)
+            prof.lap("mutation")
+            if self.duplicates != "keep":
+                replaced = self._dedupe_rows(children, self.genes)
+                mutated = [(row, operator) for row, operator in mutated if row not in replaced]
+                prof.lap("deduplication")
+            prof.count("individuals_created", n)
+            if self._local_search is not None and self.local_search_targets == "offspring":
+                child_conflicts, child_fitness = self._improve_children(children, mutated, parent1, parent2, cross)
+            else:
+                child_conflicts, child_fitness = self._score(children)
+                prof.lap("evaluation")
+                self._credit_rows(mutated, parent1, parent2, cross, child_fitness)
+            worst = np.argpartition(self.fitness, n - 1)[:n] if n < len(self.fitness) else np.arange(n)
+            self.genes[worst] = children
+            self.fitness[worst] = child_fitness
+            self.conflicts[worst] = child_conflicts
+            prof.lap("replacement")
+            remaining -= n
+        if self._local_search is not None and self.local_search_targets != "offspring":
+            if self.local_search_targets == "all":
+                self._improve_rows(range(len(self.genes)))
+            else:
+                self._improve_rows(np.argsort(-self.fitness, kind="stable")[:self.elitism_size])
+            prof.lap("local_search")
+        return self.fitness, int(self.conflicts.min())
+
+    def _improve_children(self, children: np.ndarray, mutated: List[Tuple[int, str]], parent1: np.ndarray,
+                          parent2: np.ndarray, cross: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score child rows through the local search, improving them in place.
+
+        Mutated children are scored first, so their operators are credited for the
+        children as bred. The search scores every other child as it starts, which
+        stands in for its evaluation and is counted as one, as in ScheduleGA._improve.
+
+        Args:
+            children: child rows.
+            mutated, parent1, parent2, cross: as for _credit_rows.
+        Returns:
+            A tuple (conflicts, fitness) of the improved children.
+        """
+        conflicts = np.zeros(len(children), dtype=np.int64)
+        fitness = np.zeros(len(children), dtype=np.float64)
+        scored = np.zeros(len(children), dtype=bool)
+        if mutated:
+            rows = [row for row, _ in mutated]
+            conflicts[rows], fitness[rows] = self._score(children[rows])
+            scored[rows] = True
+            self._profiler.lap("evaluation")
+            self._credit_rows(mutated, parent1, parent2, cross, fitness)
+        for row in range(len(children)):
+            if scored[row] and not conflicts[row]:
+                continue
+            if not scored[row]:
+                self.evaluations += 1
+            result = self._local_search.improve(children[row])
+            conflicts[row], fitness[row] = result.conflicts, result.fitness
+        self._profiler.lap("local_search")
+        return conflicts, fitness
+
+    def _improve_rows(self, rows: Iterable[int]):
+        """
+        Run the local search in place on the given rows of the population. Their
+        scores are already known, so the search adds no evaluations.
+        """
+        for row in rows:
+            if self.conflicts[row]:
+                result = self._local_search.improve(self.genes[row])
+                self.conflicts[row], self.fitness[row] = result.conflicts, result.fitness
+
+    def immigrate(self, migrants: List[Individual]):
+        """
+        Replace the worst rows of the population with incoming migrants.
+        """
+        if not migrants:
+            return
+        incoming = np.stack([self._as_genome(m).genes for m in migrants])
+        worst = np.argsort(self.fitness, kind="stable")[:len(incoming)]
+        self.genes[worst] = incoming[:len(worst)]
+        self.conflicts[worst], self.fitness[worst] = self._score(incoming[:len(worst)])
+
+    def _as_genome(self, sched: Individual) -> ScheduleGenome:
+        # migrants may arrive as schedules or genomes
+        if isinstance(sched, ScheduleGenome):
+            return sched
+        return ScheduleGenome.from_schedule(sched, self.catalog)
+
+    def _unique_genomes(self) -> int:
+        return len(np.unique(self.genes.reshape(len(self.genes), -1), axis=0))
+
+    def _params(self) -> Dict[str, Any]:
+        params = super()._params()
+        del params["use_genome"]
+        return params
+
+    def _population_genes(self) -> np.ndarray:
+        return self.genes
+
+    def _restore_population(self, genes: np.ndarray):
+        # a real copy: checkpoint arrays may be memory-mapped from the file that the
+        # next save_checkpoint replaces
+        self.genes = np.array(genes)
+        self.conflicts, self.fitness = self._score(self.genes)
+
+    def _rng_state(self) -> Dict[str, Any]:
+        return {**super()._rng_state(), "numpy": self._rng.bit_generator.state}
+
+    def _set_rng_state(self, state: Dict[str, Any]):
+        super()._set_rng_state(state)
+        self._rng.bit_generator.state = state["numpy"]
+
+    def export_best(self) -> WeeklySchedule:
+        """
+        Export the best row of the population as a WeeklySchedule.
+        """
+        genome = ScheduleGenome(self.catalog, self.genes[int(np.argmax(self.fitness))].copy(), self.shape)
+        sched = genome.to_schedule()
+        sched.cached_evaluation = genome.evaluate()
+        return sched
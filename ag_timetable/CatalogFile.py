@@ -0,0 +1,103 @@
+import csv
+import json
+import os
+import sys
+from typing import IO, Any, Iterator, List, Optional
+
+from ag_timetable.CourseSubject import CourseSubject
+
+FIELDS = ("term", "subject_name", "instructor", "lecture_count")
+FORMATS = ("csv", "json", "jsonl")
+
+
+def catalog_format(path: str) -> str:
+    """
+    Guess a catalog's format from its file extension (".csv", ".json", ".jsonl"/".ndjson").
+
+    Raises:
+        ValueError: if the extension is not recognised.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".ndjson":
+        return "jsonl"
+    if ext.lstrip(".") in FORMATS:
+        return ext.lstrip(".")
+    raise ValueError(f"Cannot tell the catalog format of '{path}'; use a .csv, .json or .jsonl file.")
+
+
+def _subject(record: Any, where: str) -> CourseSubject:
+    # a record is either a {field: value} object or a [term, name, instructor, lectures] row
+    if isinstance(record, dict):
+        missing = [f for f in FIELDS if f not in record]
+        if missing:
+            raise ValueError(f"{where}: missing field(s) {', '.join(missing)}.")
+        record = [record[f] for f in FIELDS]
+    if not isinstance(record, (list, tuple)) or len(record) != len(FIELDS):
+        raise ValueError(f"{where}: expected the fields {', '.join(FIELDS)}.")
+    term, name, instructor, lectures = record
+    try:
+        term, lectures = int(term), int(lectures)
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: term and lecture_count must be integers.") from None
+    if term < 1 or lectures < 1:
+        raise ValueError(f"{where}: term and lecture_count must be at least 1.")
+    return CourseSubject(term, str(name).strip(), str(instructor).strip(), lectures)
+
+
+def iter_catalog(source: IO[str], fmt: str) -> Iterator[CourseSubject]:
+    """
+    Read course subjects from an open text stream, one record at a time.
+
+    CSV files need a header naming the columns term, subject_name, instructor and
+    lecture_count (extra columns are ignored). JSON Lines files hold one subject per
+    line; JSON files hold an array. JSON records may be objects with those keys or
+    [term, subject_name, instructor, lecture_count] arrays, as in checkpoints.
+
+    Args:
+        source: text stream to read (a file or sys.stdin).
+        fmt: "csv", "json" or "jsonl".
+    Yields:
+        The CourseSubject of every record, in file order.
+    Raises:
+        ValueError: if the format is unknown or a record is invalid (the message
+            names the offending line or array index).
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(source)
+        for record in reader:
+            yield _subject(record, f"line {reader.line_num}")
+    elif fmt == "jsonl":
+        for number, line in enumerate(source, start=1):
+            if line.strip():
+                yield _subject(json.loads(line), f"line {number}")
+    elif fmt == "json":
+        records = json.load(source)
+        if not isinstance(records, list):
+            raise ValueError("A JSON catalog must be an array of subjects.")
+        for index, record in enumerate(records):
+            yield _subject(record, f"subject {index}")
+    else:
+        raise ValueError(f"Unknown catalog format '{fmt}'.")
+
+
+def load_catalog(path: str, fmt: Optional[str] = None) -> List[CourseSubject]:
+    """
+    Read a whole course catalog from a file, or from standard input when path is "-".
+
+    Args:
+        path: catalog file, or "-" for stdin.
+        fmt: "csv", "json" or "jsonl"; guessed from the extension when omitted (stdin
+            defaults to CSV).
+    Returns:
+        The list of CourseSubject.
+    Raises:
+        ValueError: if the format is unknown, a record is invalid or the file is empty.
+    """
+    if path == "-":
+        subjects = list(iter_catalog(sys.stdin, fmt or "csv"))
+    else:
+        with open(path, newline="", encoding="utf-8") as fh:
+            subjects = list(iter_catalog(fh, fmt or catalog_format(path)))
+    if not subjects:
+        raise ValueError(f"Catalog '{path}' has no subjects.")
+    return subjects
@@ -0,0 +1,82 @@
+import json
+import os
+import struct
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+MAGIC = b"AGTCKPT1"
+ALIGNMENT = 64
+
+
+def write_checkpoint(path: str, header: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+    """
+    Write a checkpoint file: magic, JSON header, then raw array blocks.
+
+    Layout: 8-byte magic, little-endian uint32 header length, UTF-8 JSON header, and
+    each array as raw C-ordered bytes starting at a 64-byte aligned offset recorded
+    in the header, so large blocks can be memory-mapped on load. The file is written
+    to a temporary name and moved into place, so a crash never leaves a torn checkpoint.
+
+    Args:
+        path: destination file.
+        header: JSON-serializable metadata.
+        arrays: named arrays to store after the header.
+    """
+    layout = {}
+    for name, arr in arrays.items():
+        layout[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": 0}
+    # offsets depend on the header size, which depends on the offsets; iterate until stable
+    while True:
+        blob = json.dumps({**header, "arrays": layout}).encode("utf-8")
+        offset = _align(len(MAGIC) + 4 + len(blob))
+        changed = False
+        for name, arr in arrays.items():
+            changed |= layout[name]["offset"] != offset
+            layout[name]["offset"] = offset
+            offset = _align(offset + arr.nbytes)
+        if not changed:
+            break
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(struct.pack("<I", len(blob)))
+        fh.write(blob)
+        for name, arr in arrays.items():
+            fh.seek(layout[name]["offset"])
+            fh.write(np.ascontiguousarray(arr).tobytes())
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: str, mmap: bool = True) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Read a checkpoint written by write_checkpoint.
+
+    Args:
+        path: checkpoint file.
+        mmap: map array blocks copy-on-write instead of reading them into memory.
+    Returns:
+        A tuple (header, arrays).
+    Raises:
+        ValueError: if the file is not a checkpoint.
+    """
+    with open(path, "rb") as fh:
+        if fh.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' is not a schedule GA checkpoint.")
+        (size,) = struct.unpack("<I", fh.read(4))
+        header = json.loads(fh.read(size).decode("utf-8"))
+        arrays = {}
+        for name, spec in header.pop("arrays").items():
+            dtype, shape = np.dtype(spec["dtype"]), tuple(spec["shape"])
+            count = int(np.prod(shape))
+            if mmap and count:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="c", offset=spec["offset"], shape=shape)
+            else:
+                fh.seek(spec["offset"])
+                arrays[name] = np.frombuffer(fh.read(count * dtype.itemsize), dtype=dtype).reshape(shape).copy()
+    return header, arrays
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
@@ -3,9 +3,15 @@ from typing import Optional
 
 from ag_timetable.CourseSubject import CourseSubject
 
-@dataclass
+@dataclass(slots=True)
 class ClassSlot:
     term: int                  # 1 to 6 (period/semester)
     day: int                   # 1 to 5 (Monday to Friday)
     slot: int                  # 1 to 4 (class period in the day)
-    subject: Optional[CourseSubject] = None  # Will be assigned later
+    subject: Optional[CourseSubject] = None  # Will be assigned later; shared, never copied
+
+    def copy(self) -> "ClassSlot":
+        """
+        Return a new slot at the same position holding the same (shared) subject.
+        """
+        return ClassSlot(self.term, self.day, self.slot, self.subject)
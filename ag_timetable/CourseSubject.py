@@ -1,8 +1,41 @@
+import sys
 from dataclasses import dataclass
+from weakref import WeakValueDictionary
 
-@dataclass
+# live subjects by field values; entries disappear once no schedule or catalog refers to them
+_interned: "WeakValueDictionary[tuple, CourseSubject]" = WeakValueDictionary()
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class CourseSubject:
+    """
+    Immutable subject record, interned: constructing a subject equal to a live one
+    returns that same object, so every schedule shares one instance per subject
+    and copying a schedule never copies its subjects.
+    """
     term: int               # ex: 1st or 2nd semester
     subject_name: str       # ex: "Algorithms"
     instructor: str         # ex: "Ernani Borges"
     lecture_count: int      # number of scheduled classes
+
+    def __new__(cls, term: int, subject_name: str, instructor: str, lecture_count: int):
+        key = (term, subject_name, instructor, lecture_count)
+        subject = _interned.get(key)
+        if subject is None:
+            subject = object.__new__(cls)
+            _interned[key] = subject
+        return subject
+
+    def __post_init__(self):
+        # names repeat across subjects (an instructor teaches several), so share the strings too
+        object.__setattr__(self, "subject_name", sys.intern(self.subject_name))
+        object.__setattr__(self, "instructor", sys.intern(self.instructor))
+
+    def __reduce__(self):
+        # rebuild through the constructor so unpickled subjects are interned in the receiving process
+        return CourseSubject, (self.term, self.subject_name, self.instructor, self.lecture_count)
+
+    def __copy__(self) -> "CourseSubject":
+        return self
+
+    def __deepcopy__(self, memo) -> "CourseSubject":
+        return self
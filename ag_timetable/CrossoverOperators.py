@@ -0,0 +1,111 @@
+import random
+from collections import Counter
+from typing import Dict, List, MutableSequence
+
+import numpy as np
+
+from ag_timetable.GridShape import GridShape
+from ag_timetable.OperatorNames import CROSSOVER_OPERATORS
+from ag_timetable.SubjectCatalog import SubjectCatalog
+
+# CROSSOVER_OPERATORS:
+# one_point:    terms up to a random cut come from the first parent, the rest from the second
+# two_point:    terms between two random cuts come from the second parent
+# uniform_term: every term comes from either parent with equal probability
+# day:          every (term, day) block comes from either parent; terms mixing both are repaired
+
+
+def crossover_mask(name: str, shape: GridShape, rng: random.Random) -> np.ndarray:
+    """
+    Draw which parent each (term, day) block of a child is copied from.
+
+    Args:
+        name: crossover operator (see CROSSOVER_OPERATORS).
+        shape: grid dimensions.
+        rng: random generator to draw from.
+    Returns:
+        A (terms, days) boolean array, True where the block comes from the first parent.
+        With a single term, one_point and two_point copy the first parent.
+    """
+    terms, days = shape.terms, shape.days
+    if name == "day":
+        return np.array([rng.random() < 0.5 for _ in range(terms * days)]).reshape(terms, days)
+    if name == "uniform_term":
+        from_first = np.array([rng.random() < 0.5 for _ in range(terms)])
+    elif name == "two_point" and terms > 2:
+        low, high = sorted(rng.sample(range(1, terms), 2))
+        from_first = np.ones(terms, dtype=bool)
+        from_first[low:high] = False
+    elif terms > 1:
+        from_first = np.arange(terms) < rng.randint(1, terms - 1)
+    else:
+        # a single term cannot be cut, so the child copies the first parent
+        from_first = np.ones(terms, dtype=bool)
+    return np.repeat(from_first[:, None], days, axis=1)
+
+
+def crossover_masks(name: str, shape: GridShape, rng: np.random.Generator, n: int) -> np.ndarray:
+    """
+    Vectorized crossover_mask for n children at once, drawn from a NumPy generator.
+
+    Returns:
+        An (n, terms, days) boolean array, True where a block comes from the first parent.
+    """
+    terms, days = shape.terms, shape.days
+    if name == "day":
+        return rng.random((n, terms, days)) < 0.5
+    if name == "uniform_term":
+        from_first = rng.random((n, terms)) < 0.5
+    elif name == "two_point" and terms > 2:
+        first = rng.integers(1, terms, n)
+        second = rng.integers(1, terms - 1, n)
+        second += second >= first
+        low, high = np.minimum(first, second), np.maximum(first, second)
+        index = np.arange(terms)[None, :]
+        from_first = (index < low[:, None]) | (index >= high[:, None])
+    elif terms > 1:
+        from_first = np.arange(terms)[None, :] < rng.integers(1, terms, n)[:, None]
+    else:
+        from_first = np.ones((n, terms), dtype=bool)
+    return np.repeat(from_first[:, :, None], days, axis=2)
+
+
+def term_lectures(catalog: SubjectCatalog, shape: GridShape) -> List[Dict[int, int]]:
+    """
+    Return, per term (0-based), how many cells each subject id fills, 0 being the empty cells.
+    """
+    lectures = []
+    for term in range(1, shape.terms + 1):
+        counts = {sid: int(catalog.lecture_count[sid]) for sid in catalog.term_subject_ids(term)}
+        counts[0] = shape.slots_per_term - sum(counts.values())
+        lectures.append(counts)
+    return lectures
+
+
+def repair_lectures(cells: MutableSequence, required: Dict, rng: random.Random):
+    """
+    Restore the lecture counts of one term in place after a block-level crossover.
+
+    Cells holding a subject more often than `required` says, visited in random order,
+    are overwritten with the subjects that fell short, so the cells that already
+    agree with the required counts stay untouched.
+
+    Args:
+        cells: the term's cells (subject ids, or subjects with None for empty cells).
+        required: number of cells each value must fill; the counts sum to len(cells).
+        rng: random generator to draw from.
+    """
+    order = list(range(len(cells)))
+    rng.shuffle(order)
+    counts = Counter()
+    surplus = []
+    for i in order:
+        counts[cells[i]] += 1
+        if counts[cells[i]] > required.get(cells[i], 0):
+            surplus.append(i)
+    if not surplus:
+        return
+    missing = [value for value, count in required.items() for _ in range(count - counts[value])]
+    rng.shuffle(missing)
+    for i, value in zip(surplus, missing):
+        cells[i] = value
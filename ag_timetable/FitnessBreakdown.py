@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+@dataclass(frozen=True)
+class FitnessBreakdown:
+    conflicts: int             # instructor clashes across terms
+    doubles: int               # pairs of consecutive lectures of a subject
+    triples: int               # runs of three consecutive lectures
+    quadruples: int            # runs of four consecutive lectures
+    free_slots_status: int     # 1 when the "Free" lectures sit at the edges of the day
+    fitness: float             # final score used by ScheduleGA
+
+    @classmethod
+    def from_counts(cls, conflicts: int, doubles: int, triples: int, quadruples: int,
+                    free_slots_status: int) -> "FitnessBreakdown":
+        """
+        Build a breakdown and compute its score.
+
+        Fitness = (20*doubles + 30*triples + 40*quadruples) / (100 * conflicts),
+        with the denominator floored at 1 for conflict-free schedules.
+        """
+        fitness = (20 * doubles + 30 * triples + 40 * quadruples) / max(1, 100 * conflicts)
+        return cls(conflicts, doubles, triples, quadruples, free_slots_status, fitness)
+
+
+def free_slots_status(free_slots: List[Tuple[int, int]], slots_per_day: int = 4) -> int:
+    """
+    Rate the placement of the first two "Free" lectures, given as (day, slot) pairs.
+
+    Returns 1 when they open or close a day (the first and last slot, on any days) or
+    form a block at the start or end of the same day (slots 1-2 or the last two),
+    otherwise 0.
+    """
+    if len(free_slots) < 2:
+        return 0
+    (day1, slot1), (day2, slot2) = free_slots[0], free_slots[1]
+    pair = {slot1, slot2}
+    last = slots_per_day
+    if pair == {1, last}:
+        return 1
+    if day1 == day2 and pair in ({1, 2}, {last - 1, last}):
+        return 1
+    return 0
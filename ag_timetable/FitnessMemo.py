@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class FitnessMemo:
+    """
+    Bounded least-recently-used map from a genome's bytes to its evaluation.
+
+    The key is the canonical genome encoding (ScheduleGenome.to_bytes(), the raw
+    int16 gene array), so two individuals share an entry exactly when they hold the
+    same subjects in the same slots, whatever their representation. ScheduleGA keeps
+    one memo for the whole run, so elites, unchanged copies and children that
+    recreate an earlier genome are not scored again in later generations.
+
+    Attributes:
+        maxsize (int): Maximum number of entries; the least recently used one is
+            dropped when a new entry would exceed it.
+        hits (int): Lookups answered from the memo.
+        misses (int): Lookups that found nothing.
+    """
+    def __init__(self, maxsize: int):
+        """
+        Create an empty memo.
+
+        Raises:
+            ValueError: if maxsize is below 1.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Memo size must be at least 1, got {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        Return the evaluation stored for a genome, or None, and mark it as recently used.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: bytes, value: Any):
+        """
+        Store the evaluation of a genome, evicting the least recently used entry if full.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
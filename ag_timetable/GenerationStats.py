@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(frozen=True)
+class GenerationStats:
+    generation: int        # index of the generation that just finished
+    best: float            # best fitness in the population
+    mean: float            # mean fitness
+    worst: float           # worst fitness
+    diversity: float       # distinct fitness values / population size (1.0 = all different)
+    unique_genomes: Optional[float]  # distinct genomes / population size; None unless genome_diversity
+    min_conflicts: int     # fewest conflicts of any individual
+    evaluations: int       # fitness evaluations spent in this generation
+    elapsed: float         # seconds since the run started
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+@dataclass(frozen=True)
+class GridShape:
+    """
+    Dimensions of the weekly timetable grid.
+
+    Slots are laid out term-major (term, then day, then slot), both in
+    WeeklySchedule.slots and in a flattened ScheduleGenome, so the position of any
+    (term, day, slot) is plain index arithmetic instead of a search.
+
+    Attributes:
+        terms (int): Number of terms (periods) scheduled side by side.
+        days (int): Teaching days per week.
+        slots_per_day (int): Lecture slots per day.
+    """
+    terms: int = 6
+    days: int = 5
+    slots_per_day: int = 4
+
+    def __post_init__(self):
+        if min(self.terms, self.days, self.slots_per_day) < 1:
+            raise ValueError(f"Invalid grid shape {self.dims}: every dimension must be at least 1.")
+
+    @property
+    def dims(self) -> Tuple[int, int, int]:
+        """
+        The (terms, days, slots_per_day) tuple, i.e. the shape of a genome array.
+        """
+        return self.terms, self.days, self.slots_per_day
+
+    @property
+    def slots_per_term(self) -> int:
+        return self.days * self.slots_per_day
+
+    @property
+    def size(self) -> int:
+        return self.terms * self.slots_per_term
+
+    def index(self, term: int, day: int, slot: int) -> int:
+        """
+        Return the flat position of a 1-based (term, day, slot).
+        """
+        return ((term - 1) * self.days + day - 1) * self.slots_per_day + slot - 1
+
+    def position(self, index: int) -> Tuple[int, int, int]:
+        """
+        Return the 1-based (term, day, slot) at a flat position; inverse of index().
+        """
+        term, rest = divmod(index, self.slots_per_term)
+        day, slot = divmod(rest, self.slots_per_day)
+        return term + 1, day + 1, slot + 1
+
+    def term_slice(self, term: int) -> slice:
+        """
+        Return the slice of flat positions that belong to a 1-based term.
+        """
+        start = (term - 1) * self.slots_per_term
+        return slice(start, start + self.slots_per_term)
@@ -0,0 +1,212 @@
+import multiprocessing
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.GridShape import GridShape
+from ag_timetable.ScheduleGA import ScheduleGA
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.Seeding import derive_seeds, resolve_seed
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+
+def _island_worker(conn, params: Dict[str, Any]):
+    """
+    Process entry point: own one ScheduleGA and serve evolve/migrate requests.
+
+    Each request is (generations, incoming migrant blobs, number of emigrants) and is
+    answered with (outgoing migrant blobs, stop reason). A None request ends the island
+    and is answered with (best genome blob, history).
+    """
+    ga = ScheduleGA(**params)
+    while True:
+        request = conn.recv()
+        if request is None:
+            best = max(ga.population, key=ga._fitness)
+            conn.send((ga.encode(best), ga.export_history()))
+            break
+        generations, incoming, n_out = request
+        ga.immigrate([ga.decode(blob) for blob in incoming])
+        ga.evolve(generations)
+        ranked = sorted(ga.population, key=ga._fitness, reverse=True)
+        conn.send(([ga.encode(ind) for ind in ranked[:n_out]], ga.stop_reason))
+    conn.close()
+
+
+class IslandGA:
+    """
+    Island-model driver running several ScheduleGA populations in separate processes.
+
+    Every `migration_interval` generations each island sends copies of its best
+    `migration_size` individuals to a neighbour, where they replace the worst ones.
+    Stopping criteria in the ScheduleGA arguments apply per island: a stopped island
+    stays idle, and the whole run ends when every island has stopped or any island
+    reaches target_fitness/target_conflicts.
+
+    Attributes:
+        subjects (List[CourseSubject]): List of course subjects to schedule.
+        islands (int): Number of islands (processes).
+        generations (int): Total number of generations per island.
+        migration_interval (int): Generations between migrations.
+        migration_size (int): Individuals sent by each island per migration.
+        topology (str): "ring" (island i sends to i+1) or "random" (any other island).
+        island_params (List[Dict[str, Any]]): ScheduleGA arguments used by each island.
+        history_gens (List[int]): Generation indices recorded during evolution.
+        history_best (List[float]): Best fitness across all islands per generation.
+        island_histories (List[Tuple[List[int], List[float]]]): History of each island.
+        best (Optional[ScheduleGenome]): Best genome found on any island after run().
+        stop_reason (Optional[str]): Why the run stopped, using ScheduleGA's reasons.
+        shape (GridShape): Grid dimensions shared by every island.
+        seed (int): Master seed; each island's GA and the migration topology get their
+            own stream derived from it.
+    """
+    def __init__(
+        self,
+        subjects: List[CourseSubject],
+        islands: int = 4,
+        generations: int = 100,
+        migration_interval: int = 10,
+        migration_size: int = 2,
+        topology: str = "ring",
+        island_overrides: Optional[List[Dict[str, Any]]] = None,
+        seed: Optional[int] = None,
+        **ga_params
+    ):
+        """
+        Configure the islands.
+
+        Args:
+            subjects: list of CourseSubject instances to schedule.
+            islands: number of independent populations.
+            generations: number of generations each island evolves.
+            migration_interval: generations between migrations.
+            migration_size: number of top individuals each island sends per migration.
+            topology: "ring" or "random".
+            island_overrides: optional per-island dicts of ScheduleGA arguments
+                (e.g. different use_tournament or crossover_prob) applied on top of ga_params.
+            seed: master seed. Island i runs with the i-th seed derived from it (an
+                override may still set its own), so a run is reproducible and the
+                islands never share random state. Drawn from the global random module
+                if omitted.
+            ga_params: ScheduleGA arguments shared by every island (pop_size, use_genome, ...).
+
+        Raises:
+            ValueError: for an unknown topology, overrides that do not match the
+                islands, or workers above 1 in ga_params or an override (each island
+                already has its own process and evolves without a worker pool).
+        """
+        if topology not in ("ring", "random"):
+            raise ValueError(f"Unknown migration topology '{topology}'.")
+        if island_overrides is not None and len(island_overrides) != islands:
+            raise ValueError("island_overrides must have one entry per island.")
+        self.subjects = subjects
+        self.islands = islands
+        self.generations = generations
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.seed = resolve_seed(seed)
+        # one stream per island plus one for the migration topology
+        seeds = derive_seeds(self.seed, islands + 1)
+        self._rng = random.Random(seeds[-1])
+        overrides = island_overrides or [{} for _ in range(islands)]
+        self.island_params: List[Dict[str, Any]] = [
+            {**ga_params, "seed": island_seed, **override, "subjects": subjects, "generations": generations}
+            for override, island_seed in zip(overrides, seeds)
+        ]
+        if any(params.get("workers", 1) > 1 for params in self.island_params):
+            raise ValueError("IslandGA runs each island in its own process; workers must be 1.")
+        self.catalog = SubjectCatalog(subjects)
+        self.shape = ga_params.get("shape") or GridShape()
+        self.history_gens: List[int] = []
+        self.history_best: List[float] = []
+        self.island_histories: List[Tuple[List[int], List[float]]] = []
+        self.best: Optional[ScheduleGenome] = None
+        self.stop_reason: Optional[str] = None
+
+    def _destinations(self) -> List[int]:
+        # destination island for each source island
+        if self.topology == "ring" or self.islands < 2:
+            return [(i + 1) % self.islands for i in range(self.islands)]
+        return [self._rng.choice([j for j in range(self.islands) if j != i]) for i in range(self.islands)]
+
+    def run(self) -> WeeklySchedule:
+        """
+        Evolve all islands with periodic migration.
+
+        Returns:
+            The best WeeklySchedule found on any island.
+        """
+        ctx = multiprocessing.get_context("spawn")
+        conns, procs = [], []
+        for params in self.island_params:
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(target=_island_worker, args=(child_conn, params), daemon=True)
+            proc.start()
+            child_conn.close()
+            conns.append(parent_conn)
+            procs.append(proc)
+
+        try:
+            inboxes: List[List[bytes]] = [[] for _ in range(self.islands)]
+            stopped: List[Optional[str]] = [None] * self.islands
+            self.stop_reason = "generations"
+            done = 0
+            while done < self.generations:
+                steps = min(self.migration_interval, self.generations - done)
+                done += steps
+                n_out = self.migration_size if done < self.generations else 0
+                for conn, inbox, reason in zip(conns, inboxes, stopped):
+                    conn.send((0 if reason else steps, inbox, n_out))
+                replies = [conn.recv() for conn in conns]
+                inboxes = [[] for _ in range(self.islands)]
+                for src, dst in enumerate(self._destinations()):
+                    inboxes[dst].extend(replies[src][0])
+                for i, (_, reason) in enumerate(replies):
+                    if stopped[i] is None and reason != "generations":
+                        stopped[i] = reason
+                targets = [r for r in stopped if r in ("target_fitness", "target_conflicts")]
+                if targets or all(stopped):
+                    self.stop_reason = targets[0] if targets else stopped[0]
+                    break
+
+            for conn in conns:
+                conn.send(None)
+            finals = [conn.recv() for conn in conns]
+        finally:
+            for conn in conns:
+                conn.close()
+            for proc in procs:
+                proc.join()
+
+        self.island_histories = [history for _, history in finals]
+        # islands may have stopped at different generations; a stopped island keeps its last best
+        length = max(len(gens) for gens, _ in self.island_histories)
+        self.history_gens = list(range(length))
+        self.history_best = [max(best[min(i, len(best) - 1)] for _, best in self.island_histories)
+                             for i in range(length)]
+        candidates = [ScheduleGenome.from_bytes(self.catalog, blob, self.shape) for blob, _ in finals]
+        self.best = max(candidates, key=lambda genome: genome.evaluate().fitness)
+        return self.export_best()
+
+    def export_history(self) -> Tuple[List[int], List[float]]:
+        """
+        Export the best fitness across all islands per generation.
+
+        Returns:
+            A tuple (generations, best_fitness_values), as ScheduleGA.export_history.
+        """
+        return self.history_gens, self.history_best
+
+    def export_island_histories(self) -> List[Tuple[List[int], List[float]]]:
+        """
+        Export each island's (generations, best_fitness_values) history.
+        """
+        return self.island_histories
+
+    def export_best(self) -> WeeklySchedule:
+        """
+        Export the best schedule found on any island.
+        """
+        return self.best.to_schedule() if self.best is not None else None
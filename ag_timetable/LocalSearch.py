@@ -0,0 +1,168 @@
+import random
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ag_timetable.FitnessBreakdown import FitnessBreakdown, free_slots_status
+from ag_timetable.GridShape import GridShape
+from ag_timetable.SubjectCatalog import SubjectCatalog
+
+METHODS = ("hill_climbing", "tabu")
+
+
+def _row_runs(row: List[int]) -> Tuple[int, int, int]:
+    # doubles, triples and quadruples among the runs of one (term, day) row of subject ids
+    doubles = triples = quadruples = 0
+    run = 1
+    for prev, cur in zip(row, row[1:]):
+        run = run + 1 if cur == prev and cur else 1
+        if run >= 2:
+            doubles += 1
+        if run >= 3:
+            triples += 1
+        if run >= 4:
+            quadruples += 1
+    return doubles, triples, quadruples
+
+
+def _score(conflicts: int, doubles: int, triples: int, quadruples: int) -> float:
+    # same formula as FitnessBreakdown.from_counts
+    return (20 * doubles + 30 * triples + 40 * quadruples) / max(1, 100 * conflicts)
+
+
+class LocalSearch:
+    """
+    Bounded local search over same-term swaps, aimed at instructor conflicts.
+
+    Every step picks a random cell whose instructor clashes with another term, scores
+    swapping it with each other cell of its term, and applies the best swap. Swaps are
+    scored incrementally: conflicts from per-timeslot instructor counters and
+    aggregations from the two (term, day) rows involved, so a step costs
+    O(slots per term) instead of a full evaluation.
+
+    "hill_climbing" only applies improving swaps. "tabu" always applies the best swap
+    that does not move a cell changed in the last `tabu_tenure` steps (unless it beats
+    the best schedule seen), and returns the best schedule visited. Both stop early
+    once no conflicts are left.
+
+    Attributes:
+        catalog (SubjectCatalog): Catalog the subject ids refer to.
+        shape (GridShape): Grid dimensions of the genomes.
+        method (str): "hill_climbing" or "tabu".
+        steps (int): Maximum number of steps per call to improve().
+        tabu_tenure (int): Steps during which a moved cell may not move again (tabu only).
+        rng (random.Random): Generator that picks the clashing cells.
+    """
+    def __init__(self, catalog: SubjectCatalog, shape: GridShape, method: str = "hill_climbing",
+                 steps: int = 20, tabu_tenure: int = 5, rng: Optional[random.Random] = None):
+        """
+        Configure the search; `rng` defaults to the global random module.
+
+        Raises:
+            ValueError: if the method is unknown.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown local search method '{method}'.")
+        self.catalog = catalog
+        self.shape = shape
+        self.method = method
+        self.steps = steps
+        self.tabu_tenure = tabu_tenure
+        self.rng = rng or random
+        self._instructor = catalog.subject_instructor.tolist()
+        self._is_free = catalog.is_free.tolist()
+
+    def improve(self, genes: np.ndarray) -> FitnessBreakdown:
+        """
+        Improve a genome's (terms, days, slots) gene array in place.
+
+        Args:
+            genes: gene array to improve; only same-term swaps are made, so every
+                subject keeps its lecture count.
+        Returns:
+            The FitnessBreakdown of the resulting genes.
+        """
+        per_day, per_term = self.shape.slots_per_day, self.shape.slots_per_term
+        instr = self._instructor
+        flat = genes.reshape(-1).tolist()
+
+        # counts[timeslot][instructor]: lectures of that instructor at that (day, slot), over all terms
+        counts = [[0] * len(self.catalog.instructors) for _ in range(per_term)]
+        for cell, sid in enumerate(flat):
+            if sid:
+                counts[cell % per_term][instr[sid]] += 1
+        conflicts = sum(n - 1 for column in counts for n in column if n > 1)
+        runs = [_row_runs(flat[start:start + per_day]) for start in range(0, len(flat), per_day)]
+        doubles, triples, quadruples = (sum(r[k] for r in runs) for k in range(3))
+
+        current = _score(conflicts, doubles, triples, quadruples)
+        # tabu may walk downhill, so it remembers the best genes visited (starting with the input)
+        tabu = self.method == "tabu"
+        best = current
+        best_state = (list(flat), (conflicts, doubles, triples, quadruples)) if tabu else None
+        tabu_until = {}
+        moved = False
+        for step in range(self.steps):
+            if conflicts == 0:
+                break
+            clashing = [cell for cell, sid in enumerate(flat) if sid and counts[cell % per_term][instr[sid]] > 1]
+            a = self.rng.choice(clashing)
+            ta, row_a = a % per_term, a // per_day
+            ia = instr[flat[a]]
+            term_start = a - ta
+
+            choice = None
+            for b in range(term_start, term_start + per_term):
+                if flat[b] == flat[a]:
+                    continue
+                tb, row_b = b % per_term, b // per_day
+                ib = instr[flat[b]]
+                # conflicts: a's instructor leaves timeslot ta and enters tb, b's the reverse
+                dc = 0
+                if ia != ib:
+                    dc -= counts[ta][ia] > 1
+                    dc += ib > 0 and counts[ta][ib] > 0
+                    dc -= ib > 0 and counts[tb][ib] > 1
+                    dc += counts[tb][ia] > 0
+                rows = (row_a,) if row_a == row_b else (row_a, row_b)
+                flat[a], flat[b] = flat[b], flat[a]
+                new_runs = [_row_runs(flat[r * per_day:(r + 1) * per_day]) for r in rows]
+                flat[a], flat[b] = flat[b], flat[a]
+                totals = (conflicts + dc,
+                          doubles + sum(n[0] - runs[r][0] for r, n in zip(rows, new_runs)),
+                          triples + sum(n[1] - runs[r][1] for r, n in zip(rows, new_runs)),
+                          quadruples + sum(n[2] - runs[r][2] for r, n in zip(rows, new_runs)))
+                fitness = _score(*totals)
+                # a move is tabu when either cell moved recently, unless it beats the best seen
+                if tabu and max(tabu_until.get(a, -1), tabu_until.get(b, -1)) >= step and fitness <= best:
+                    continue
+                if choice is None or fitness > choice[0]:
+                    choice = (fitness, b, ib, tb, rows, new_runs, totals)
+
+            if choice is None or (not tabu and choice[0] <= current):
+                continue
+            current, b, ib, tb, rows, new_runs, totals = choice
+            if ia:
+                counts[ta][ia] -= 1
+                counts[tb][ia] += 1
+            if ib:
+                counts[tb][ib] -= 1
+                counts[ta][ib] += 1
+            flat[a], flat[b] = flat[b], flat[a]
+            for r, n in zip(rows, new_runs):
+                runs[r] = n
+            conflicts, doubles, triples, quadruples = totals
+            tabu_until[a] = tabu_until[b] = step + self.tabu_tenure
+            moved = True
+            if tabu and current > best:
+                best, best_state = current, (list(flat), totals)
+
+        if tabu and best > current:
+            flat, (conflicts, doubles, triples, quadruples) = best_state
+        if moved:
+            genes[...] = np.array(flat, dtype=genes.dtype).reshape(genes.shape)
+
+        free_cells = [cell for cell, sid in enumerate(flat) if self._is_free[sid]][:2]
+        free_slots = [self.shape.position(cell)[1:] for cell in free_cells]
+        return FitnessBreakdown.from_counts(conflicts, doubles, triples, quadruples,
+                                            free_slots_status(free_slots, per_day))
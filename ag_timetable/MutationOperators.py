@@ -0,0 +1,222 @@
+import random
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ag_timetable.GridShape import GridShape
+from ag_timetable.OperatorNames import MUTATION_OPERATORS
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+OPERATORS = MUTATION_OPERATORS
+
+
+@dataclass
+class OperatorStats:
+    applications: int = 0   # times the operator was applied
+    improvements: int = 0   # applications whose child beat its parents
+    total_gain: float = 0.0  # summed fitness gain of those improvements
+
+    @property
+    def improvement_rate(self) -> float:
+        return self.improvements / self.applications if self.applications else 0.0
+
+
+class MutationOperators:
+    """
+    Term-aware mutation operators with fixed or adaptive selection probabilities.
+
+    Every operator draws its cells inside one term, so unlike the legacy mutation
+    (two cells drawn from the whole grid, applied only when they share a term) no
+    draw is wasted and lecture counts are always preserved:
+
+        swap        swap two cells of a random term
+        multi_swap  `swaps` independent single swaps
+        block       swap a run of 2 to slots_per_day consecutive cells of one day
+                    with an equally long run on another day of the same term, so
+                    contiguous lectures move together
+        conflict    swap a cell whose instructor clashes with another term with a
+                    random cell of its own term (a plain swap when nothing clashes)
+
+    Each mutation picks one operator at random. With fixed rates every operator is
+    equally likely; with adaptive rates the probabilities follow each operator's
+    recent success (probability matching): an exponential moving average of how
+    often its children beat their parents, with a floor of `min_probability`.
+    Successes are reported back by the GA through record().
+
+    Attributes:
+        operators (Tuple[str, ...]): Enabled operator names.
+        adaptive (bool): Tune the probabilities from the recorded outcomes.
+        swaps (int): Swaps made by multi_swap.
+        min_probability (float): Lowest probability an adaptive operator can reach.
+        adaptation_rate (float): Weight of the newest outcome in the moving averages.
+        probabilities (List[float]): Current probability of each operator.
+        stats (Dict[str, OperatorStats]): Applications and improvements per operator.
+    """
+    def __init__(self, catalog: SubjectCatalog, shape: GridShape, operators: Sequence[str] = OPERATORS,
+                 adaptive: bool = False, swaps: int = 3, min_probability: float = 0.05,
+                 adaptation_rate: float = 0.1, rng: Optional[random.Random] = None):
+        """
+        Configure the operators; `rng` defaults to the global random module.
+
+        Raises:
+            ValueError: if an operator is unknown or listed twice, none is given,
+                swaps is below 1, or min_probability leaves no room for adaptation.
+        """
+        unknown = [name for name in operators if name not in OPERATORS]
+        if unknown:
+            raise ValueError(f"Unknown mutation operator(s) {', '.join(unknown)}; choose from {', '.join(OPERATORS)}.")
+        if not operators or len(set(operators)) != len(operators):
+            raise ValueError("Give each mutation operator at most once, and at least one.")
+        if swaps < 1:
+            raise ValueError(f"swaps must be at least 1, got {swaps}.")
+        if not 0.0 <= min_probability * len(operators) < 1.0:
+            raise ValueError(f"min_probability {min_probability} is too high for {len(operators)} operators.")
+        self.catalog = catalog
+        self.shape = shape
+        self.operators = tuple(operators)
+        self.adaptive = adaptive
+        self.swaps = swaps
+        self.min_probability = min_probability
+        self.adaptation_rate = adaptation_rate
+        self.rng = rng or random
+        self.probabilities = [1.0 / len(self.operators)] * len(self.operators)
+        self.stats: Dict[str, OperatorStats] = {name: OperatorStats() for name in self.operators}
+        # moving average of each operator's success rate (adaptive mode); starting
+        # optimistic lets every operator prove itself before it sinks to the floor
+        self._quality = [1.0] * len(self.operators)
+
+    def choose(self) -> str:
+        """
+        Draw an operator name according to the current probabilities.
+        """
+        if len(self.operators) == 1:
+            return self.operators[0]
+        return self.rng.choices(self.operators, self.probabilities)[0]
+
+    def swap_pairs(self, name: str, genes: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Return the flat cell pairs to swap for one application of an operator.
+
+        Args:
+            name: operator name.
+            genes: the individual's genes as a flat array of subject ids (only read by
+                the conflict operator).
+        Returns:
+            Pairs of flat positions to swap in order; both cells of a pair are always
+            in the same term.
+        """
+        if name == "multi_swap":
+            return [self._single_swap() for _ in range(self.swaps)]
+        if name == "block" and self.shape.days > 1 and self.shape.slots_per_day > 1:
+            per_day = self.shape.slots_per_day
+            length = self.rng.randint(2, per_day)
+            day1, day2 = self.rng.sample(range(self.shape.days), 2)
+            start = self.rng.randrange(self.shape.terms) * self.shape.slots_per_term
+            first = start + day1 * per_day + self.rng.randint(0, per_day - length)
+            second = start + day2 * per_day + self.rng.randint(0, per_day - length)
+            return [(first + i, second + i) for i in range(length)]
+        if name == "conflict":
+            clashing = self._clashing_cells(genes)
+            if len(clashing):
+                cell = int(clashing[self.rng.randrange(len(clashing))])
+                per_term = self.shape.slots_per_term
+                start = cell - cell % per_term
+                other = self.rng.randrange(per_term - 1)
+                other += other >= cell - start
+                return [(cell, start + other)]
+        return [self._single_swap()]
+
+    def _single_swap(self) -> Tuple[int, int]:
+        per_term = self.shape.slots_per_term
+        start = self.rng.randrange(self.shape.terms) * per_term
+        a, b = self.rng.sample(range(per_term), 2)
+        return start + a, start + b
+
+    def _clashing_cells(self, genes: np.ndarray) -> np.ndarray:
+        # flat positions whose instructor also teaches another term at the same (day, slot)
+        grid = genes.reshape(self.shape.terms, -1)
+        instructors = self.catalog.subject_instructor[grid]
+        busy = grid != 0
+        same = (instructors[:, None, :] == instructors[None, :, :]) & busy[:, None, :] & busy[None, :, :]
+        return np.flatnonzero(same.sum(axis=1) > 1)
+
+    def mutate(self, individual) -> str:
+        """
+        Mutate a ScheduleGenome or WeeklySchedule in place with a randomly chosen operator.
+
+        Returns:
+            The name of the operator applied.
+        """
+        name = self.choose()
+        if isinstance(individual, ScheduleGenome):
+            self.mutate_genes(individual.genes.reshape(-1), name)
+            individual.cached_evaluation = None
+            return name
+        sched: WeeklySchedule = individual
+        genes = None
+        if name == "conflict":
+            genes = np.array([self.catalog.subject_id(s.subject) for s in sched.slots], dtype=np.int16)
+        for a, b in self.swap_pairs(name, genes):
+            if sched.swap_state is not None:
+                # running totals are already built, so rescoring the swap is O(1)
+                sched.apply_swap(a, b)
+            else:
+                sched.slots[a].subject, sched.slots[b].subject = sched.slots[b].subject, sched.slots[a].subject
+        if sched.swap_state is None:
+            sched.cached_evaluation = None
+        return name
+
+    def mutate_genes(self, flat: np.ndarray, name: Optional[str] = None) -> str:
+        """
+        Mutate a flat gene array in place (e.g. a row of BatchedScheduleGA.genes).
+
+        Returns:
+            The name of the operator applied.
+        """
+        name = name or self.choose()
+        for a, b in self.swap_pairs(name, flat):
+            flat[a], flat[b] = flat[b], flat[a]
+        return name
+
+    def record(self, name: str, baseline: float, fitness: float):
+        """
+        Report the outcome of one mutation: the child's fitness against its parents'.
+
+        Updates the operator's statistics and, in adaptive mode, the probabilities.
+        """
+        stats = self.stats[name]
+        stats.applications += 1
+        improved = fitness > baseline
+        if improved:
+            stats.improvements += 1
+            stats.total_gain += fitness - baseline
+        if not self.adaptive:
+            return
+        k = self.operators.index(name)
+        self._quality[k] += self.adaptation_rate * (improved - self._quality[k])
+        total = sum(self._quality)
+        spread = 1.0 - len(self.operators) * self.min_probability
+        self.probabilities = [self.min_probability + spread * (q / total if total else 1.0 / len(self.operators))
+                              for q in self._quality]
+
+    def export_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return each operator's applications, improvements, improvement rate, total
+        gain and current probability.
+        """
+        return {name: {**asdict(self.stats[name]), "improvement_rate": self.stats[name].improvement_rate,
+                       "probability": p}
+                for name, p in zip(self.operators, self.probabilities)}
+
+    def get_state(self) -> Dict[str, Any]:
+        # adaptive state and statistics, for checkpoints
+        return {"probabilities": self.probabilities, "quality": self._quality,
+                "stats": {name: asdict(s) for name, s in self.stats.items()}}
+
+    def set_state(self, state: Dict[str, Any]):
+        self.probabilities = list(state["probabilities"])
+        self._quality = list(state["quality"])
+        self.stats = {name: OperatorStats(**values) for name, values in state["stats"].items()}
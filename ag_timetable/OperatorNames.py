@@ -0,0 +1,8 @@
+# Names of the mutation and crossover operators. This module imports nothing, so the
+# command-line parser can offer them as choices without loading NumPy and the solver.
+
+# see MutationOperators for what each operator does
+MUTATION_OPERATORS = ("swap", "multi_swap", "block", "conflict")
+
+# see CrossoverOperators for what each operator does
+CROSSOVER_OPERATORS = ("one_point", "two_point", "uniform_term", "day")
@@ -0,0 +1,98 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.FitnessBreakdown import FitnessBreakdown
+from ag_timetable.GridShape import GridShape
+from ag_timetable.ScheduleGenome import ScheduleGenome, free_slots_statuses
+from ag_timetable.SubjectCatalog import SubjectCatalog
+
+# catalog compiled once per worker process by _init_worker
+_worker_catalog: Optional[SubjectCatalog] = None
+_worker_shape: Optional[GridShape] = None
+
+
+def _init_worker(subjects: List[CourseSubject], shape: GridShape):
+    global _worker_catalog, _worker_shape
+    _worker_catalog = SubjectCatalog(subjects)
+    _worker_shape = shape
+
+
+def _evaluate_batch(blob: bytes) -> List[Tuple[int, int, int, int, int]]:
+    # blob is a run of concatenated int16 genomes, scored in one batched pass; answer with plain count tuples
+    genes = np.frombuffer(blob, dtype=np.int16).reshape((-1,) + _worker_shape.dims)
+    counts = ScheduleGenome.evaluate_population(_worker_catalog, genes)[:4] + \
+        (free_slots_statuses(_worker_catalog, genes),)
+    return list(zip(*(c.tolist() for c in counts)))
+
+
+class ParallelEvaluator:
+    """
+    Scores batches of schedules across a pool of worker processes.
+
+    Schedules cross the process boundary as raw int16 genome bytes (240 bytes each
+    for the default grid) and results come back as tuples of counts; the subject
+    catalog is shipped once per worker when the pool starts.
+
+    Attributes:
+        catalog (SubjectCatalog): Catalog used to encode schedules as genomes.
+        workers (int): Number of worker processes.
+        shape (GridShape): Grid dimensions of the schedules being scored.
+    """
+    def __init__(self, catalog: SubjectCatalog, workers: int, shape: Optional[GridShape] = None):
+        """
+        Start the worker pool.
+
+        Args:
+            catalog: SubjectCatalog of the subjects being scheduled.
+            workers: number of worker processes to start.
+            shape: grid dimensions (default grid if omitted).
+        """
+        self.catalog = catalog
+        self.workers = workers
+        self.shape = shape or GridShape()
+        # spawn keeps workers independent of the parent's threads (e.g. the Tk GUI)
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(catalog.subjects, self.shape),
+        )
+
+    def _encode(self, sched) -> bytes:
+        if not isinstance(sched, ScheduleGenome):
+            sched = ScheduleGenome.from_schedule(sched, self.catalog)
+        return sched.to_bytes()
+
+    def evaluate(self, schedules: list) -> List[FitnessBreakdown]:
+        """
+        Evaluate schedules in one batch per worker.
+
+        Args:
+            schedules: WeeklySchedule or ScheduleGenome individuals.
+        Returns:
+            One FitnessBreakdown per schedule, in input order.
+        """
+        if not schedules:
+            return []
+        chunk = -(-len(schedules) // self.workers)
+        blobs = [b"".join(self._encode(s) for s in schedules[i:i + chunk])
+                 for i in range(0, len(schedules), chunk)]
+        results = chain.from_iterable(self._pool.map(_evaluate_batch, blobs))
+        return [FitnessBreakdown.from_counts(*counts) for counts in results]
+
+    def close(self):
+        """
+        Shut the worker pool down.
+        """
+        self._pool.shutdown()
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
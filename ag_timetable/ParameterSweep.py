@@ -0,0 +1,199 @@
+import csv
+import itertools
+import json
+import multiprocessing
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ag_timetable.BatchedScheduleGA import BatchedScheduleGA
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.ScheduleGA import ScheduleGA
+from ag_timetable.Seeding import derive_seeds
+
+
+def _run_point(subjects: List[CourseSubject], params: Dict[str, Any], seed: int, batched: bool) -> Dict[str, Any]:
+    """
+    Run one GA for one parameter point and seed; module level so worker processes can call it.
+    """
+    ga_class = BatchedScheduleGA if batched else ScheduleGA
+    ga_params = {**params, "seed": seed}
+    if batched:
+        # BatchedScheduleGA always evolves genomes and sets use_genome itself
+        ga_params.pop("use_genome", None)
+    start = time.perf_counter()
+    ga = ga_class(subjects, **ga_params)
+    time_to_feasible = None
+    for stats in ga.iter_generations():
+        if time_to_feasible is None and stats.min_conflicts == 0:
+            time_to_feasible = time.perf_counter() - start
+    runtime = time.perf_counter() - start
+    best = ga.evaluate(ga.export_best())
+    return {
+        **params,
+        "seed": seed,
+        "best_fitness": best.fitness,
+        "best_conflicts": best.conflicts,
+        "time_to_feasible": time_to_feasible,
+        "runtime": runtime,
+        "generations_run": len(ga.history_gens),
+        "evaluations": ga.evaluations,
+        "stop_reason": ga.stop_reason,
+    }
+
+
+class ParameterSweep:
+    """
+    Grid or random search over ScheduleGA parameters, run across a process pool.
+
+    Every parameter point is run once per seed (seeds are shared between points, so
+    points are compared on the same random streams). Each run yields one row with the
+    point's parameters, the seed, best fitness and conflicts, time to the first
+    conflict-free individual, runtime, generations, evaluations and stop reason;
+    summary() aggregates the rows per point.
+
+    Attributes:
+        subjects (List[CourseSubject]): Course subjects to schedule.
+        space (Dict[str, Sequence]): Values to try per parameter. In random search a
+            (low, high) tuple is sampled uniformly instead (integers stay integers).
+        mode (str): "grid" (every combination) or "random" (`samples` random points).
+        samples (int): Number of points drawn in random mode.
+        seeds (int): Runs per point.
+        workers (int): Worker processes (1 runs everything in-process).
+        base_params (Dict[str, Any]): ScheduleGA arguments shared by every point.
+        batched (bool): Run BatchedScheduleGA instead of ScheduleGA.
+        seed (int): Seed of the random search; the run seeds are derived from it.
+        results (List[Dict[str, Any]]): One row per finished run.
+    """
+    def __init__(
+        self,
+        subjects: List[CourseSubject],
+        space: Dict[str, Sequence],
+        mode: str = "grid",
+        samples: int = 20,
+        seeds: int = 3,
+        workers: int = 1,
+        base_params: Optional[Dict[str, Any]] = None,
+        batched: bool = False,
+        seed: int = 0
+    ):
+        """
+        Configure the sweep.
+
+        Raises:
+            ValueError: if the mode is unknown.
+        """
+        if mode not in ("grid", "random"):
+            raise ValueError(f"Unknown sweep mode '{mode}'.")
+        self.subjects = subjects
+        self.space = space
+        self.mode = mode
+        self.samples = samples
+        self.seeds = seeds
+        self.workers = workers
+        self.base_params = dict(base_params or {})
+        self.batched = batched
+        self.seed = seed
+        self.results: List[Dict[str, Any]] = []
+
+    def points(self) -> List[Dict[str, Any]]:
+        """
+        Return the parameter points to evaluate, in a reproducible order.
+        """
+        names = list(self.space)
+        if self.mode == "grid":
+            return [dict(zip(names, values)) for values in itertools.product(*(self.space[n] for n in names))]
+        rng = random.Random(self.seed)
+        points = []
+        for _ in range(self.samples):
+            point = {}
+            for name in names:
+                values = self.space[name]
+                if isinstance(values, tuple) and len(values) == 2:
+                    low, high = values
+                    point[name] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) \
+                        else rng.uniform(low, high)
+                else:
+                    point[name] = rng.choice(list(values))
+            points.append(point)
+        return points
+
+    def run(self, progress: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Run every point with every seed.
+
+        Args:
+            progress: optional callback called with (finished runs, total runs).
+        Returns:
+            The result rows, in point then seed order.
+        """
+        run_seeds = derive_seeds(self.seed, self.seeds)
+        tasks = [({**self.base_params, **point}, run_seed)
+                 for point in self.points() for run_seed in run_seeds]
+        rows: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        if self.workers <= 1:
+            for i, (params, seed) in enumerate(tasks):
+                rows[i] = _run_point(self.subjects, params, seed, self.batched)
+                if progress:
+                    progress(i + 1, len(tasks))
+        else:
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx) as pool:
+                futures = {pool.submit(_run_point, self.subjects, params, seed, self.batched): i
+                           for i, (params, seed) in enumerate(tasks)}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    rows[futures[future]] = future.result()
+                    if progress:
+                        progress(done, len(tasks))
+        self.results = rows
+        return self.results
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate the results per parameter point, best mean fitness first.
+
+        Returns:
+            One dict per point with its parameters, runs, mean/stdev/max best fitness,
+            feasible_rate (share of runs reaching zero conflicts), mean time_to_feasible
+            over those runs and mean runtime.
+        """
+        names = list(self.space)
+        groups: Dict[Tuple, List[Dict[str, Any]]] = {}
+        for row in self.results:
+            groups.setdefault(tuple(row[n] for n in names), []).append(row)
+        table = []
+        for key, rows in groups.items():
+            fitness = [r["best_fitness"] for r in rows]
+            feasible = [r["time_to_feasible"] for r in rows if r["time_to_feasible"] is not None]
+            table.append({
+                **dict(zip(names, key)),
+                "runs": len(rows),
+                "mean_fitness": statistics.fmean(fitness),
+                "stdev_fitness": statistics.stdev(fitness) if len(fitness) > 1 else 0.0,
+                "max_fitness": max(fitness),
+                "feasible_rate": len(feasible) / len(rows),
+                "mean_time_to_feasible": statistics.fmean(feasible) if feasible else None,
+                "mean_runtime": statistics.fmean(r["runtime"] for r in rows),
+            })
+        table.sort(key=lambda r: r["mean_fitness"], reverse=True)
+        return table
+
+    def to_csv(self, path: str):
+        """
+        Write the per-run result table as CSV.
+        """
+        if not self.results:
+            return
+        with open(path, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(self.results[0]))
+            writer.writeheader()
+            writer.writerows(self.results)
+
+    def to_json(self, path: str):
+        """
+        Write the per-run results and the per-point summary as JSON.
+        """
+        with open(path, "w") as fh:
+            json.dump({"results": self.results, "summary": self.summary()}, fh, indent=2, default=str)
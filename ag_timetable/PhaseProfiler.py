@@ -0,0 +1,152 @@
+import csv
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+PHASES = ("sorting", "selection", "crossover", "copy", "mutation", "deduplication", "local_search", "evaluation",
+          "replacement", "bookkeeping")
+
+
+@dataclass(frozen=True)
+class GenerationProfile:
+    generation: int                 # index of the generation that just finished
+    seconds: Dict[str, float]       # wall-clock time spent in each phase
+    counters: Dict[str, int]        # evaluations, cache_hits, memo_hits, duplicates, individuals_created, ...
+    allocated_bytes: Optional[int]  # net growth of traced memory (None unless trace_allocations)
+    peak_bytes: Optional[int]       # peak traced memory during the generation
+
+
+class PhaseProfiler:
+    """
+    Per-phase timers and counters for ScheduleGA runs.
+
+    The GA calls lap(phase) at each phase boundary, which charges the time since the
+    previous lap to that phase, and count(name, n) for counters. Each finished
+    generation becomes a GenerationProfile that is stored, passed to the callbacks and
+    can be exported with to_json()/to_csv(). Pass an instance as ScheduleGA(profiler=...);
+    without one the GA uses a NullProfiler whose methods do nothing.
+
+    Attributes:
+        callbacks (List[Callable[[GenerationProfile], None]]): Called after every generation.
+        trace_allocations (bool): Record traced memory growth and peak per generation
+            with tracemalloc (slows the run down noticeably).
+        generations (List[GenerationProfile]): Profile of every finished generation.
+    """
+    def __init__(self, callbacks: Optional[Iterable[Callable[[GenerationProfile], None]]] = None,
+                 trace_allocations: bool = False):
+        """
+        Create an empty profiler.
+
+        Args:
+            callbacks: functions called with each GenerationProfile.
+            trace_allocations: also measure memory allocations with tracemalloc.
+        """
+        self.callbacks: List[Callable[[GenerationProfile], None]] = list(callbacks or [])
+        self.trace_allocations = trace_allocations
+        self.generations: List[GenerationProfile] = []
+        self._seconds: Dict[str, float] = {}
+        self._counters: Dict[str, int] = {}
+        self._last = 0.0
+        self._memory_start = 0
+        self._started_tracing = False
+
+    def begin_generation(self):
+        self._seconds = dict.fromkeys(PHASES, 0.0)
+        self._counters = {}
+        if self.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str):
+        now = time.perf_counter()
+        self._seconds[phase] = self._seconds.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def count(self, name: str, n: int = 1):
+        self._counters[name] = self._counters.get(name, 0) + n
+
+    def end_generation(self, generation: int) -> GenerationProfile:
+        """
+        Close the current generation, store its profile and run the callbacks.
+        """
+        allocated = peak = None
+        if self.trace_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            allocated = current - self._memory_start
+        profile = GenerationProfile(generation, self._seconds, self._counters, allocated, peak)
+        self.generations.append(profile)
+        for callback in self.callbacks:
+            callback(profile)
+        return profile
+
+    def finish(self):
+        """
+        Stop tracemalloc if this profiler started it; called when a run ends.
+        """
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Sum the phase times and counters over all recorded generations.
+
+        Returns:
+            {"seconds": {phase: total}, "counters": {name: total}}.
+        """
+        seconds: Dict[str, float] = {}
+        counters: Dict[str, int] = {}
+        for profile in self.generations:
+            for phase, value in profile.seconds.items():
+                seconds[phase] = seconds.get(phase, 0.0) + value
+            for name, value in profile.counters.items():
+                counters[name] = counters.get(name, 0) + value
+        return {"seconds": seconds, "counters": counters}
+
+    def to_json(self, path: str):
+        """
+        Write the totals and every generation's profile as JSON.
+        """
+        with open(path, "w") as fh:
+            json.dump({"totals": self.totals(), "generations": [asdict(p) for p in self.generations]}, fh, indent=2)
+
+    def to_csv(self, path: str):
+        """
+        Write one CSV row per generation: phase seconds, counters and allocation columns.
+        """
+        phases = list(PHASES) + sorted({k for p in self.generations for k in p.seconds} - set(PHASES))
+        counters = sorted({k for p in self.generations for k in p.counters})
+        with open(path, "w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["generation"] + [f"{phase}_s" for phase in phases] + counters
+                            + ["allocated_bytes", "peak_bytes"])
+            for p in self.generations:
+                writer.writerow([p.generation] + [p.seconds.get(phase, 0.0) for phase in phases]
+                                + [p.counters.get(name, 0) for name in counters]
+                                + [p.allocated_bytes, p.peak_bytes])
+
+
+class NullProfiler:
+    """
+    Profiler stand-in used when profiling is off: every method is a no-op.
+    """
+    def begin_generation(self):
+        pass
+
+    def lap(self, phase: str):
+        pass
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    def end_generation(self, generation: int) -> None:
+        return None
+
+    def finish(self):
+        pass
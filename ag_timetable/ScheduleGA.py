@@ -1,8 +1,32 @@
 import random
-import copy
-from typing import List, Tuple
+import time
+from bisect import bisect_left
+from itertools import accumulate
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 from ag_timetable.WeeklySchedule import WeeklySchedule
 from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.Checkpoint import read_checkpoint, write_checkpoint
+from ag_timetable.ClassSlot import ClassSlot
+from ag_timetable.CrossoverOperators import CROSSOVER_OPERATORS, crossover_mask, repair_lectures, term_lectures
+from ag_timetable.FitnessBreakdown import FitnessBreakdown
+from ag_timetable.FitnessMemo import FitnessMemo
+from ag_timetable.GenerationStats import GenerationStats
+from ag_timetable.GridShape import GridShape
+from ag_timetable.LocalSearch import LocalSearch
+from ag_timetable.MutationOperators import MutationOperators
+from ag_timetable.ParallelEvaluator import ParallelEvaluator
+from ag_timetable.PhaseProfiler import NullProfiler, PhaseProfiler
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.Seeding import resolve_seed
+from ag_timetable.SubjectCatalog import SubjectCatalog
+
+Individual = Union[WeeklySchedule, ScheduleGenome]
+
+DUPLICATE_POLICIES = ("keep", "mutate", "replace")
+REPLACEMENT_MODES = ("generational", "steady_state")
+# mutations tried on a duplicate child before it is accepted anyway (duplicates="mutate")
+MAX_DUPLICATE_MUTATIONS = 10
 
 class ScheduleGA:
     """
@@ -17,9 +41,47 @@ class ScheduleGA:
         elitism_size (int): Number of top individuals to carry over unchanged each generation.
         mutation_rate (float): Probability of applying mutation to a child.
         tournament_size (int): Number of competitors in tournament selection.
-        population (List[WeeklySchedule]): Current population of schedules.
+        use_genome (bool): If True, evolve array-backed ScheduleGenome individuals.
+        workers (int): Worker processes used to score each generation (1 = in-process).
+        catalog (SubjectCatalog): Integer-indexed view of the subjects.
+        population (List[Individual]): Current population of schedules.
         history_gens (List[int]): Generation indices recorded during evolution.
         history_best (List[float]): Best fitness values per generation.
+        evaluations (int): Total number of fitness evaluations performed.
+        history_evaluations (List[int]): Fitness evaluations performed in each generation.
+        stagnation_limit (Optional[int]): Stop after this many generations without improvement.
+        target_fitness (Optional[float]): Stop once the best fitness reaches this value.
+        target_conflicts (Optional[int]): Stop once an individual has at most this many conflicts.
+        time_limit (Optional[float]): Stop once this many seconds of wall-clock time have passed.
+        max_evaluations (Optional[int]): Stop once this many fitness evaluations were performed.
+        stop_reason (Optional[str]): Why the last run stopped: "generations", "stagnation",
+            "target_fitness", "target_conflicts", "time_limit", "max_evaluations" or "cancelled".
+        checkpoint_path (Optional[str]): File that periodic checkpoints are written to.
+        checkpoint_every (int): Generations between checkpoints (0 disables them).
+        shape (GridShape): Dimensions of the timetable grid (terms, days, slots per day).
+        local_search (Optional[str]): "hill_climbing" or "tabu" to improve individuals with
+            LocalSearch every generation, None to disable.
+        local_search_steps (int): Step budget of each local search call.
+        local_search_targets (str): Individuals improved: "offspring", "elites" or "all".
+        tabu_tenure (int): Tabu tenure, in steps, for local_search="tabu".
+        greedy_init (float): Fraction of the initial population built greedily (the rest is random).
+        profiler (Optional[PhaseProfiler]): Collects per-phase timings and counters, or None.
+        cache_hits (int): Calls to evaluate() answered from an individual's cached breakdown.
+        seed (int): Seed of this GA's random generator.
+        rng (random.Random): Generator behind every random decision of this GA.
+        memo_size (int): Capacity of the cross-generation fitness memo (0 disables it).
+        memo (Optional[FitnessMemo]): Evaluations by genome, kept for the whole run.
+        duplicates (str): What happens to a child identical to an individual already in
+            the new population: "keep" it, "mutate" it or "replace" it with a random one.
+        replacement (str): "generational" (a new population every generation) or
+            "steady_state" (offspring replace the worst individuals in place).
+        offspring_per_step (int): Children created per steady-state step.
+        mutation_operators (Optional[Tuple[str, ...]]): Term-aware operators used by
+            mutation (see MutationOperators), or None for the legacy whole-grid swap.
+        adaptive_mutation (bool): Tune the operator probabilities from their success.
+        mutation_swaps (int): Swaps made by the "multi_swap" operator.
+        crossover (str): Crossover operator, one of CROSSOVER_OPERATORS.
+        genome_diversity (bool): Report GenerationStats.unique_genomes every generation.
     """
     def __init__(
         self,
@@ -30,7 +92,33 @@ class ScheduleGA:
         crossover_prob: float = 0.9,
         elitism_size: int = 2,
         mutation_rate: float = 0.1,
-        tournament_size: int = 3
+        tournament_size: int = 3,
+        use_genome: bool = False,
+        workers: int = 1,
+        stagnation_limit: Optional[int] = None,
+        target_fitness: Optional[float] = None,
+        target_conflicts: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        max_evaluations: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 0,
+        shape: Optional[GridShape] = None,
+        local_search: Optional[str] = None,
+        local_search_steps: int = 20,
+        local_search_targets: str = "offspring",
+        tabu_tenure: int = 5,
+        greedy_init: float = 0.0,
+        profiler: Optional[PhaseProfiler] = None,
+        seed: Optional[int] = None,
+        memo_size: int = 0,
+        duplicates: str = "keep",
+        replacement: str = "generational",
+        offspring_per_step: int = 2,
+        mutation_operators: Optional[Sequence[str]] = None,
+        adaptive_mutation: bool = False,
+        mutation_swaps: int = 3,
+        crossover: str = "one_point",
+        genome_diversity: bool = False
     ):
         """
         Initialize the genetic algorithm with given parameters.
@@ -44,7 +132,99 @@ class ScheduleGA:
             elitism_size: number of best individuals preserved each generation.
             mutation_rate: chance of mutating a newly created child.
             tournament_size: number of individuals in tournament selection.
+            use_genome: evolve ScheduleGenome arrays instead of WeeklySchedule objects.
+            workers: number of processes that score new individuals in batches; values
+                above 1 start a ProcessPoolExecutor for the duration of run().
+            stagnation_limit: generations without improvement of the best fitness before stopping.
+            target_fitness: best fitness at which to stop.
+            target_conflicts: conflict count at which to stop (0 stops at the first conflict-free schedule).
+            time_limit: wall-clock budget for run(), in seconds.
+            max_evaluations: budget of fitness evaluations.
+            checkpoint_path: file to write checkpoints to (see save_checkpoint/resume).
+            checkpoint_every: write a checkpoint every this many generations.
+            shape: grid dimensions; defaults to 6 terms x 5 days x 4 slots.
+            local_search: "hill_climbing" or "tabu" to run a bounded local search over
+                same-term swaps of conflicting slots after the offspring are created.
+            local_search_steps: maximum swaps tried per improved individual.
+            local_search_targets: "offspring" (new children), "elites" or "all". In
+                steady-state mode "offspring" improves the children of every step
+                before they are placed, while "elites" and "all" improve the best
+                elitism_size individuals or the whole population once per generation.
+            tabu_tenure: steps a moved slot stays tabu (tabu search only).
+            greedy_init: fraction (0 to 1) of the initial individuals built with
+                ScheduleGenome.assign_subjects_greedily, which avoids instructor clashes
+                and keeps lectures in blocks; the others are placed at random.
+            profiler: PhaseProfiler that records time per phase (sorting, selection,
+                crossover, copy, mutation, deduplication, local search, evaluation) and counters for
+                every generation; not saved in checkpoints.
+            seed: seed of the GA's own random generator; the same seed and parameters give
+                the same run whatever the worker count. If omitted, a seed is drawn from
+                the global random module (so random.seed() still pins the run).
+            memo_size: number of evaluations kept in an LRU memo keyed by genome, so
+                a genome seen in an earlier generation is not scored again.
+            duplicates: "keep", "mutate" (mutate duplicate children until they are
+                unique, up to MAX_DUPLICATE_MUTATIONS times) or "replace" (swap them for
+                random individuals); prevents the population collapsing into clones.
+            replacement: "generational", or "steady_state": each generation runs steps
+                that breed `offspring_per_step` children from the current population
+                and put them in place of its worst individuals, until pop_size -
+                elitism_size children were made (the same evaluation budget as a
+                generational step). Removed individuals are recycled as buffers for
+                later children, so a long run allocates almost nothing; do not keep
+                references to population members across generations in this mode.
+            offspring_per_step: children per steady-state step (1 to pop_size - elitism_size).
+            mutation_operators: names from MutationOperators.OPERATORS ("swap",
+                "multi_swap", "block", "conflict"); each mutation applies one of them,
+                always within a single term. None keeps the legacy mutation, which
+                draws two cells from the whole grid and only swaps them when they share
+                a term. Per-operator statistics are available from
+                export_mutation_stats().
+            adaptive_mutation: pick operators in proportion to how often their children
+                recently beat their parents instead of uniformly.
+            mutation_swaps: swaps applied by the "multi_swap" operator.
+            crossover: "one_point" (terms up to a random cut from the first parent),
+                "two_point" (terms between two cuts from the second parent),
+                "uniform_term" (each term from a random parent) or "day" (each day of
+                each term from a random parent, then surplus lectures in terms mixing
+                both parents are swapped for missing ones).
+            genome_diversity: count the distinct genomes of every generation into
+                GenerationStats.unique_genomes (None otherwise). Off by default because
+                it encodes every WeeklySchedule individual each generation.
+
+        Stopping criteria are optional, can be combined and are checked after every
+        generation; `generations` always remains an upper bound.
+
+        Raises:
+            ValueError: if a subject belongs to a term outside the grid, a term has more
+                lectures than slots, or the local search, greedy_init, memo_size,
+                duplicates, replacement, mutation or crossover settings are invalid.
         """
+        self.shape = shape or GridShape()
+        lectures = [0] * (self.shape.terms + 1)
+        for subject in subjects:
+            if not 1 <= subject.term <= self.shape.terms:
+                raise ValueError(f"Subject '{subject.subject_name}' belongs to term {subject.term}, "
+                                 f"but the grid has {self.shape.terms} terms.")
+            lectures[subject.term] += subject.lecture_count
+        for term, count in enumerate(lectures):
+            if count > self.shape.slots_per_term:
+                raise ValueError(f"Term {term} has {count} lectures, but only {self.shape.slots_per_term} "
+                                 f"slots per term are available.")
+        if not 0.0 <= greedy_init <= 1.0:
+            raise ValueError(f"greedy_init must be between 0 and 1, got {greedy_init}.")
+        if local_search_targets not in ("offspring", "elites", "all"):
+            raise ValueError(f"Unknown local search targets '{local_search_targets}'.")
+        if memo_size < 0:
+            raise ValueError(f"memo_size must not be negative, got {memo_size}.")
+        if duplicates not in DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicate policy '{duplicates}'.")
+        if crossover not in CROSSOVER_OPERATORS:
+            raise ValueError(f"Unknown crossover operator '{crossover}'.")
+        if replacement not in REPLACEMENT_MODES:
+            raise ValueError(f"Unknown replacement mode '{replacement}'.")
+        if replacement == "steady_state" and not 1 <= offspring_per_step <= pop_size - elitism_size:
+            raise ValueError(f"offspring_per_step must be between 1 and pop_size - elitism_size "
+                             f"({pop_size - elitism_size}), got {offspring_per_step}.")
         self.subjects = subjects
         self.pop_size = pop_size
         self.generations = generations
@@ -53,100 +233,306 @@ class ScheduleGA:
         self.elitism_size = elitism_size
         self.mutation_rate = mutation_rate
         self.tournament_size = tournament_size
-        # initialize population with random schedules
-        self.population: List[WeeklySchedule] = [self._random_individual() for _ in range(self.pop_size)]
+        self.use_genome = use_genome
+        self.workers = workers
+        self.stagnation_limit = stagnation_limit
+        self.target_fitness = target_fitness
+        self.target_conflicts = target_conflicts
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.stop_reason: Optional[str] = None
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self._start_time: Optional[float] = None
+        self._best_so_far = float("-inf")
+        self._stagnant_generations = 0
+        self._cancel_requested = False
+        self._evaluator: Optional[ParallelEvaluator] = None
+        self.catalog = SubjectCatalog(subjects)
+        self.local_search = local_search
+        self.local_search_steps = local_search_steps
+        self.local_search_targets = local_search_targets
+        self.tabu_tenure = tabu_tenure
+        self.greedy_init = greedy_init
+        self.seed = resolve_seed(seed)
+        self.rng = random.Random(self.seed)
+        self.memo_size = memo_size
+        self.memo: Optional[FitnessMemo] = FitnessMemo(memo_size) if memo_size else None
+        self.duplicates = duplicates
+        self.replacement = replacement
+        self.offspring_per_step = offspring_per_step
+        # individuals removed by steady-state replacement, reused as buffers for new children
+        self._spare: List[Individual] = []
+        self.profiler = profiler
+        self._profiler = profiler if profiler is not None else NullProfiler()
+        self.mutation_operators = tuple(mutation_operators) if mutation_operators is not None else None
+        self.adaptive_mutation = adaptive_mutation
+        self.mutation_swaps = mutation_swaps
+        self._mutator: Optional[MutationOperators] = None
+        if mutation_operators is not None:
+            self._mutator = MutationOperators(self.catalog, self.shape, mutation_operators, adaptive_mutation,
+                                              mutation_swaps, rng=self.rng)
+        self.crossover = crossover
+        self.genome_diversity = genome_diversity
+        # cells each subject fills per term, by id and by subject, for repairing "day" children
+        self._term_lectures = term_lectures(self.catalog, self.shape)
+        self._term_subjects = [{self.catalog.subject(sid): n for sid, n in counts.items()}
+                               for counts in self._term_lectures]
+        self._local_search: Optional[LocalSearch] = None
+        if local_search is not None:
+            self._local_search = LocalSearch(self.catalog, self.shape, local_search, local_search_steps,
+                                             tabu_tenure, self.rng)
+        self.evaluations = 0
+        self.cache_hits = 0
+        # cumulative fitness table for roulette selection, rebuilt once per generation
+        self._cumulative_fitness: Optional[Sequence[float]] = None
+        self._init_population()
         # history for plotting
         self.history_gens: List[int] = []
         self.history_best: List[float] = []
+        self.history_evaluations: List[int] = []
 
-    def _random_individual(self) -> WeeklySchedule:
+    def _init_population(self):
+        """
+        Initialize the population: greedy_init of it built greedily, the rest at random.
         """
-        Create a new random WeeklySchedule individual by assigning subjects randomly.
+        n_greedy = round(self.greedy_init * self.pop_size)
+        self.population: List[Individual] = [self._random_individual(greedy=i < n_greedy)
+                                             for i in range(self.pop_size)]
 
+    def _random_individual(self, greedy: bool = False) -> Individual:
+        """
+        Create a new individual by assigning subjects randomly, or greedily.
+
+        Args:
+            greedy: build it with ScheduleGenome.assign_subjects_greedily.
         Returns:
-            A WeeklySchedule populated with randomly assigned subjects.
+            A WeeklySchedule (or ScheduleGenome) populated with the assigned subjects.
         """
-        sched = WeeklySchedule()
-        sched.assign_subjects_randomly(self.subjects)
+        if greedy:
+            genome = ScheduleGenome(self.catalog, shape=self.shape)
+            genome.assign_subjects_greedily(self.rng)
+            return genome if self.use_genome else genome.to_schedule()
+        if self.use_genome:
+            genome = ScheduleGenome(self.catalog, shape=self.shape)
+            genome.assign_subjects_randomly(self.rng)
+            return genome
+        sched = WeeklySchedule(shape=self.shape)
+        sched.assign_subjects_randomly(self.subjects, self.rng)
         return sched
 
-    def _fitness(self, sched: WeeklySchedule) -> float:
+    def evaluate(self, sched: Individual) -> FitnessBreakdown:
+        """
+        Evaluate a schedule in a single pass and return its full fitness breakdown.
+
+        The breakdown is cached on the individual, so each schedule is evaluated once
+        until _mutate changes it, and in the memo (if enabled), so a genome seen before
+        is not scored again. WeeklySchedules are scored as genomes against the
+        catalog compiled in __init__, so instructors are compared as integer ids.
+
+        Args:
+            sched: WeeklySchedule or ScheduleGenome to evaluate.
+        Returns:
+            The FitnessBreakdown (conflicts, aggregations, free-slot status, fitness).
+        """
+        if sched.cached_evaluation is None:
+            genome = sched if isinstance(sched, ScheduleGenome) else ScheduleGenome.from_schedule(sched, self.catalog)
+            if self.memo is None:
+                sched.cached_evaluation = genome.evaluate()
+                self.evaluations += 1
+            else:
+                key = genome.to_bytes()
+                result = self.memo.get(key)
+                if result is None:
+                    result = genome.evaluate()
+                    self.memo.put(key, result)
+                    self.evaluations += 1
+                sched.cached_evaluation = result
+        else:
+            self.cache_hits += 1
+        return sched.cached_evaluation
+
+    def _evaluate_population(self, population: List[Individual]):
+        """
+        Score every individual that has no cached evaluation yet, in one batch.
+
+        With a worker pool the pending individuals are split into one batch per
+        worker; otherwise they are evaluated in-process.
+
+        Args:
+            population: individuals to make sure are evaluated.
         """
-        Calculate the fitness of a WeeklySchedule based on contiguous lectures and conflicts.
+        pending = [ind for ind in population if ind.cached_evaluation is None]
+        if self._evaluator is None:
+            for ind in pending:
+                self.evaluate(ind)
+            return
+        keys: List[Optional[bytes]] = [None] * len(pending)
+        if self.memo is not None:
+            # only genomes missing from the memo are sent to the workers
+            misses = []
+            for ind in pending:
+                key = self.encode(ind)
+                ind.cached_evaluation = self.memo.get(key)
+                if ind.cached_evaluation is None:
+                    misses.append((ind, key))
+            pending = [ind for ind, _ in misses]
+            keys = [key for _, key in misses]
+        for ind, key, result in zip(pending, keys, self._evaluator.evaluate(pending)):
+            ind.cached_evaluation = result
+            if key is not None:
+                self.memo.put(key, result)
+        self.evaluations += len(pending)
+
+    def _fitness(self, sched: Individual) -> float:
+        """
+        Calculate the fitness of a schedule based on contiguous lectures and conflicts.
 
         Fitness = (20*doubles + 30*triples + 40*quadruples) / (100 * conflicts),
         where doubles, triples, quadruples are counts of adjacent lecture slots and
         conflicts is the number of scheduling conflicts.
 
         Args:
-            sched: WeeklySchedule to evaluate.
+            sched: WeeklySchedule or ScheduleGenome to evaluate.
         Returns:
             A float fitness score (higher is better).
         """
-        d = sched.count_double_aggregations()
-        t = sched.count_triple_aggregations()
-        q = sched.count_quadruple_aggregations()
-        c = sched.count_schedule_conflicts()
-        return (20 * d + 30 * t + 40 * q) / max(1, 100 * c)
+        return self.evaluate(sched).fitness
 
-    def _select_parent(self) -> WeeklySchedule:
+    def _select_parent(self) -> Individual:
         """
         Select a parent individual from the population based on the selection flag.
 
         Returns:
-            A selected WeeklySchedule from the population.
+            A selected individual from the population.
         """
         if self.use_tournament:
             # Tournament selection: choose the best of a random sample
-            competitors = random.sample(self.population, self.tournament_size)
+            competitors = self.rng.sample(self.population, self.tournament_size)
             return max(competitors, key=self._fitness)
         else:
             # Fitness proportionate selection (roulette wheel)
-            fits = [self._fitness(ind) for ind in self.population]
-            total = sum(fits)
-            pick = random.uniform(0, total)
-            current = 0.0
-            for ind, fit in zip(self.population, fits):
-                current += fit
-                if current >= pick:
-                    return ind
-            return self.population[-1]
+            if self._cumulative_fitness is None:
+                self._cumulative_fitness = list(accumulate(self._fitness(ind) for ind in self.population))
+            pick = self.rng.uniform(0, self._cumulative_fitness[-1])
+            idx = bisect_left(self._cumulative_fitness, pick)
+            return self.population[min(idx, len(self.population) - 1)]
 
-    def _crossover(self, p1: WeeklySchedule, p2: WeeklySchedule) -> WeeklySchedule:
+    def _crossover(self, p1: Individual, p2: Individual, out: Optional[Individual] = None) -> Individual:
         """
-        Perform term-level crossover between two parent schedules.
+        Perform crossover between two parent schedules with the configured operator.
 
-        A cut point is chosen among terms, and all slots for terms <= cut come from p1,
-        while the remaining terms come from p2.
+        With "one_point", a cut point is chosen among terms, and all slots for terms
+        <= cut come from p1, while the remaining terms come from p2. The other
+        operators go through _block_crossover.
 
         Args:
-            p1: first parent WeeklySchedule.
-            p2: second parent WeeklySchedule.
+            p1: first parent.
+            p2: second parent.
+            out: recycled individual of the same representation to write the child
+                into, instead of allocating a new one.
         Returns:
-            A new WeeklySchedule offspring.
-        """
-        child = WeeklySchedule()
-        child.slots.clear()
-        terms = sorted({slot.term for slot in p1.slots})
-        cut_index = random.randint(1, len(terms) - 1)
-        for term in terms:
-            source = p1 if term <= terms[cut_index - 1] else p2
-            block = [copy.deepcopy(slot) for slot in source.slots if slot.term == term]
-            child.slots.extend(block)
-        return child
+            The offspring (`out` when given), of the same representation as the parents.
+        """
+        if self.crossover != "one_point" or self.shape.terms < 2:
+            # (one term leaves no cut point; the block mask then copies p1)
+            return self._block_crossover(p1, p2, out)
+        if isinstance(p1, ScheduleGenome):
+            # term blocks are the leading axis, so the cut is a plain slice
+            cut = self.rng.randint(1, p1.shape.terms - 1)
+            if out is None:
+                return ScheduleGenome(self.catalog, np.concatenate((p1.genes[:cut], p2.genes[cut:])), p1.shape)
+            out.genes[:cut] = p1.genes[:cut]
+            out.genes[cut:] = p2.genes[cut:]
+            out.cached_evaluation = None
+            return out
+        cut = self.rng.randint(1, p1.shape.terms - 1)
+        split = p1.shape.index(cut + 1, 1, 1)
+        if out is None:
+            # new slot objects, but the subjects they hold are shared with the parents
+            return WeeklySchedule([s.copy() for s in p1.slots[:split]] + [s.copy() for s in p2.slots[split:]],
+                                  p1.shape)
+        for i, dst in enumerate(out.slots):
+            dst.subject = (p1 if i < split else p2).slots[i].subject
+        out.cached_evaluation = None
+        out.swap_state = None
+        return out
+
+    def _block_crossover(self, p1: Individual, p2: Individual, out: Optional[Individual] = None) -> Individual:
+        """
+        Build a child from (term, day) blocks of both parents, as drawn by crossover_mask.
+
+        A genome child is two buffer copies: p2's genes, then p1's blocks over them.
+        Terms that mix blocks of both parents ("day" crossover) are repaired so every
+        subject keeps its lecture count.
 
-    def _mutate(self, sched: WeeklySchedule):
+        Args:
+            p1: first parent.
+            p2: second parent.
+            out: recycled individual of the same representation to write the child into.
+        Returns:
+            The offspring (`out` when given).
         """
-        Mutate a schedule by swapping two slots within the same term to maintain validity.
+        mask = crossover_mask(self.crossover, self.shape, self.rng)
+        mixed = np.flatnonzero(mask.any(axis=1) & ~mask.all(axis=1)).tolist()
+        if isinstance(p1, ScheduleGenome):
+            if out is None:
+                out = ScheduleGenome(self.catalog, p2.genes.copy(), p1.shape)
+            else:
+                np.copyto(out.genes, p2.genes)
+            np.copyto(out.genes, p1.genes, where=mask[:, :, None])
+            for term in mixed:
+                cells = out.genes[term].reshape(-1)
+                repaired = cells.tolist()
+                repair_lectures(repaired, self._term_lectures[term], self.rng)
+                cells[:] = repaired
+            out.cached_evaluation = None
+            return out
+        from_p1 = np.repeat(mask.reshape(-1), self.shape.slots_per_day).tolist()
+        subjects = [(a if first else b).subject for a, b, first in zip(p1.slots, p2.slots, from_p1)]
+        for term in mixed:
+            cells = self.shape.term_slice(term + 1)
+            repaired = subjects[cells]
+            repair_lectures(repaired, self._term_subjects[term], self.rng)
+            subjects[cells] = repaired
+        if out is None:
+            return WeeklySchedule([ClassSlot(s.term, s.day, s.slot, subject)
+                                   for s, subject in zip(p1.slots, subjects)], p1.shape)
+        for dst, subject in zip(out.slots, subjects):
+            dst.subject = subject
+        out.cached_evaluation = None
+        out.swap_state = None
+        return out
+
+    def _mutate(self, sched: Individual) -> Optional[str]:
+        """
+        Mutate a schedule by swapping slots within the same term to maintain validity.
 
         Args:
-            sched: WeeklySchedule to mutate in place.
+            sched: WeeklySchedule or ScheduleGenome to mutate in place.
+        Returns:
+            The mutation operator applied, or None for the legacy mutation.
         """
-        idx1, idx2 = random.sample(range(len(sched.slots)), 2)
+        if self._mutator is not None:
+            return self._mutator.mutate(sched)
+        if isinstance(sched, ScheduleGenome):
+            flat = sched.genes.reshape(-1)
+            idx1, idx2 = self.rng.sample(range(flat.size), 2)
+            per_term = sched.shape.slots_per_term
+            if idx1 // per_term == idx2 // per_term:
+                flat[idx1], flat[idx2] = flat[idx2], flat[idx1]
+                sched.cached_evaluation = None
+            return
+        idx1, idx2 = self.rng.sample(range(len(sched.slots)), 2)
         slot1 = sched.slots[idx1]
         slot2 = sched.slots[idx2]
         if slot1.term == slot2.term:
-            slot1.subject, slot2.subject = slot2.subject, slot1.subject
+            if sched.swap_state is not None:
+                # running totals are already built, so rescoring the swap is O(1)
+                sched.apply_swap(idx1, idx2)
+            else:
+                slot1.subject, slot2.subject = slot2.subject, slot1.subject
+                sched.cached_evaluation = None
 
     def run(self) -> WeeklySchedule:
         """
@@ -155,30 +541,523 @@ class ScheduleGA:
         Returns:
             The best WeeklySchedule found.
         """
-        for gen in range(self.generations):
-            # Sort population by descending fitness
-            sorted_pop = sorted(self.population, key=self._fitness, reverse=True)
-            # Carry over elites unchanged
-            new_population = sorted_pop[:self.elitism_size]
-            # Fill the rest of the new population
-            while len(new_population) < self.pop_size:
+        for _ in self.iter_generations():
+            pass
+        # Return the best schedule from the final population
+        return self.export_best()
+
+    def iter_generations(self, generations: Optional[int] = None) -> Iterator[GenerationStats]:
+        """
+        Run the genetic algorithm step by step, yielding statistics after each generation.
+
+        The stats are computed from the cached fitness values, so the population is
+        never copied. Stop early by calling cancel() (from any thread) or by closing
+        the generator; either way the worker pool is shut down.
+
+        Args:
+            generations: maximum number of generations (defaults to `generations`).
+        Yields:
+            A GenerationStats for every finished generation.
+        """
+        self._start_time = time.perf_counter()
+        yield from self._iter_with_pool(self.generations if generations is None else generations)
+
+    def cancel(self):
+        """
+        Ask run()/iter_generations() to stop after the current generation; when called
+        before the run starts, it stops after the first one.
+        """
+        self._cancel_requested = True
+
+    def _iter_with_pool(self, generations: int) -> Iterator[GenerationStats]:
+        """
+        Iterate generations with the worker pool (if any) running.
+        """
+        if self.workers > 1:
+            self._evaluator = ParallelEvaluator(self.catalog, self.workers, self.shape)
+        try:
+            yield from self._iter_generations(generations)
+        finally:
+            self._profiler.finish()
+            if self._evaluator is not None:
+                self._evaluator.close()
+                self._evaluator = None
+
+    def evolve(self, generations: int):
+        """
+        Evolve the current population for a number of generations, continuing the
+        recorded history. Drivers such as IslandGA call it repeatedly between migrations.
+
+        Args:
+            generations: maximum number of generations to run; fewer are run when a
+                stopping criterion is met (see stop_reason).
+        """
+        for _ in self._iter_generations(generations):
+            pass
+
+    def _iter_generations(self, generations: int) -> Iterator[GenerationStats]:
+        """
+        Core loop shared by run(), iter_generations() and evolve().
+        """
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        start = len(self.history_gens)
+        prof = self._profiler
+        try:
+            for gen in range(start, start + generations):
+                evaluations_before, hits_before = self.evaluations, self.cache_hits
+                memo_hits_before = self.memo.hits if self.memo is not None else 0
+                prof.begin_generation()
+                fitness_values, min_conflicts = self._next_generation()
+                stats = self._record_generation(gen, fitness_values, min_conflicts, evaluations_before)
+                prof.lap("bookkeeping")
+                prof.count("evaluations", stats.evaluations)
+                prof.count("cache_hits", self.cache_hits - hits_before)
+                if self.memo is not None:
+                    prof.count("memo_hits", self.memo.hits - memo_hits_before)
+                prof.end_generation(gen)
+                yield stats
+                if self.stop_reason is None and self._cancel_requested:
+                    self.stop_reason = "cancelled"
+                if self.stop_reason is not None:
+                    return
+            self.stop_reason = "generations"
+        finally:
+            # a cancel() issued before the run started is honoured, one issued during
+            # it ends with it, so a later evolve() or resume() runs normally
+            self._cancel_requested = False
+
+    def _next_generation(self) -> Tuple[Sequence[float], int]:
+        """
+        Replace the population with the next generation.
+
+        Returns:
+            A tuple (fitness of every new individual, fewest conflicts among them).
+        """
+        if self.replacement == "steady_state":
+            return self._steady_state_generation()
+        prof = self._profiler
+        self._evaluate_population(self.population)
+        prof.lap("evaluation")
+        # Sort population by descending fitness
+        sorted_pop = sorted(self.population, key=self._fitness, reverse=True)
+        # Carry over elites unchanged
+        new_population = sorted_pop[:self.elitism_size]
+        n_elite = len(new_population)
+        seen = {self.encode(ind) for ind in new_population} if self.duplicates != "keep" else None
+        # (operator, parents' fitness, child) of every mutated child, credited once scored
+        mutated = []
+        prof.lap("sorting")
+        # Fill the rest of the new population
+        while len(new_population) < self.pop_size:
+            parent1 = self._select_parent()
+            parent2 = self._select_parent()
+            prof.lap("selection")
+            crossed = self.rng.random() < self.crossover_prob
+            if crossed:
+                child = self._crossover(parent1, parent2)
+                prof.lap("crossover")
+            else:
+                child = parent1.copy()
+                prof.lap("copy")
+            operator = self._mutate(child) if self.rng.random() < self.mutation_rate else None
+            prof.lap("mutation")
+            mutant = child
+            if seen is not None:
+                child = self._make_unique(child, seen)
+                prof.lap("deduplication")
+            if operator is not None and child is mutant:
+                mutated.append((operator, self._parent_fitness(parent1, parent2, crossed), child))
+            new_population.append(child)
+        prof.count("individuals_created", len(new_population) - n_elite)
+        if self._local_search is not None:
+            # mutations are judged on the children as they were bred, not as improved
+            self._credit_mutations(mutated)
+            mutated = []
+            prof.lap("evaluation")
+        self._improve_population(new_population, n_elite)
+        prof.lap("local_search")
+        self.population = new_population
+        self._cumulative_fitness = None
+        self._evaluate_population(self.population)
+        fitness_values = [self._fitness(ind) for ind in self.population]
+        min_conflicts = min(self.evaluate(ind).conflicts for ind in self.population)
+        prof.lap("evaluation")
+        self._credit_mutations(mutated)
+        return fitness_values, min_conflicts
+
+    def _steady_state_generation(self) -> Tuple[Sequence[float], int]:
+        """
+        Run one generation's worth of steady-state steps on the population, in place.
+
+        Every step breeds offspring_per_step children from the current population into
+        recycled buffers, evaluates them together and swaps them for the worst
+        individuals, which become the buffers of the next step.
+
+        Returns:
+            A tuple (fitness of every individual, fewest conflicts among them).
+        """
+        prof = self._profiler
+        population = self.population
+        self._evaluate_population(population)
+        seen = {self.encode(ind) for ind in population} if self.duplicates != "keep" else None
+        # fitness per population slot, kept in step with the replacements
+        fitness = np.array([self._fitness(ind) for ind in population])
+        self._cumulative_fitness = None
+        prof.lap("evaluation")
+        remaining = self.pop_size - self.elitism_size
+        while remaining > 0:
+            children = []
+            mutated = []
+            for _ in range(min(self.offspring_per_step, remaining)):
                 parent1 = self._select_parent()
                 parent2 = self._select_parent()
-                if random.random() < self.crossover_prob:
-                    child = self._crossover(parent1, parent2)
+                prof.lap("selection")
+                buffer = self._spare.pop() if self._spare else None
+                crossed = self.rng.random() < self.crossover_prob
+                if crossed:
+                    child = self._crossover(parent1, parent2, buffer)
+                    prof.lap("crossover")
                 else:
-                    child = copy.deepcopy(parent1)
-                if random.random() < self.mutation_rate:
+                    child = parent1.copy(buffer)
+                    prof.lap("copy")
+                operator = self._mutate(child) if self.rng.random() < self.mutation_rate else None
+                prof.lap("mutation")
+                mutant = child
+                if seen is not None:
+                    child = self._make_unique(child, seen)
+                    prof.lap("deduplication")
+                if operator is not None and child is mutant:
+                    mutated.append((operator, self._parent_fitness(parent1, parent2, crossed), child))
+                children.append(child)
+            remaining -= len(children)
+            prof.count("individuals_created", len(children))
+            if self.local_search_targets == "offspring":
+                if self._local_search is not None:
+                    self._credit_mutations(mutated)
+                    mutated = []
+                    prof.lap("evaluation")
+                self._improve_population(children, 0)
+                prof.lap("local_search")
+            self._evaluate_population(children)
+            prof.lap("evaluation")
+            self._credit_mutations(mutated)
+            n = len(children)
+            worst = np.argpartition(fitness, n - 1)[:n] if n < len(fitness) else np.arange(n)
+            for i, child in zip(worst.tolist(), children):
+                self._spare.append(population[i])
+                population[i] = child
+                fitness[i] = self._fitness(child)
+            if not self.use_tournament:
+                # one vectorized pass instead of re-scoring the population on the next pick
+                self._cumulative_fitness = np.cumsum(fitness)
+            prof.lap("replacement")
+        if self.local_search_targets == "elites":
+            top = sorted(population, key=self._fitness, reverse=True)[:self.elitism_size]
+            self._improve_population(top, len(top))
+            prof.lap("local_search")
+        elif self.local_search_targets == "all":
+            self._improve_population(population, 0)
+            prof.lap("local_search")
+        fitness_values = [self._fitness(ind) for ind in population]
+        min_conflicts = min(self.evaluate(ind).conflicts for ind in population)
+        prof.lap("evaluation")
+        return fitness_values, min_conflicts
+
+    def _parent_fitness(self, parent1: Individual, parent2: Individual, crossed: bool) -> float:
+        # what a mutated child has to beat to count as an improvement
+        if crossed:
+            return max(self._fitness(parent1), self._fitness(parent2))
+        return self._fitness(parent1)
+
+    def _credit_mutations(self, mutated: List[Tuple[str, float, Individual]]):
+        """
+        Report the outcome of this generation's mutations to the mutation operators.
+
+        Called before the local search improves the children (when it runs on them),
+        so operators are not credited for its gains; children not scored yet are
+        evaluated first.
+
+        Args:
+            mutated: (operator, parents' fitness, child) for every mutated child.
+        """
+        if not mutated:
+            return
+        self._evaluate_population([child for _, _, child in mutated])
+        improved = 0
+        for operator, baseline, child in mutated:
+            fitness = self._fitness(child)
+            self._mutator.record(operator, baseline, fitness)
+            improved += fitness > baseline
+        self._profiler.count("mutations", len(mutated))
+        self._profiler.count("improving_mutations", improved)
+
+    def _make_unique(self, child: Individual, seen: Set[bytes]) -> Individual:
+        """
+        Apply the duplicate policy to a new child whose genome may already be in `seen`.
+
+        Args:
+            child: new offspring, possibly mutated in place.
+            seen: genomes already in the new population; the child's is added.
+        Returns:
+            The child, or its random replacement under duplicates="replace".
+        """
+        key = self.encode(child)
+        if key in seen:
+            self._profiler.count("duplicates")
+            if self.duplicates == "replace":
+                child = self._random_individual()
+                key = self.encode(child)
+            else:
+                for _ in range(MAX_DUPLICATE_MUTATIONS):
                     self._mutate(child)
-                new_population.append(child)
-            self.population = new_population
-            # record history for plotting
-            best_ind = max(self.population, key=self._fitness)
-            best_fit = self._fitness(best_ind)
-            self.history_gens.append(gen)
-            self.history_best.append(best_fit)
-        # Return the best schedule from the final population
-        return max(self.population, key=self._fitness)
+                    key = self.encode(child)
+                    if key not in seen:
+                        break
+        seen.add(key)
+        return child
+
+    def _improve_population(self, population: List[Individual], n_elite: int):
+        """
+        Run the local search on the configured part of a new population, in place.
+
+        Args:
+            population: new population, elites first.
+            n_elite: number of elites at the start of `population`.
+        """
+        if self._local_search is None:
+            return
+        if self.local_search_targets == "elites":
+            population = population[:n_elite]
+        elif self.local_search_targets == "offspring":
+            population = population[n_elite:]
+        for ind in population:
+            self._improve(ind)
+
+    def _improve(self, ind: Individual):
+        """
+        Apply the local search to one individual and cache the resulting breakdown.
+        """
+        if ind.cached_evaluation is not None and ind.cached_evaluation.conflicts == 0:
+            return
+        if ind.cached_evaluation is None:
+            # the search scores the individual as it starts, which stands in for evaluate()
+            self.evaluations += 1
+        if isinstance(ind, ScheduleGenome):
+            ind.cached_evaluation = self._local_search.improve(ind.genes)
+            return
+        genome = ScheduleGenome.from_schedule(ind, self.catalog)
+        result = self._local_search.improve(genome.genes)
+        for s, sid in zip(ind.slots, genome.genes.reshape(-1).tolist()):
+            s.subject = self.catalog.subject(sid)
+        ind.swap_state = None
+        ind.cached_evaluation = result
+
+    def _record_generation(self, gen: int, fitness_values: Sequence[float], min_conflicts: int,
+                           evaluations_before: int) -> GenerationStats:
+        """
+        Record history for a finished generation and check the stopping criteria.
+
+        Args:
+            gen: index of the generation that just finished.
+            fitness_values: fitness of every individual in the new population.
+            min_conflicts: fewest conflicts of any individual in the new population.
+            evaluations_before: value of `evaluations` when the generation started.
+        Returns:
+            The GenerationStats; stop_reason is set when the run should stop.
+        """
+        values = np.asarray(fitness_values, dtype=np.float64)
+        best_fit = float(values.max())
+        stats = GenerationStats(
+            generation=gen,
+            best=best_fit,
+            mean=float(values.mean()),
+            worst=float(values.min()),
+            diversity=len(np.unique(values)) / len(values),
+            unique_genomes=self._unique_genomes() / len(values) if self.genome_diversity else None,
+            min_conflicts=int(min_conflicts),
+            evaluations=self.evaluations - evaluations_before,
+            elapsed=time.perf_counter() - self._start_time,
+        )
+        # record history for plotting
+        self.history_gens.append(gen)
+        self.history_best.append(best_fit)
+        self.history_evaluations.append(stats.evaluations)
+
+        if best_fit > self._best_so_far:
+            self._best_so_far = best_fit
+            self._stagnant_generations = 0
+        else:
+            self._stagnant_generations += 1
+
+        if self.target_fitness is not None and best_fit >= self.target_fitness:
+            self.stop_reason = "target_fitness"
+        elif self.target_conflicts is not None and min_conflicts <= self.target_conflicts:
+            self.stop_reason = "target_conflicts"
+        elif self.stagnation_limit is not None and self._stagnant_generations >= self.stagnation_limit:
+            self.stop_reason = "stagnation"
+        elif self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            self.stop_reason = "max_evaluations"
+        elif self.time_limit is not None and time.perf_counter() - self._start_time >= self.time_limit:
+            self.stop_reason = "time_limit"
+        else:
+            self.stop_reason = None
+
+        if self.checkpoint_path and self.checkpoint_every and len(self.history_gens) % self.checkpoint_every == 0:
+            self.save_checkpoint(self.checkpoint_path)
+        return stats
+
+    def _unique_genomes(self) -> int:
+        # number of distinct genomes in the current population
+        return len({self.encode(ind) for ind in self.population})
+
+    def _params(self) -> Dict[str, Any]:
+        # constructor arguments (besides subjects) needed to rebuild this GA
+        names = ("pop_size", "generations", "use_tournament", "crossover_prob", "elitism_size",
+                 "mutation_rate", "tournament_size", "use_genome", "workers", "stagnation_limit",
+                 "target_fitness", "target_conflicts", "time_limit", "max_evaluations",
+                 "checkpoint_path", "checkpoint_every", "local_search", "local_search_steps",
+                 "local_search_targets", "tabu_tenure", "greedy_init", "seed",
+                 "memo_size", "duplicates", "replacement", "offspring_per_step",
+                 "adaptive_mutation", "mutation_swaps", "crossover", "genome_diversity")
+        params = {name: getattr(self, name) for name in names}
+        params["mutation_operators"] = list(self.mutation_operators) if self.mutation_operators else None
+        params["shape"] = list(self.shape.dims)
+        return params
+
+    def _population_genes(self) -> np.ndarray:
+        # population as a (pop, terms, days, slots_per_day) int16 array
+        shape = (0,) + self.shape.dims
+        if not self.population:
+            return np.zeros(shape, dtype=np.int16)
+        return np.stack([np.frombuffer(self.encode(ind), dtype=np.int16) for ind in self.population]) \
+            .reshape((-1,) + shape[1:])
+
+    def _restore_population(self, genes: np.ndarray):
+        self.population = [self.decode(row.tobytes()) for row in genes]
+        self._cumulative_fitness = None
+        self._evaluate_population(self.population)
+
+    def _rng_state(self) -> Dict[str, Any]:
+        return {"random": self.rng.getstate()}
+
+    def _set_rng_state(self, state: Dict[str, Any]):
+        version, internal, gauss = state["random"]
+        self.rng.setstate((version, tuple(internal), gauss))
+
+    def save_checkpoint(self, path: str):
+        """
+        Write the full GA state to a compact binary checkpoint.
+
+        The file holds a JSON header (parameters, subjects, counters, RNG state) followed
+        by the population genomes and the history as raw arrays; see Checkpoint.py.
+
+        Args:
+            path: destination file.
+        """
+        elapsed = time.perf_counter() - self._start_time if self._start_time is not None else 0.0
+        header = {
+            "class": type(self).__name__,
+            "params": self._params(),
+            "subjects": [[s.term, s.subject_name, s.instructor, s.lecture_count] for s in self.subjects],
+            "evaluations": self.evaluations,
+            "elapsed": elapsed,
+            "best_so_far": self._best_so_far,
+            "stagnant_generations": self._stagnant_generations,
+            "stop_reason": self.stop_reason,
+            "rng_state": self._rng_state(),
+            "mutation_state": self._mutator.get_state() if self._mutator is not None else None,
+        }
+        arrays = {
+            "genes": self._population_genes(),
+            "history_gens": np.array(self.history_gens, dtype=np.int64),
+            "history_best": np.array(self.history_best, dtype=np.float64),
+            "history_evaluations": np.array(self.history_evaluations, dtype=np.int64),
+        }
+        write_checkpoint(path, header, arrays)
+
+    @classmethod
+    def load_checkpoint(cls, path: str) -> "ScheduleGA":
+        """
+        Rebuild a GA from a checkpoint without running it.
+
+        Args:
+            path: checkpoint written by save_checkpoint.
+        Returns:
+            The restored GA, ready to continue.
+        Raises:
+            ValueError: if the checkpoint was written by a different GA class.
+        """
+        header, arrays = read_checkpoint(path)
+        if header["class"] != cls.__name__:
+            raise ValueError(f"Checkpoint was written by {header['class']}, not {cls.__name__}.")
+        subjects = [CourseSubject(*row) for row in header["subjects"]]
+        params = dict(header["params"])
+        params["shape"] = GridShape(*params.get("shape", GridShape().dims))
+        ga = cls(subjects, **params)
+        ga.history_gens = arrays["history_gens"].tolist()
+        ga.history_best = arrays["history_best"].tolist()
+        ga.history_evaluations = arrays["history_evaluations"].tolist()
+        ga._restore_population(arrays["genes"])
+        ga.evaluations = header["evaluations"]
+        ga._best_so_far = header["best_so_far"]
+        ga._stagnant_generations = header["stagnant_generations"]
+        ga.stop_reason = header["stop_reason"]
+        ga._set_rng_state(header["rng_state"])
+        if header.get("mutation_state") is not None:
+            ga._mutator.set_state(header["mutation_state"])
+        ga._start_time = time.perf_counter() - header["elapsed"]
+        return ga
+
+    @classmethod
+    def resume(cls, path: str) -> "ScheduleGA":
+        """
+        Restore a GA from a checkpoint and run the generations it had left.
+
+        With the same parameters the resumed run follows exactly the trajectory the
+        original run would have taken. A run that had already stopped (on a stopping
+        criterion, not by cancel()) is returned as it was, without running further.
+
+        Args:
+            path: checkpoint written by save_checkpoint.
+        Returns:
+            The GA after finishing; use export_best()/export_history() for results.
+        """
+        ga = cls.load_checkpoint(path)
+        if ga.stop_reason not in (None, "cancelled"):
+            return ga
+        for _ in ga._iter_with_pool(max(0, ga.generations - len(ga.history_gens))):
+            pass
+        return ga
+
+    def immigrate(self, migrants: List[Individual]):
+        """
+        Replace the worst individuals of the population with incoming migrants.
+
+        Args:
+            migrants: individuals of the same representation as the population.
+        """
+        if not migrants:
+            return
+        self._evaluate_population(self.population)
+        survivors = sorted(self.population, key=self._fitness, reverse=True)
+        self.population = survivors[:max(0, len(survivors) - len(migrants))] + list(migrants)
+        self._cumulative_fitness = None
+
+    def encode(self, sched: Individual) -> bytes:
+        """
+        Return the compact genome bytes of an individual, for sending to other processes.
+        """
+        if not isinstance(sched, ScheduleGenome):
+            sched = ScheduleGenome.from_schedule(sched, self.catalog)
+        return sched.to_bytes()
+
+    def decode(self, blob: bytes) -> Individual:
+        """
+        Rebuild an individual in this GA's representation from encode() bytes.
+        """
+        genome = ScheduleGenome.from_bytes(self.catalog, blob, self.shape)
+        return genome if self.use_genome else genome.to_schedule()
 
     def export_history(self) -> Tuple[List[int], List[float]]:
         """
@@ -189,6 +1068,19 @@ class ScheduleGA:
         """
         return self.history_gens, self.history_best
     
+    def export_mutation_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Export how each mutation operator has fared so far.
+
+        A mutation counts as improving when the child, before any local search, is
+        fitter than its parent, or than both parents after crossover.
+
+        Returns:
+            Per operator name: applications, improvements, improvement_rate, total_gain
+            and its current probability; empty with the legacy mutation.
+        """
+        return self._mutator.export_stats() if self._mutator is not None else {}
+
     def export_best(self) -> WeeklySchedule:
         """
         Export the best individual (WeeklySchedule) from the current population.
@@ -196,7 +1088,13 @@ class ScheduleGA:
         Returns:
             The WeeklySchedule with highest fitness from the final population.
         """
-        return max(self.population, key=self._fitness)
+        best = max(self.population, key=self._fitness)
+        if isinstance(best, ScheduleGenome):
+            sched = best.to_schedule()
+            sched.cached_evaluation = best.cached_evaluation
+            return sched
+        # a copy, since steady-state replacement recycles population members
+        return best.copy()
 
 
 if __name__ == "__main__":
@@ -272,10 +1170,10 @@ if __name__ == "__main__":
 
     # Run the algorithm and retrieve the best schedule
     best_schedule = ga.run()
-    fitness = ga._fitness(best_schedule)
-    print(f"Best fitness: {fitness:.4f}")
-    print("Conflicts:", best_schedule.count_schedule_conflicts())
-    print("Double aggregations:", best_schedule.count_double_aggregations())
-    print("Triple aggregations:", best_schedule.count_triple_aggregations())
-    print("Quadruple aggregations:", best_schedule.count_quadruple_aggregations())
+    result = ga.evaluate(best_schedule)
+    print(f"Best fitness: {result.fitness:.4f}")
+    print("Conflicts:", result.conflicts)
+    print("Double aggregations:", result.doubles)
+    print("Triple aggregations:", result.triples)
+    print("Quadruple aggregations:", result.quadruples)
     
@@ -0,0 +1,320 @@
+import random
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ag_timetable.FitnessBreakdown import FitnessBreakdown, free_slots_status
+from ag_timetable.GridShape import GridShape
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+
+def _count_conflicts(catalog: SubjectCatalog, genes: np.ndarray) -> np.ndarray:
+    """
+    Count instructor clashes for a (pop, terms, days, slots) stack of genomes.
+
+    Each (day, slot) column contributes (assigned instructors - distinct instructors).
+    Only instructors teaching in several terms can clash; with at most 64 of them the
+    distinct ones are the set bits of the OR of the column's instructor bitmasks.
+    Otherwise instructor ids are sorted along the term axis and changes between
+    neighbours are counted.
+    """
+    if catalog.conflict_bits is not None:
+        bits = catalog.conflict_bits[genes]
+        distinct = np.bitwise_count(np.bitwise_or.reduce(bits, axis=1)).sum(axis=(1, 2), dtype=np.int64)
+        return np.count_nonzero(bits, axis=(1, 2, 3)) - distinct
+    instr = np.sort(catalog.subject_instructor[genes], axis=1)
+    assigned = instr > 0
+    distinct = assigned[:, 0].sum(axis=(1, 2)) + \
+        (assigned[:, 1:] & (instr[:, 1:] != instr[:, :-1])).sum(axis=(1, 2, 3))
+    return assigned.sum(axis=(1, 2, 3)) - distinct
+
+
+def _free_slots_status(catalog: SubjectCatalog, genes: np.ndarray) -> int:
+    # free_slots_status of one (terms, days, slots) genome, from its first two "Free" cells
+    free = np.argwhere(catalog.is_free[genes])
+    free_slots = [(int(day) + 1, int(slot) + 1) for _, day, slot in free[:2]]
+    return free_slots_status(free_slots, genes.shape[-1])
+
+
+def free_slots_statuses(catalog: SubjectCatalog, genes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized free_slots_status for a (pop, terms, days, slots) stack of genomes.
+
+    The first two "Free" cells of each genome, in term-major order, are rated with
+    the rules of FitnessBreakdown.free_slots_status; genomes with fewer than two
+    score 0.
+    """
+    n, _, days, per_day = genes.shape
+    free = catalog.is_free[genes].reshape(n, -1)
+    cells = free.shape[1]
+    # positions of the first two free cells, `cells` standing for a missing one
+    first, second = np.sort(np.where(free, np.arange(cells), cells), axis=1)[:, :2].T
+    day1, slot1 = np.divmod(first % (days * per_day), per_day)
+    day2, slot2 = np.divmod(second % (days * per_day), per_day)
+    last = per_day - 1
+
+    def pair(a: int, b: int) -> np.ndarray:
+        # the two slots (0-based) are a and b, in either order
+        return ((slot1 == a) & (slot2 == b)) | ((slot1 == b) & (slot2 == a))
+
+    status = pair(0, last) | ((day1 == day2) & (pair(0, 1) | pair(last - 1, last)))
+    return (status & (second < cells)).astype(np.int64)
+
+
+class ScheduleGenome:
+    """
+    Compact, array-backed alternative to WeeklySchedule.
+
+    The genome is a (term x day x slot) integer array of subject ids taken from a
+    SubjectCatalog, with 0 marking an empty slot. Names and instructors live in the
+    catalog side tables, so copying or scoring a genome never touches Python objects
+    per slot.
+
+    Attributes:
+        catalog (SubjectCatalog): Side tables for subject ids.
+        shape (GridShape): Dimensions of the grid; `genes` has shape `shape.dims`.
+        genes (np.ndarray): Subject id per (term, day, slot), zero-based indices.
+        cached_evaluation (Optional[FitnessBreakdown]): Memo set by ScheduleGA, None when stale.
+    """
+    def __init__(self, catalog: SubjectCatalog, genes: np.ndarray = None, shape: Optional[GridShape] = None):
+        """
+        Create a genome, empty unless an existing gene array is given.
+
+        Args:
+            catalog: SubjectCatalog the subject ids refer to.
+            genes: optional (terms, days, slots_per_day) array of subject ids to adopt.
+            shape: grid dimensions; taken from `genes` when omitted, else the default grid.
+        """
+        self.catalog = catalog
+        if shape is None:
+            shape = GridShape(*genes.shape) if genes is not None else GridShape()
+        if genes is None:
+            genes = np.zeros(shape.dims, dtype=np.int16)
+        self.shape = shape
+        self.genes = genes
+        self.cached_evaluation: Optional[FitnessBreakdown] = None
+
+    @classmethod
+    def from_schedule(cls, sched: WeeklySchedule, catalog: SubjectCatalog) -> "ScheduleGenome":
+        """
+        Encode a WeeklySchedule as a genome.
+
+        Args:
+            sched: schedule whose subjects all belong to the catalog.
+            catalog: SubjectCatalog used to resolve subject ids.
+        Returns:
+            The equivalent ScheduleGenome.
+        """
+        # slots are laid out in the same term-major order as the flattened genes
+        genome = cls(catalog, shape=sched.shape)
+        genome.genes.reshape(-1)[:] = [catalog.subject_id(s.subject) for s in sched.slots]
+        return genome
+
+    def to_schedule(self) -> WeeklySchedule:
+        """
+        Decode the genome back into a WeeklySchedule of ClassSlot objects.
+        """
+        sched = WeeklySchedule(shape=self.shape)
+        for s, sid in zip(sched.slots, self.genes.reshape(-1).tolist()):
+            s.subject = self.catalog.subject(sid)
+        return sched
+
+    @classmethod
+    def from_bytes(cls, catalog: SubjectCatalog, blob: bytes, shape: Optional[GridShape] = None) -> "ScheduleGenome":
+        """
+        Rebuild a genome of the given grid shape (default grid if omitted) from the
+        bytes produced by to_bytes().
+        """
+        shape = shape or GridShape()
+        genes = np.frombuffer(blob, dtype=np.int16).reshape(shape.dims).copy()
+        return cls(catalog, genes, shape)
+
+    def to_bytes(self) -> bytes:
+        """
+        Return the genes as raw int16 bytes, the compact form used between processes.
+        """
+        return self.genes.astype(np.int16, copy=False).tobytes()
+
+    def copy(self, out: Optional["ScheduleGenome"] = None) -> "ScheduleGenome":
+        """
+        Return an independent genome sharing the same catalog.
+
+        Args:
+            out: genome of the same shape to overwrite in place instead of allocating
+                a new one (used to recycle buffers).
+        """
+        if out is not None:
+            np.copyto(out.genes, self.genes)
+            out.cached_evaluation = self.cached_evaluation
+            return out
+        clone = ScheduleGenome(self.catalog, self.genes.copy(), self.shape)
+        clone.cached_evaluation = self.cached_evaluation
+        return clone
+
+    def assign_subjects_randomly(self, rng: Optional[random.Random] = None):
+        """
+        Randomly place every subject of the catalog in its term, honouring lecture_count.
+
+        Args:
+            rng: random generator to draw from (the global random module if omitted).
+
+        Raises:
+            ValueError: if a term has more lectures than free slots.
+        """
+        rng = rng or random
+        cells = self.shape.slots_per_term
+        for term in range(1, self.shape.terms + 1):
+            term_genes = self.genes[term - 1].reshape(-1)
+            free = [i for i in range(cells) if term_genes[i] == 0]
+            rng.shuffle(free)
+            pos = 0
+            for sid in self.catalog.term_subject_ids(term):
+                count = int(self.catalog.lecture_count[sid])
+                if pos + count > len(free):
+                    name = self.catalog.names[sid]
+                    raise ValueError(f"Not enough available slots to assign '{name}' in term {term}.")
+                term_genes[free[pos:pos + count]] = sid
+                pos += count
+
+    def assign_subjects_greedily(self, rng: Optional[random.Random] = None):
+        """
+        Place every subject of the catalog with a randomized greedy construction.
+
+        Subjects go in decreasing order of their instructor's weekly load (ties in
+        random order). Each subject's lectures are laid out as blocks: a lecture
+        extends the current block on the same day when that slot is free and the
+        instructor is not already teaching another term at that time; otherwise a new
+        block starts at a random free slot where the instructor is available. A clash
+        is accepted only when the instructor is busy at every free slot of the term.
+
+        Args:
+            rng: random generator to draw from (the global random module if omitted).
+        Raises:
+            ValueError: if a term has more lectures than free slots.
+        """
+        rng = rng or random
+        catalog = self.catalog
+        per_day, per_term = self.shape.slots_per_day, self.shape.slots_per_term
+        flat = self.genes.reshape(-1).tolist()
+        instructor = catalog.subject_instructor.tolist()
+        load = np.bincount(catalog.subject_instructor, weights=catalog.lecture_count).tolist()
+        # busy[timeslot]: instructors already teaching at that (day, slot) in some term
+        busy = [set() for _ in range(per_term)]
+        for cell, sid in enumerate(flat):
+            if sid:
+                busy[cell % per_term].add(instructor[sid])
+
+        order = list(range(1, len(catalog) + 1))
+        rng.shuffle(order)
+        order.sort(key=lambda sid: -load[instructor[sid]])
+        for sid in order:
+            term, iid = int(catalog.subject_term[sid]), instructor[sid]
+            if not 1 <= term <= self.shape.terms:
+                continue
+            first = (term - 1) * per_term
+            lo = hi = None
+            for _ in range(int(catalog.lecture_count[sid])):
+                cell = None
+                if lo is not None:
+                    # grow the current block to the right, else to the left, within the same day
+                    for nxt in (hi + 1, lo - 1):
+                        if nxt // per_day == lo // per_day and flat[nxt] == 0 and iid not in busy[nxt % per_term]:
+                            cell = nxt
+                            break
+                if cell is None:
+                    free = [c for c in range(first, first + per_term) if flat[c] == 0]
+                    if not free:
+                        raise ValueError(f"Not enough available slots to assign '{catalog.names[sid]}' in term {term}.")
+                    available = [c for c in free if iid not in busy[c % per_term]]
+                    cell = rng.choice(available or free)
+                    lo = hi = cell
+                lo, hi = min(lo, cell), max(hi, cell)
+                flat[cell] = sid
+                busy[cell % per_term].add(iid)
+        self.genes[...] = np.array(flat, dtype=self.genes.dtype).reshape(self.genes.shape)
+        self.cached_evaluation = None
+
+    def evaluate(self) -> FitnessBreakdown:
+        """
+        Score the genome with a handful of whole-array operations.
+
+        Conflicts: each (day, slot) column contributes (assigned instructors - distinct
+        instructors), see _count_conflicts.
+        Aggregations: runs of equal, non-empty subject ids along the slot axis.
+
+        Returns:
+            The FitnessBreakdown of this genome.
+        """
+        g = self.genes
+        conflicts = int(_count_conflicts(self.catalog, g[None])[0])
+
+        # True where slot i and i+1 of the same (term, day) hold the same subject
+        eq = (g[..., 1:] == g[..., :-1]) & (g[..., 1:] != 0)
+        eq3 = eq[..., 1:] & eq[..., :-1]
+        eq4 = eq3[..., 1:] & eq[..., :-2]
+
+        return FitnessBreakdown.from_counts(conflicts, int(eq.sum()), int(eq3.sum()), int(eq4.sum()),
+                                            _free_slots_status(self.catalog, g))
+
+    @staticmethod
+    def evaluate_population(catalog: SubjectCatalog, genes: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Score a whole stack of genomes in one batched pass.
+
+        Args:
+            catalog: SubjectCatalog the subject ids refer to.
+            genes: (pop, terms, days, slots_per_day) array of subject ids.
+        Returns:
+            Arrays (conflicts, doubles, triples, quadruples, fitness), one entry per genome.
+        """
+        conflicts = _count_conflicts(catalog, genes)
+
+        eq = (genes[..., 1:] == genes[..., :-1]) & (genes[..., 1:] != 0)
+        eq3 = eq[..., 1:] & eq[..., :-1]
+        eq4 = eq3[..., 1:] & eq[..., :-2]
+        doubles = eq.sum(axis=(1, 2, 3))
+        triples = eq3.sum(axis=(1, 2, 3))
+        quadruples = eq4.sum(axis=(1, 2, 3))
+
+        fitness = (20 * doubles + 30 * triples + 40 * quadruples) / np.maximum(1, 100 * conflicts)
+        return conflicts, doubles, triples, quadruples, fitness
+
+    @staticmethod
+    def evaluate_breakdowns(catalog: SubjectCatalog, genes: np.ndarray) -> List[FitnessBreakdown]:
+        """
+        Score a stack of genomes in one batched pass and return the full breakdown of
+        each, as evaluate() would.
+
+        Args:
+            catalog: SubjectCatalog the subject ids refer to.
+            genes: (pop, terms, days, slots_per_day) array of subject ids.
+        """
+        counts = ScheduleGenome.evaluate_population(catalog, genes)[:4] + (free_slots_statuses(catalog, genes),)
+        return [FitnessBreakdown.from_counts(*row) for row in zip(*(c.tolist() for c in counts))]
+
+    def count_schedule_conflicts(self) -> int:
+        """
+        Count instructor clashes: the same instructor in several terms at one (day, slot).
+
+        Only the conflict term is computed, so this is cheap enough to check after every move.
+        """
+        return int(_count_conflicts(self.catalog, self.genes[None])[0])
+
+    def count_double_aggregations(self) -> int:
+        """
+        Count pairs of consecutive slots on the same day holding the same subject.
+        """
+        return self.evaluate().doubles
+
+    def count_triple_aggregations(self) -> int:
+        """
+        Count runs of three consecutive slots on the same day holding the same subject.
+        """
+        return self.evaluate().triples
+
+    def count_quadruple_aggregations(self) -> int:
+        """
+        Count runs of four consecutive slots on the same day holding the same subject.
+        """
+        return self.evaluate().quadruples
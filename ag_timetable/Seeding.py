@@ -0,0 +1,23 @@
+import random
+from typing import List, Optional
+
+import numpy as np
+
+
+def resolve_seed(seed: Optional[int]) -> int:
+    """
+    Return `seed`, or a fresh 64-bit seed drawn from the global random module when it
+    is None, so that random.seed() still pins runs created without an explicit seed.
+    """
+    return random.getrandbits(64) if seed is None else seed
+
+
+def derive_seeds(seed: int, count: int) -> List[int]:
+    """
+    Derive `count` independent child seeds from a parent seed.
+
+    Uses NumPy's SeedSequence spawning, so the children are statistically independent
+    of each other and of the parent, and depend only on (seed, position): child i is
+    the same whether 2 or 200 children are derived.
+    """
+    return [int(child.generate_state(1, np.uint64)[0]) for child in np.random.SeedSequence(seed).spawn(count)]
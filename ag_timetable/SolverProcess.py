@@ -0,0 +1,115 @@
+import multiprocessing
+import queue
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ag_timetable.FitnessBreakdown import FitnessBreakdown
+from ag_timetable.ScheduleGA import ScheduleGA
+
+# subject name per cell of each term (None for empty cells), term by term
+Rows = List[List[Optional[str]]]
+
+
+def _snapshot(ga: ScheduleGA) -> Tuple[Rows, FitnessBreakdown]:
+    # the current best schedule as plain names, cheap to pickle
+    best = ga.export_best()
+    rows = [[s.subject.subject_name if s.subject else None for s in best.term_slots(term)]
+            for term in range(1, best.shape.terms + 1)]
+    return rows, ga.evaluate(best)
+
+
+def _solver_main(params: Dict[str, Any], messages, cancel, interval: float):
+    """
+    Child process entry point: run one ScheduleGA and report on the `messages` queue.
+
+    Generation stats are sent in batches at most every `interval` seconds, followed by
+    a snapshot of the best schedule whenever it improved.
+    """
+    try:
+        ga = ScheduleGA(**params)
+        pending = []
+        last_flush = time.perf_counter()
+        best_sent = float("-inf")
+        for stats in ga.iter_generations():
+            pending.append(stats)
+            if cancel.is_set():
+                ga.cancel()
+            now = time.perf_counter()
+            if now - last_flush >= interval:
+                messages.put(("progress", pending))
+                pending = []
+                last_flush = now
+                if stats.best > best_sent:
+                    best_sent = stats.best
+                    messages.put(("best", *_snapshot(ga)))
+        if pending:
+            messages.put(("progress", pending))
+        messages.put(("done", *_snapshot(ga), ga.stop_reason))
+    except Exception as exc:
+        messages.put(("error", f"{type(exc).__name__}: {exc}"))
+
+
+class SolverProcess:
+    """
+    Runs ScheduleGA in a child process and relays its progress through a queue.
+
+    Keeping the GA out of the caller's process means it never competes with a GUI
+    event loop for the GIL. The caller polls messages() without blocking and gets
+    tuples of these kinds:
+
+        ("progress", [GenerationStats, ...])     generations finished since the last batch
+        ("best", rows, FitnessBreakdown)         new best schedule, as names per term
+        ("done", rows, FitnessBreakdown, reason) final best schedule and stop_reason
+        ("error", message)                       the GA raised; nothing else follows
+
+    The child is started with the "spawn" method and only imports ag_timetable, so
+    it starts quickly and can itself run a worker pool (workers > 1).
+
+    Attributes:
+        params (Dict[str, Any]): ScheduleGA keyword arguments, including subjects.
+        interval (float): Minimum seconds between progress batches.
+    """
+    def __init__(self, params: Dict[str, Any], interval: float = 0.05):
+        """
+        Prepare the process; call start() to launch it.
+        """
+        self.params = params
+        self.interval = interval
+        ctx = multiprocessing.get_context("spawn")
+        self._messages = ctx.Queue()
+        self._cancel = ctx.Event()
+        # not a daemon: daemonic processes may not start the GA's own worker pool
+        self._process = ctx.Process(target=_solver_main,
+                                    args=(params, self._messages, self._cancel, interval))
+
+    def start(self):
+        self._process.start()
+
+    def messages(self) -> List[Tuple]:
+        """
+        Return every message received so far, without blocking.
+        """
+        received = []
+        while True:
+            try:
+                received.append(self._messages.get_nowait())
+            except queue.Empty:
+                return received
+
+    def cancel(self):
+        """
+        Ask the GA to stop after its current generation; it still sends "done".
+        """
+        self._cancel.set()
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def close(self):
+        """
+        Stop the child process (terminating it if it is still running) and release it.
+        """
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._messages.close()
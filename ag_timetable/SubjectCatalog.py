@@ -0,0 +1,90 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ag_timetable.CourseSubject import CourseSubject
+
+class SubjectCatalog:
+    """
+    Integer-indexed view of a list of course subjects.
+
+    Subject id 0 is reserved for an empty slot, so subject ``i`` (1-based) maps to
+    ``subjects[i - 1]``. Instructors get their own ids in order of first appearance,
+    also starting at 1 so that 0 always means "no instructor".
+
+    Attributes:
+        subjects (List[CourseSubject]): Subjects in catalog order.
+        names (List[str]): Subject name per subject id (index 0 is empty).
+        instructors (List[str]): Instructor name per instructor id (index 0 is empty).
+        subject_instructor (np.ndarray): Instructor id per subject id.
+        subject_term (np.ndarray): Term per subject id (0 for the empty id).
+        lecture_count (np.ndarray): Weekly lectures per subject id.
+        is_free (np.ndarray): True for subject ids named "Free".
+        shared_instructors (List[int]): Ids of instructors teaching in two or more terms,
+            the only ones who can clash across terms.
+        conflict_bits (Optional[np.ndarray]): Per subject id, a uint64 with one bit set for
+            its instructor when that instructor is shared (0 otherwise); None when there
+            are more than 64 shared instructors.
+    """
+    def __init__(self, subjects: List[CourseSubject]):
+        """
+        Compile the side tables for the given subjects.
+
+        Args:
+            subjects: list of CourseSubject instances to index.
+        """
+        self.subjects: List[CourseSubject] = list(subjects)
+        self.names: List[str] = [""]
+        self.instructors: List[str] = [""]
+        self._subject_ids: Dict[Tuple[int, str], int] = {}
+        instructor_ids: Dict[str, int] = {}
+
+        size = len(self.subjects) + 1
+        self.subject_instructor = np.zeros(size, dtype=np.int32)
+        self.subject_term = np.zeros(size, dtype=np.int32)
+        self.lecture_count = np.zeros(size, dtype=np.int32)
+        self.is_free = np.zeros(size, dtype=bool)
+
+        for sid, subject in enumerate(self.subjects, start=1):
+            if subject.instructor not in instructor_ids:
+                instructor_ids[subject.instructor] = len(self.instructors)
+                self.instructors.append(subject.instructor)
+            self.names.append(subject.subject_name)
+            self._subject_ids[(subject.term, subject.subject_name)] = sid
+            self.subject_instructor[sid] = instructor_ids[subject.instructor]
+            self.subject_term[sid] = subject.term
+            self.lecture_count[sid] = subject.lecture_count
+            self.is_free[sid] = subject.subject_name == "Free"
+
+        instructor_terms: Dict[int, set] = {}
+        for sid in range(1, size):
+            instructor_terms.setdefault(int(self.subject_instructor[sid]), set()).add(int(self.subject_term[sid]))
+        self.shared_instructors: List[int] = [iid for iid, terms in instructor_terms.items() if len(terms) > 1]
+        self.conflict_bits: Optional[np.ndarray] = None
+        if len(self.shared_instructors) <= 64:
+            bit_of = {iid: 1 << k for k, iid in enumerate(self.shared_instructors)}
+            self.conflict_bits = np.array([bit_of.get(int(iid), 0) for iid in self.subject_instructor],
+                                          dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.subjects)
+
+    def subject(self, sid: int) -> Optional[CourseSubject]:
+        """
+        Return the CourseSubject for a subject id, or None for the empty id.
+        """
+        return self.subjects[sid - 1] if sid else None
+
+    def subject_id(self, subject: Optional[CourseSubject]) -> int:
+        """
+        Return the id of a subject, matching by (term, subject_name) so copies resolve too.
+        """
+        if subject is None:
+            return 0
+        return self._subject_ids[(subject.term, subject.subject_name)]
+
+    def term_subject_ids(self, term: int) -> List[int]:
+        """
+        Return the ids of all subjects that belong to the given term, in catalog order.
+        """
+        return [sid for sid in range(1, len(self.subjects) + 1) if self.subject_term[sid] == term]
@@ -0,0 +1,60 @@
+import random
+from typing import List
+
+from ag_timetable.CourseSubject import CourseSubject
+
+
+def generate_catalog(
+    terms: int = 6,
+    subjects_per_term: int = 5,
+    instructors: int = 20,
+    sharing: float = 0.3,
+    slots_per_term: int = 20,
+    fill: float = 1.0,
+    max_lectures: int = 8,
+    seed: int = 0
+) -> List[CourseSubject]:
+    """
+    Generate a reproducible synthetic course catalog.
+
+    Every term gets `subjects_per_term` subjects whose lecture counts add up to
+    `fill * slots_per_term` (each subject has between 1 and `max_lectures` lectures).
+    Each subject is taught by an instructor from a shared pool of `instructors` people
+    with probability `sharing`, otherwise by a dedicated instructor, so `sharing`
+    controls how many cross-term clashes the GA has to resolve.
+
+    Args:
+        terms: number of terms (periods).
+        subjects_per_term: subjects per term.
+        instructors: size of the shared instructor pool.
+        sharing: probability (0 to 1) that a subject draws from the shared pool.
+        slots_per_term: weekly slots available per term.
+        fill: fraction of each term's slots that lectures occupy (0 to 1).
+        max_lectures: maximum lectures per subject.
+        seed: random seed; the same arguments always give the same catalog.
+    Returns:
+        The generated list of CourseSubject.
+    Raises:
+        ValueError: if the lectures cannot be split under these limits.
+    """
+    rng = random.Random(seed)
+    lectures_per_term = round(slots_per_term * fill)
+    if not subjects_per_term <= lectures_per_term <= subjects_per_term * max_lectures:
+        raise ValueError(f"Cannot split {lectures_per_term} lectures into {subjects_per_term} subjects "
+                         f"of 1 to {max_lectures} lectures.")
+
+    catalog = []
+    dedicated = 0
+    for term in range(1, terms + 1):
+        counts = [1] * subjects_per_term
+        for _ in range(lectures_per_term - subjects_per_term):
+            open_subjects = [i for i, c in enumerate(counts) if c < max_lectures]
+            counts[rng.choice(open_subjects)] += 1
+        for i, count in enumerate(counts, start=1):
+            if instructors > 0 and rng.random() < sharing:
+                instructor = f"Instructor {rng.randrange(instructors) + 1}"
+            else:
+                dedicated += 1
+                instructor = f"Dedicated {dedicated}"
+            catalog.append(CourseSubject(term, f"T{term} Subject {i}", instructor, count))
+    return catalog
@@ -1,33 +1,130 @@
 from dataclasses import dataclass, field
-from typing import List
-from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import Counter, defaultdict
 import random
 
 from ag_timetable.CourseSubject import CourseSubject
 from ag_timetable.ClassSlot import ClassSlot
+from ag_timetable.FitnessBreakdown import FitnessBreakdown, free_slots_status
+from ag_timetable.GridShape import GridShape
+
+
+def _run_counts(slot_numbers: Iterable[int]) -> Tuple[int, int, int]:
+    """
+    Conta duplas, triplas e quádruplas em um conjunto de horários de uma disciplina
+    em um dia: cada sequência de L aulas consecutivas contém L-1 duplas, L-2 triplas
+    e L-3 quádruplas.
+    """
+    doubles = triples = quadruples = 0
+    run = 0
+    previous = None
+    for number in sorted(slot_numbers):
+        if previous is not None and number == previous + 1:
+            run += 1
+        else:
+            run = 1
+        if run >= 2:
+            doubles += 1
+        if run >= 3:
+            triples += 1
+        if run >= 4:
+            quadruples += 1
+        previous = number
+    return doubles, triples, quadruples
+
+
+def _conflict_change(counts: Counter, removed: Optional[str], added: Optional[str]) -> int:
+    # Variação de conflitos em um horário ao trocar o professor `removed` por `added`
+    if removed == added:
+        return 0
+    change = 0
+    if removed is not None and counts[removed] >= 2:
+        change -= 1
+    if added is not None and counts[added] >= 1:
+        change += 1
+    return change
+
+
+@dataclass
+class _SwapState:
+    """
+    Totais correntes usados por preview_swap/apply_swap.
+    """
+    evaluation: FitnessBreakdown
+    instructors_by_time: Dict[Tuple[int, int], Counter]
+    slots_by_subject_day: Dict[Tuple[int, str, int], Set[int]]
+    free_indices: List[int]
+
+    def copy(self) -> "_SwapState":
+        return _SwapState(self.evaluation,
+                          {key: Counter(counts) for key, counts in self.instructors_by_time.items()},
+                          {key: set(slots) for key, slots in self.slots_by_subject_day.items()},
+                          list(self.free_indices))
+
 
 @dataclass
 class WeeklySchedule:
     slots: List[ClassSlot] = field(default_factory=list)
+    # Dimensões da grade; os slots ficam em ordem período → dia → horário
+    shape: GridShape = field(default_factory=GridShape)
+    # Avaliação memorizada pelo ScheduleGA; None quando precisa ser recalculada
+    cached_evaluation: Optional[FitnessBreakdown] = field(default=None, repr=False, compare=False)
+    # Totais correntes para trocas incrementais; None até a primeira chamada de preview_swap/apply_swap
+    swap_state: Optional[_SwapState] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
-        # Inicializa 6 períodos × 5 dias × 4 aulas = 120 slots semanais
-        for term in range(1, 7):           # Períodos de 1 a 6
-            for day in range(1, 6):        # Dias úteis (1 a 5)
-                for slot in range(1, 5):   # 4 horários por dia
+        # Inicializa períodos × dias × horários (por padrão 6 × 5 × 4 = 120 slots semanais),
+        # a menos que os slots já tenham sido informados
+        if self.slots:
+            return
+        for term in range(1, self.shape.terms + 1):
+            for day in range(1, self.shape.days + 1):
+                for slot in range(1, self.shape.slots_per_day + 1):
                     self.slots.append(ClassSlot(term=term, day=day, slot=slot))
 
-    def assign_subjects_randomly(self, subjects: List[CourseSubject]):
+    def copy(self, out: Optional["WeeklySchedule"] = None) -> "WeeklySchedule":
+        """
+        Retorna uma cópia independente do horário. Só os slots são copiados: as
+        disciplinas (imutáveis) são compartilhadas por referência com o original.
+        Com `out` (um horário da mesma grade), as disciplinas são escritas nos slots
+        dele, sem alocar nada, e os totais de troca dele são descartados.
+        """
+        if out is not None:
+            for dst, src in zip(out.slots, self.slots):
+                dst.subject = src.subject
+            out.cached_evaluation = self.cached_evaluation
+            out.swap_state = None
+            return out
+        return WeeklySchedule([s.copy() for s in self.slots], self.shape, self.cached_evaluation,
+                              self.swap_state.copy() if self.swap_state is not None else None)
+
+    def slot_at(self, term: int, day: int, slot: int) -> ClassSlot:
+        """
+        Retorna o slot de (período, dia, horário) por aritmética de índices, em O(1).
+        """
+        return self.slots[self.shape.index(term, day, slot)]
+
+    def term_slots(self, term: int) -> List[ClassSlot]:
+        """
+        Retorna os slots de um período, na ordem dia → horário.
+        """
+        return self.slots[self.shape.term_slice(term)]
+
+    def assign_subjects_randomly(self, subjects: List[CourseSubject], rng: Optional[random.Random] = None):
         """
         Distribui aleatoriamente as disciplinas em seus respectivos períodos,
         respeitando o número de aulas semanais (lecture_count) de cada uma.
+        Usa o gerador `rng` quando informado, senão o módulo random global.
         """
-        for term in range(1, 7):
-            term_subjects = [s for s in subjects if s.term == term]
-            term_slots = [s for s in self.slots if s.term == term and s.subject is None]
-            random.shuffle(term_slots)
+        rng = rng or random
+        subjects_by_term = defaultdict(list)
+        for subject in subjects:
+            subjects_by_term[subject.term].append(subject)
+        for term in range(1, self.shape.terms + 1):
+            term_slots = [s for s in self.term_slots(term) if s.subject is None]
+            rng.shuffle(term_slots)
 
-            for subject in term_subjects:
+            for subject in subjects_by_term[term]:
                 assigned_count = 0
                 for slot in term_slots:
                     if slot.subject is None:
@@ -38,137 +135,174 @@ class WeeklySchedule:
                 if assigned_count < subject.lecture_count:
                     raise ValueError(f"Not enough available slots to assign '{subject.subject_name}' in term {term}.")
 
-    def count_schedule_conflicts(self) -> int:
+    def evaluate(self) -> FitnessBreakdown:
         """
-        Retorna a quantidade de conflitos de horário, ou seja, quando o mesmo professor
-        está alocado para disciplinas diferentes no mesmo dia e horário, mas em períodos distintos.
+        Avalia o horário em uma única passagem pelos slots, retornando conflitos,
+        aglutinações duplas/triplas/quádruplas, o status das aulas livres e a fitness.
         """
         conflict_count = 0
-        grouped_by_time = defaultdict(list)
+        instructors_by_time = defaultdict(set)
+        slots_by_subject_day = defaultdict(list)
+        free_slots = []
 
-        # Agrupa todos os slots pelo horário (dia e slot)
         for s in self.slots:
-            if s.subject is not None:
-                key = (s.day, s.slot)
-                grouped_by_time[key].append(s)
+            if s.subject is None:
+                continue
+            # Mesmo professor já alocado neste dia e horário em outro período
+            seen = instructors_by_time[(s.day, s.slot)]
+            if s.subject.instructor in seen:
+                conflict_count += 1
+            else:
+                seen.add(s.subject.instructor)
+            slots_by_subject_day[(s.term, s.subject.subject_name, s.day)].append(s.slot)
+            if s.subject.subject_name == "Free":
+                free_slots.append((s.day, s.slot))
 
-        # Verifica se o mesmo professor aparece mais de uma vez no mesmo horário
-        for (day, slot), slots in grouped_by_time.items():
-            prof_counts = defaultdict(list)
-            for s in slots:
-                prof_counts[s.subject.instructor].append(s)
+        doubles = triples = quadruples = 0
+        for slot_list in slots_by_subject_day.values():
+            d, t, q = _run_counts(slot_list)
+            doubles += d
+            triples += t
+            quadruples += q
 
-            for instructor, prof_slots in prof_counts.items():
-                if len(prof_slots) > 1:
-                    conflict_count += len(prof_slots) - 1  # N conflitos = N - 1 pares simultâneos
+        return FitnessBreakdown.from_counts(conflict_count, doubles, triples, quadruples,
+                                            free_slots_status(free_slots, self.shape.slots_per_day))
 
-        return conflict_count
+    def _build_swap_state(self) -> _SwapState:
+        # Indexa professores por horário e horários por (período, disciplina, dia)
+        instructors_by_time = defaultdict(Counter)
+        slots_by_subject_day = defaultdict(set)
+        free_indices = []
+        for idx, s in enumerate(self.slots):
+            if s.subject is None:
+                continue
+            instructors_by_time[(s.day, s.slot)][s.subject.instructor] += 1
+            slots_by_subject_day[(s.term, s.subject.subject_name, s.day)].add(s.slot)
+            if s.subject.subject_name == "Free":
+                free_indices.append(idx)
+        return _SwapState(self.evaluate(), instructors_by_time, slots_by_subject_day, free_indices)
 
-    def count_double_aggregations(self) -> int:
+    def _swap_effect(self, idx1: int, idx2: int):
         """
-        Conta quantas vezes uma disciplina aparece em dois slots consecutivos
-        no mesmo dia (ex: slots 1 e 2).
+        Calcula, sem alterar o horário, a avaliação após trocar as disciplinas dos slots
+        idx1 e idx2, junto com os conjuntos de horários e aulas livres resultantes.
+        Só olha os dois horários (dia, slot) e os até quatro pares disciplina-dia afetados.
         """
-        aggregation_count = 0
-        subject_slots = defaultdict(list)
+        a, b = self.slots[idx1], self.slots[idx2]
+        if a.term != b.term:
+            raise ValueError(f"Cannot swap slots of different terms ({a.term} and {b.term}).")
+        if self.swap_state is None:
+            self.swap_state = self._build_swap_state()
+        state = self.swap_state
+        current = state.evaluation
+        sa, sb = a.subject, b.subject
+        if idx1 == idx2 or sa is sb:
+            return current, {}, state.free_indices
 
-        # Agrupa os slots por disciplina
-        for s in self.slots:
-            if s.subject is not None:
-                key = (s.term, s.subject.subject_name)
-                subject_slots[key].append(s)
+        instr_a = sa.instructor if sa is not None else None
+        instr_b = sb.instructor if sb is not None else None
+        conflicts = current.conflicts
+        conflicts += _conflict_change(state.instructors_by_time[(a.day, a.slot)], instr_a, instr_b)
+        conflicts += _conflict_change(state.instructors_by_time[(b.day, b.slot)], instr_b, instr_a)
 
-        # Verifica aglutinações duplas por dia
-        for (term, subject_name), slots in subject_slots.items():
-            slots_by_day = defaultdict(list)
-            for s in slots:
-                slots_by_day[s.day].append(s.slot)
+        name_a = sa.subject_name if sa is not None else None
+        name_b = sb.subject_name if sb is not None else None
+        changed: Dict[Tuple[int, str, int], Set[int]] = {}
+        if name_a != name_b:
+            for name, src, dst in ((name_a, a, b), (name_b, b, a)):
+                if name is None:
+                    continue
+                src_key = (a.term, name, src.day)
+                dst_key = (a.term, name, dst.day)
+                changed.setdefault(src_key, set(state.slots_by_subject_day.get(src_key, ()))).discard(src.slot)
+                changed.setdefault(dst_key, set(state.slots_by_subject_day.get(dst_key, ()))).add(dst.slot)
 
-            for day, slot_list in slots_by_day.items():
-                slot_list.sort()
-                for i in range(len(slot_list) - 1):
-                    if slot_list[i + 1] == slot_list[i] + 1:
-                        aggregation_count += 1
+        doubles, triples, quadruples = current.doubles, current.triples, current.quadruples
+        for key, new_slots in changed.items():
+            old_d, old_t, old_q = _run_counts(state.slots_by_subject_day.get(key, ()))
+            new_d, new_t, new_q = _run_counts(new_slots)
+            doubles += new_d - old_d
+            triples += new_t - old_t
+            quadruples += new_q - old_q
 
-        return aggregation_count
+        free_indices = state.free_indices
+        if (name_a == "Free") != (name_b == "Free"):
+            moved_from, moved_to = (idx1, idx2) if name_a == "Free" else (idx2, idx1)
+            free_indices = sorted(moved_to if i == moved_from else i for i in free_indices)
+        free_status = free_slots_status([(self.slots[i].day, self.slots[i].slot) for i in free_indices[:2]],
+                                        self.shape.slots_per_day)
 
-    def count_triple_aggregations(self) -> int:
+        result = FitnessBreakdown.from_counts(conflicts, doubles, triples, quadruples, free_status)
+        return result, changed, free_indices
+
+    def preview_swap(self, idx1: int, idx2: int) -> FitnessBreakdown:
         """
-        Conta quantas vezes uma disciplina aparece em três slots consecutivos
-        no mesmo dia (ex: slots 1, 2, 3).
+        Retorna a avaliação que o horário teria após trocar as disciplinas dos slots
+        idx1 e idx2 (do mesmo período), sem aplicar a troca.
         """
-        aggregation_count = 0
-        subject_slots = defaultdict(list)
+        return self._swap_effect(idx1, idx2)[0]
 
-        for s in self.slots:
-            if s.subject is not None:
-                key = (s.term, s.subject.subject_name)
-                subject_slots[key].append(s)
+    def swap_delta(self, idx1: int, idx2: int) -> float:
+        """
+        Retorna a variação de fitness causada pela troca dos slots idx1 e idx2.
+        Custa O(1): só os horários e disciplinas afetados são reavaliados.
+        """
+        result = self.preview_swap(idx1, idx2)
+        return result.fitness - self.swap_state.evaluation.fitness
 
-        for (term, subject_name), slots in subject_slots.items():
-            slots_by_day = defaultdict(list)
-            for s in slots:
-                slots_by_day[s.day].append(s.slot)
+    def apply_swap(self, idx1: int, idx2: int) -> FitnessBreakdown:
+        """
+        Troca as disciplinas dos slots idx1 e idx2 mantendo os totais correntes
+        atualizados, e retorna a nova avaliação. Alterações feitas diretamente em
+        `slots` devem zerar `swap_state` e `cached_evaluation`.
+        """
+        result, changed, free_indices = self._swap_effect(idx1, idx2)
+        state = self.swap_state
+        a, b = self.slots[idx1], self.slots[idx2]
+        if idx1 != idx2:
+            for s, old, new in ((a, a.subject, b.subject), (b, b.subject, a.subject)):
+                counts = state.instructors_by_time[(s.day, s.slot)]
+                if old is not None:
+                    counts[old.instructor] -= 1
+                if new is not None:
+                    counts[new.instructor] += 1
+            state.slots_by_subject_day.update(changed)
+            a.subject, b.subject = b.subject, a.subject
+        state.free_indices = free_indices
+        state.evaluation = result
+        self.cached_evaluation = result
+        return result
 
-            for day, slot_list in slots_by_day.items():
-                slot_list.sort()
-                for i in range(len(slot_list) - 2):
-                    if (slot_list[i + 1] == slot_list[i] + 1 and
-                        slot_list[i + 2] == slot_list[i] + 2):
-                        aggregation_count += 1
+    def count_schedule_conflicts(self) -> int:
+        """
+        Retorna a quantidade de conflitos de horário, ou seja, quando o mesmo professor
+        está alocado para disciplinas diferentes no mesmo dia e horário, mas em períodos distintos.
+        """
+        return self.evaluate().conflicts
 
-        return aggregation_count
+    def count_double_aggregations(self) -> int:
+        """
+        Conta quantas vezes uma disciplina aparece em dois slots consecutivos
+        no mesmo dia (ex: slots 1 e 2).
+        """
+        return self.evaluate().doubles
+
+    def count_triple_aggregations(self) -> int:
+        """
+        Conta quantas vezes uma disciplina aparece em três slots consecutivos
+        no mesmo dia (ex: slots 1, 2, 3).
+        """
+        return self.evaluate().triples
 
     def count_quadruple_aggregations(self) -> int:
         """
         Conta quantas vezes uma disciplina aparece em quatro slots consecutivos
         no mesmo dia (ex: slots 1, 2, 3, 4).
         """
-        aggregation_count = 0
-        subject_slots = defaultdict(list)
+        return self.evaluate().quadruples
 
-        for s in self.slots:
-            if s.subject is not None:
-                key = (s.term, s.subject.subject_name)
-                subject_slots[key].append(s)
-
-        for (term, subject_name), slots in subject_slots.items():
-            slots_by_day = defaultdict(list)
-            for s in slots:
-                slots_by_day[s.day].append(s.slot)
-
-            for day, slot_list in slots_by_day.items():
-                slot_list.sort()
-                for i in range(len(slot_list) - 3):
-                    if (slot_list[i + 1] == slot_list[i] + 1 and
-                        slot_list[i + 2] == slot_list[i] + 2 and
-                        slot_list[i + 3] == slot_list[i] + 3):
-                        aggregation_count += 1
-
-        return aggregation_count
-
-    def free_class_slots_status(self) -> List[ClassSlot]:
-        free_slots = [s for s in self.slots if s.subject.subject_name == "Free"]
-        
-        if free_slots[0].day == free_slots[1].day:
-            if free_slots[0].slot == 1 and free_slots[1].slot == 2:
-                return 1
-            elif free_slots[0].slot == 3 and free_slots[1].slot == 4:
-                return 1
-            elif free_slots[0].slot == 1 and free_slots[1].slot == 4:
-                return 1
-            if free_slots[1].slot == 1 and free_slots[0].slot == 2:
-                return 1
-            elif free_slots[1].slot == 3 and free_slots[0].slot == 4:
-                return 1
-            elif free_slots[1].slot == 1 and free_slots[0].slot == 4:
-                return 1
-            else:
-                return 0
-        else:
-            if free_slots[0].slot == 1 and free_slots[1].slot == 4:
-                return 1
-            elif free_slots[1].slot == 1 and free_slots[0].slot == 4:
-                return 1
-            else:
-                return 0
\ No newline at end of file
+    def free_class_slots_status(self) -> int:
+        """
+        Retorna 1 se as aulas livres ("Free") estão nas pontas do dia, senão 0.
+        """
+        return self.evaluate().free_slots_status
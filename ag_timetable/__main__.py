@@ -0,0 +1,187 @@
+"""
+Headless solver: read course catalogs from CSV/JSON files and write the best schedule.
+
+Each catalog is solved with ScheduleGA and produces one JSON result holding the
+parameters, seed, best fitness breakdown, the schedule slot by slot and the
+per-generation history. Nothing GUI-related is imported, so it suits cron and
+batch jobs:
+
+    python -m ag_timetable catalog.csv --generations 300 --seed 1 --output best.json
+    python -m ag_timetable catalogs/*.csv --local-search tabu --output-dir results/
+    cat catalog.jsonl | python -m ag_timetable - --catalog-format jsonl --output -
+
+CSV catalogs need the header term,subject_name,instructor,lecture_count; see
+CatalogFile.iter_catalog for the JSON layouts.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+from ag_timetable.CatalogFile import FORMATS, load_catalog
+from ag_timetable.OperatorNames import CROSSOVER_OPERATORS, MUTATION_OPERATORS
+
+
+def ga_params(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Translate the command-line options into ScheduleGA keyword arguments.
+    """
+    params = {
+        "pop_size": args.pop_size,
+        "generations": args.generations,
+        "use_tournament": not args.roulette,
+        "crossover_prob": args.crossover_prob,
+        "crossover": args.crossover,
+        "elitism_size": args.elitism_size,
+        "mutation_rate": args.mutation_rate,
+        "tournament_size": args.tournament_size,
+        "workers": args.workers,
+        "stagnation_limit": args.stagnation_limit,
+        "target_conflicts": args.target_conflicts,
+        "time_limit": args.time_limit,
+        "local_search": args.local_search,
+        "local_search_steps": args.local_search_steps,
+        "greedy_init": args.greedy_init,
+        "memo_size": args.memo_size,
+        "duplicates": args.duplicates,
+        "replacement": args.replacement,
+        "offspring_per_step": args.offspring_per_step,
+        "mutation_operators": args.mutation_operators,
+        "adaptive_mutation": args.adaptive_mutation,
+        "mutation_swaps": args.mutation_swaps,
+        "seed": args.seed,
+    }
+    if not args.batched:
+        params["use_genome"] = args.genome
+    return params
+
+
+def solve(subjects, params: Dict[str, Any], days: int, slots_per_day: int, batched: bool,
+          progress_every: int = 0) -> Dict[str, Any]:
+    """
+    Run the GA on one catalog and return the JSON-serializable result document.
+    """
+    from ag_timetable.GridShape import GridShape
+    if batched:
+        from ag_timetable.BatchedScheduleGA import BatchedScheduleGA as ga_class
+    else:
+        from ag_timetable.ScheduleGA import ScheduleGA as ga_class
+
+    shape = GridShape(max(s.term for s in subjects), days, slots_per_day)
+    start = time.perf_counter()
+    ga = ga_class(subjects, shape=shape, **params)
+    for stats in ga.iter_generations():
+        if progress_every and stats.generation % progress_every == 0:
+            print(f"  gen {stats.generation}: best {stats.best:.2f}, conflicts {stats.min_conflicts}",
+                  file=sys.stderr)
+    runtime = time.perf_counter() - start
+
+    best = ga.export_best()
+    breakdown = ga.evaluate(best)
+    return {
+        "params": {**params, "seed": ga.seed, "shape": list(shape.dims), "batched": batched},
+        "best": asdict(breakdown),
+        "schedule": [{"term": s.term, "day": s.day, "slot": s.slot,
+                      "subject": s.subject.subject_name if s.subject else None,
+                      "instructor": s.subject.instructor if s.subject else None}
+                     for s in best.slots],
+        "history": {"generations": ga.history_gens, "best": ga.history_best,
+                    "evaluations": ga.history_evaluations},
+        "stop_reason": ga.stop_reason,
+        "evaluations": ga.evaluations,
+        "mutation_stats": ga.export_mutation_stats(),
+        "runtime": runtime,
+    }
+
+
+def output_path(catalog: str, args: argparse.Namespace) -> str:
+    # where the result of one catalog goes; "-" means stdout
+    if args.output:
+        return args.output
+    stem = "stdin" if catalog == "-" else os.path.splitext(os.path.basename(catalog))[0]
+    if args.output_dir:
+        return os.path.join(args.output_dir, f"{stem}.result.json")
+    if catalog == "-":
+        return "-"
+    return os.path.join(os.path.dirname(catalog), f"{stem}.result.json")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ag_timetable", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("catalogs", nargs="+", help="catalog files (.csv, .json, .jsonl), or - for stdin")
+    parser.add_argument("--catalog-format", choices=FORMATS, help="catalog format (default: from the extension)")
+    parser.add_argument("-o", "--output", help="result file for a single catalog (- for stdout)")
+    parser.add_argument("--output-dir", help="directory for <catalog>.result.json files")
+    parser.add_argument("--pop-size", type=int, default=50)
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--crossover-prob", type=float, default=0.9)
+    parser.add_argument("--crossover", choices=CROSSOVER_OPERATORS, default="one_point")
+    parser.add_argument("--mutation-rate", type=float, default=0.1)
+    parser.add_argument("--elitism-size", type=int, default=2)
+    parser.add_argument("--tournament-size", type=int, default=3)
+    parser.add_argument("--roulette", action="store_true", help="use roulette instead of tournament selection")
+    parser.add_argument("--genome", action="store_true", help="evolve array-backed genomes")
+    parser.add_argument("--batched", action="store_true", help="run BatchedScheduleGA")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--slots-per-day", type=int, default=4)
+    parser.add_argument("--seed", type=int, help="random seed (default: a fresh one, recorded in the result)")
+    parser.add_argument("--stagnation-limit", type=int)
+    parser.add_argument("--target-conflicts", type=int)
+    parser.add_argument("--time-limit", type=float, help="seconds per catalog")
+    parser.add_argument("--local-search", choices=("hill_climbing", "tabu"))
+    parser.add_argument("--local-search-steps", type=int, default=20)
+    parser.add_argument("--greedy-init", type=float, default=0.0)
+    parser.add_argument("--memo-size", type=int, default=0)
+    parser.add_argument("--duplicates", choices=("keep", "mutate", "replace"), default="keep")
+    parser.add_argument("--replacement", choices=("generational", "steady_state"), default="generational")
+    parser.add_argument("--offspring-per-step", type=int, default=2, help="children per steady-state step")
+    parser.add_argument("--mutation-operators", nargs="+", choices=MUTATION_OPERATORS, metavar="OPERATOR",
+                        help=f"term-aware mutation operators ({', '.join(MUTATION_OPERATORS)}); "
+                             f"default: the legacy whole-grid swap")
+    parser.add_argument("--adaptive-mutation", action="store_true",
+                        help="pick mutation operators by their recent success")
+    parser.add_argument("--mutation-swaps", type=int, default=3, help="swaps made by multi_swap")
+    parser.add_argument("--progress", type=int, default=0, metavar="N",
+                        help="print the best fitness every N generations to stderr")
+    args = parser.parse_args(argv)
+    if args.output and len(args.catalogs) > 1:
+        parser.error("--output takes a single catalog; use --output-dir for several")
+    if args.batched and args.genome:
+        parser.error("--batched always evolves genomes; drop --genome")
+    if args.batched and args.workers > 1:
+        parser.error("--batched scores generations in-process; drop --workers")
+
+    params = ga_params(args)
+    failed = 0
+    for catalog in args.catalogs:
+        try:
+            subjects = load_catalog(catalog, args.catalog_format)
+            result = solve(subjects, params, args.days, args.slots_per_day, args.batched, args.progress)
+        except (OSError, ValueError) as exc:
+            print(f"{catalog}: error: {exc}", file=sys.stderr)
+            failed += 1
+            continue
+        result = {"catalog": catalog, **result}
+        path = output_path(catalog, args)
+        if path == "-":
+            json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+            sys.stdout.write("\n")
+        else:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as fh:
+                json.dump(result, fh, indent=2, ensure_ascii=False)
+        best = result["best"]
+        print(f"{catalog}: fitness {best['fitness']:.2f}, conflicts {best['conflicts']}, "
+              f"{len(result['history']['generations'])} generations in {result['runtime']:.2f}s "
+              f"({result['stop_reason']}) -> {path}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Benchmark suite for ScheduleGA on seeded synthetic catalogs.
+
+Runs every combination of catalog preset, GA mode, population size and seed, and
+writes one JSON document with environment metadata and a row per run:
+
+    python -m benchmarks.bench_ga --pop-sizes 50,200 --generations 100 --output bench.json
+    python -m benchmarks.bench_ga --compare old.json new.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ag_timetable.BatchedScheduleGA import BatchedScheduleGA
+from ag_timetable.GridShape import GridShape
+from ag_timetable.ScheduleGA import ScheduleGA
+from ag_timetable.SyntheticCatalog import generate_catalog
+
+# preset name -> (grid shape, generate_catalog arguments besides terms/slots_per_term/seed)
+CATALOGS: Dict[str, Tuple[GridShape, Dict[str, Any]]] = {
+    "baseline": (GridShape(), dict(subjects_per_term=5, instructors=20, sharing=0.3)),
+    "shared": (GridShape(), dict(subjects_per_term=6, instructors=8, sharing=0.8)),
+    "sparse": (GridShape(), dict(subjects_per_term=4, instructors=10, sharing=0.5, fill=0.75)),
+    "large": (GridShape(terms=24, days=6, slots_per_day=7),
+              dict(subjects_per_term=8, instructors=60, sharing=0.5, fill=0.9)),
+}
+
+MODES = ("objects", "genome", "batched")
+
+# generations traced with tracemalloc for the peak-memory figure (tracing slows runs down)
+MEMORY_GENERATIONS = 5
+
+
+def build_ga(mode: str, subjects, shape: GridShape, pop_size: int, generations: int, seed: int) -> ScheduleGA:
+    if mode == "batched":
+        return BatchedScheduleGA(subjects, pop_size=pop_size, generations=generations, shape=shape, seed=seed)
+    return ScheduleGA(subjects, pop_size=pop_size, generations=generations, use_genome=(mode == "genome"),
+                      shape=shape, seed=seed)
+
+
+def run_case(catalog: str, mode: str, pop_size: int, generations: int, seed: int) -> Dict[str, Any]:
+    """
+    Time one GA run and measure its peak memory in a short traced run.
+
+    Returns:
+        A result row (all values JSON-serializable).
+    """
+    shape, options = CATALOGS[catalog]
+    subjects = generate_catalog(terms=shape.terms, slots_per_term=shape.slots_per_term, seed=seed, **options)
+
+    ga = build_ga(mode, subjects, shape, pop_size, generations, seed)
+    time_to_feasible: Optional[float] = None
+    start = time.perf_counter()
+    for stats in ga.iter_generations():
+        if time_to_feasible is None and stats.min_conflicts == 0:
+            time_to_feasible = time.perf_counter() - start
+    runtime = time.perf_counter() - start
+    best = ga.evaluate(ga.export_best())
+
+    tracemalloc.start()
+    traced = build_ga(mode, subjects, shape, pop_size, MEMORY_GENERATIONS, seed)
+    traced.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gens_done = len(ga.history_gens)
+    return {
+        "catalog": catalog,
+        "mode": mode,
+        "pop_size": pop_size,
+        "seed": seed,
+        "generations": gens_done,
+        "runtime_s": runtime,
+        "generations_per_s": gens_done / runtime if runtime else None,
+        "evaluations": ga.evaluations,
+        "evaluations_per_s": ga.evaluations / runtime if runtime else None,
+        "time_to_zero_conflicts_s": time_to_feasible,
+        "peak_memory_bytes": peak,
+        "best_fitness": best.fitness,
+        "best_conflicts": best.conflicts,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "commit": commit,
+    }
+
+
+def compare(old_path: str, new_path: str):
+    """
+    Print the throughput change of every case present in both result files.
+    """
+    def rows(path):
+        with open(path) as fh:
+            doc = json.load(fh)
+        return {(r["catalog"], r["mode"], r["pop_size"], r["seed"]): r for r in doc["results"]}
+
+    old, new = rows(old_path), rows(new_path)
+    print(f"{'catalog':<10} {'mode':<8} {'pop':>6} {'seed':>4} {'old gen/s':>10} {'new gen/s':>10} {'change':>8}")
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key]["generations_per_s"], new[key]["generations_per_s"]
+        change = f"{(after / before - 1) * 100:+.1f}%" if before and after else "n/a"
+        print(f"{key[0]:<10} {key[1]:<8} {key[2]:>6} {key[3]:>4} {before or 0:>10.2f} {after or 0:>10.2f} {change:>8}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalogs", default=",".join(CATALOGS), help="comma-separated catalog presets")
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated GA modes")
+    parser.add_argument("--pop-sizes", default="50,200", help="comma-separated population sizes")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--seeds", type=int, default=1, help="number of seeds per case")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = []
+    for catalog in args.catalogs.split(","):
+        for mode in args.modes.split(","):
+            for pop_size in (int(p) for p in args.pop_sizes.split(",")):
+                for seed in range(args.seeds):
+                    row = run_case(catalog, mode, pop_size, args.generations, seed)
+                    results.append(row)
+                    print(f"{catalog:<10} {mode:<8} pop={pop_size:<6} seed={seed} "
+                          f"{row['generations_per_s']:.2f} gen/s {row['evaluations_per_s']:.0f} evals/s "
+                          f"peak={row['peak_memory_bytes'] / 1e6:.1f}MB", file=sys.stderr)
+
+    with open(args.output, "w") as fh:
+        json.dump({"environment": environment(), "results": results}, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,10 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from concurrent.futures import ThreadPoolExecutor
 
-from ag_timetable.ScheduleGA import ScheduleGA
+from ag_timetable.ParameterSweep import ParameterSweep
+from ag_timetable.SolverProcess import SolverProcess
 from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.GridShape import GridShape
 
 course_schedule = [
     # Term 1
@@ -60,8 +62,9 @@ class ScheduleGAInterface:
         """
         GUI Interface for the Schedule Genetic Algorithm.
 
-        Top frame: form for GA parameters and plot side by side.
-        Bottom frame: pivot table showing the best schedule.
+        "Run" tab - top frame: form for GA parameters and plot side by side;
+        bottom frame: pivot table showing the best schedule.
+        "Sweep" tab: parameter sweep launcher and its aggregate result table.
         """
         self.root = root
         self.root.title("Schedule GA Explorer")
@@ -69,19 +72,31 @@ class ScheduleGAInterface:
         self.root.configure(bg="#2E2E2E")
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        # Executor for background GA runs
+        # Single GA runs go to a child process that streams progress back (see poll_solver)
+        self.solver = None
+        # Sweeps run their own process pool; this thread only waits for it
         self.executor = ThreadPoolExecutor(max_workers=1)
-        self.ga = None
-        self.future = None
+
+        self.sweep = None
+        self.sweep_future = None
 
         self.create_frames()
         self.create_form()
         self.create_plot()
         self.create_table()
+        self.create_sweep_tab()
 
     def create_frames(self):
+        # One tab for single runs, one for parameter sweeps
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=BOTH, expand=True)
+        self.tab_run = Frame(self.notebook, bg="#2E2E2E")
+        self.tab_sweep = Frame(self.notebook, bg="#2E2E2E")
+        self.notebook.add(self.tab_run, text="Run")
+        self.notebook.add(self.tab_sweep, text="Sweep")
+
         # Top container for form and plot
-        self.frame_top = Frame(self.root, bg="#2E2E2E")
+        self.frame_top = Frame(self.tab_run, bg="#2E2E2E")
         self.frame_top.pack(side=TOP, fill=BOTH, expand=True, padx=10, pady=10)
 
         # Form frame on left
@@ -93,7 +108,7 @@ class ScheduleGAInterface:
         self.frame_right.pack(side=RIGHT, fill=BOTH, expand=True)
 
         # Bottom frame for schedule table
-        self.frame_bottom = Frame(self.root, bg="#2E2E2E")
+        self.frame_bottom = Frame(self.tab_run, bg="#2E2E2E")
         self.frame_bottom.pack(side=BOTTOM, fill=BOTH, expand=True, padx=10, pady=(0,10))
 
     def create_form(self):
@@ -106,6 +121,10 @@ class ScheduleGAInterface:
             ("Mutation Rate:", "mu_rate"),
             ("Elitism Size:", "elitism_size"),
             ("Tournament Size:", "tournament_size"),
+            ("Workers:", "workers"),
+            ("Days:", "days"),
+            ("Slots per Day:", "slots_per_day"),
+            ("Seed (blank = random):", "seed"),
         ]
         self.entries = {}
         for label_text, var_name in fields:
@@ -115,7 +134,7 @@ class ScheduleGAInterface:
                           font=("Verdana", 12))
             entry.pack(fill="x", pady=2)
             self.entries[var_name] = entry
-        defaults = {'pop_size':'50','generations':'100','cx_prob':'0.9','mu_rate':'0.1','elitism_size':'2','tournament_size':'3'}
+        defaults = {'pop_size':'50','generations':'100','cx_prob':'0.9','mu_rate':'0.1','elitism_size':'2','tournament_size':'3','workers':'1','days':'5','slots_per_day':'4'}
         for k,v in defaults.items(): self.entries[k].insert(0, v)
         self.tournament_var = BooleanVar(value=True)
         Checkbutton(self.frame_left, text="Tournament Selection", variable=self.tournament_var,
@@ -124,9 +143,15 @@ class ScheduleGAInterface:
         self.run_button = Button(self.frame_left, text="Run GA", bg="#555555", fg="white",
                                  font=("Verdana", 12, "bold"), command=self.on_run)
         self.run_button.pack(pady=10)
+        self.stop_button = Button(self.frame_left, text="Stop", bg="#555555", fg="white",
+                                  font=("Verdana", 12, "bold"), command=self.on_stop, state=DISABLED)
+        self.stop_button.pack(pady=(0, 10))
         self.result_label = Label(self.frame_left, text="Best Fitness: N/A", bg="#2E2E2E", fg="white",
                                    font=("Verdana", 12))
         self.result_label.pack(pady=5)
+        self.breakdown_label = Label(self.frame_left, text="", bg="#2E2E2E", fg="white",
+                                     font=("Verdana", 10), justify=LEFT)
+        self.breakdown_label.pack(anchor="w", pady=5)
 
     def create_plot(self):
         self.fig, self.ax = plt.subplots(figsize=(6, 4))
@@ -136,8 +161,14 @@ class ScheduleGAInterface:
         self.ax.tick_params(colors="white")
         self.ax.set_xlabel("Generation", color="white")
         self.ax.set_ylabel("Fitness", color="white")
+        # animated: full redraws leave the line out and on_draw blits it back on top
+        self.line, = self.ax.plot([], [], color="cyan", label="Best Fitness", animated=True)
+        self.ax.legend(facecolor="#2E2E2E", edgecolor="white", labelcolor="white")
+        self.plot_x, self.plot_y = [], []
+        self.plot_background = None
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame_right)
         self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        self.canvas.mpl_connect("draw_event", self.on_draw)
         self.canvas.draw()
 
     def create_table(self):
@@ -165,22 +196,115 @@ class ScheduleGAInterface:
 
         Label(self.frame_bottom, text="Best Schedule (Periods x Day-Slot)", bg="#2E2E2E", fg="white",
               font=("Verdana", 14, "bold")).pack(anchor="w", pady=(5,0))
-        # Columns: Day1 Slot1 ... Day5 Slot4
-        self.days = range(1,6)
-        self.slots = range(1,5)
-        cols = [f"D{d}_S{s}" for d in self.days for s in self.slots]
-        headers = [f"Day {d} Slot {s}" for d in self.days for s in self.slots]
-        self.tree = ttk.Treeview(self.frame_bottom, columns=cols, show='headings')
+        self.tree = ttk.Treeview(self.frame_bottom, show='headings')
         self.tree.pack(fill=BOTH, expand=True, pady=5)
+        self.configure_columns(GridShape())
 
+    def configure_columns(self, shape):
+        # Columns: Day1 Slot1 ... DayN SlotM for the current grid
+        self.shape = shape
+        days = range(1, shape.days + 1)
+        slots = range(1, shape.slots_per_day + 1)
+        cols = [f"D{d}_S{s}" for d in days for s in slots]
+        headers = [f"Day {d} Slot {s}" for d in days for s in slots]
+        self.tree.configure(columns=cols)
         for col, head in zip(cols, headers):
             self.tree.heading(col, text=head)
             self.tree.column(col, width=90, anchor="center", stretch=True)
+        self.reset_table()
+
+    def create_sweep_tab(self):
+        Label(self.tab_sweep, text="Parameter Sweep", bg="#2E2E2E", fg="white",
+              font=("Verdana", 16, "bold")).pack(anchor="w", padx=10, pady=10)
+        form = Frame(self.tab_sweep, bg="#2E2E2E")
+        form.pack(anchor="w", padx=10)
+        # comma-separated values per parameter; every combination is run (grid search)
+        fields = [
+            ("Population Sizes:", "pop_size", "30,60"),
+            ("Crossover Probs:", "crossover_prob", "0.8,0.9"),
+            ("Mutation Rates:", "mutation_rate", "0.1,0.3"),
+            ("Tournament Sizes:", "tournament_size", "3"),
+            ("Elitism Sizes:", "elitism_size", "2"),
+            ("Generations:", "generations", "100"),
+            ("Seeds per Point:", "seeds", "3"),
+            ("Workers:", "workers", "2"),
+        ]
+        self.sweep_entries = {}
+        for row, (label_text, var_name, default) in enumerate(fields):
+            Label(form, text=label_text, bg="#2E2E2E", fg="white",
+                  font=("Verdana", 12)).grid(row=row, column=0, sticky="w", pady=2)
+            entry = Entry(form, bg="#555555", fg="white", insertbackground="white", font=("Verdana", 12))
+            entry.insert(0, default)
+            entry.grid(row=row, column=1, sticky="we", pady=2)
+            self.sweep_entries[var_name] = entry
+        self.sweep_button = Button(self.tab_sweep, text="Run Sweep", bg="#555555", fg="white",
+                                   font=("Verdana", 12, "bold"), command=self.on_sweep)
+        self.sweep_button.pack(anchor="w", padx=10, pady=10)
+        self.sweep_label = Label(self.tab_sweep, text="", bg="#2E2E2E", fg="white", font=("Verdana", 12))
+        self.sweep_label.pack(anchor="w", padx=10)
+
+        cols = ["pop_size", "crossover_prob", "mutation_rate", "tournament_size", "elitism_size",
+                "runs", "mean_fitness", "max_fitness", "feasible_rate", "mean_time_to_feasible", "mean_runtime"]
+        self.sweep_tree = ttk.Treeview(self.tab_sweep, columns=cols, show='headings')
+        self.sweep_tree.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        for col in cols:
+            self.sweep_tree.heading(col, text=col.replace("_", " ").title())
+            self.sweep_tree.column(col, width=90, anchor="center", stretch=True)
+
+    def on_sweep(self):
+        def values(name, cast):
+            return [cast(v) for v in self.sweep_entries[name].get().split(",") if v.strip()]
+        space = {
+            'pop_size': values('pop_size', int),
+            'crossover_prob': values('crossover_prob', float),
+            'mutation_rate': values('mutation_rate', float),
+            'tournament_size': values('tournament_size', int),
+            'elitism_size': values('elitism_size', int),
+        }
+        self.sweep = ParameterSweep(course_schedule, space,
+                                    seeds=int(self.sweep_entries['seeds'].get()),
+                                    workers=int(self.sweep_entries['workers'].get()),
+                                    base_params={'generations': int(self.sweep_entries['generations'].get()),
+                                                 'use_genome': True})
+        self.sweep_button.config(state=DISABLED)
+        self.sweep_tree.delete(*self.sweep_tree.get_children())
+        self.sweep_progress = (0, len(self.sweep.points()) * self.sweep.seeds)
+        self.sweep_future = self.executor.submit(self.sweep.run, self.on_sweep_progress)
+        self.root.after(200, self.check_sweep)
+
+    def on_sweep_progress(self, done, total):
+        # Runs in the executor thread; the Tk loop picks the value up in check_sweep
+        self.sweep_progress = (done, total)
+
+    def check_sweep(self):
+        done, total = self.sweep_progress
+        self.sweep_label.config(text=f"Runs finished: {done}/{total}")
+        if not self.sweep_future.done():
+            self.root.after(200, self.check_sweep)
+            return
+        self.sweep_button.config(state=NORMAL)
+        try:
+            self.sweep_future.result()
+        except Exception as exc:
+            self.sweep_label.config(text=f"Sweep failed: {exc}")
+            return
+        for row in self.sweep.summary():
+            cells = [f"{row[col]:.4g}" if isinstance(row[col], float) else row[col]
+                     for col in self.sweep_tree["columns"]]
+            self.sweep_tree.insert('', 'end', values=['-' if c is None else c for c in cells])
 
     def on_run(self):
         self.run_button.config(state=DISABLED)
+        self.stop_button.config(state=NORMAL)
         self.result_label.config(text="Best Fitness: Running...")
-        self.tree.delete(*self.tree.get_children())
+        self.breakdown_label.config(text="")
+        shape = GridShape(terms=max(s.term for s in course_schedule),
+                          days=int(self.entries['days'].get()),
+                          slots_per_day=int(self.entries['slots_per_day'].get()))
+        if shape != self.shape:
+            self.configure_columns(shape)
+        else:
+            self.reset_table()
         params = {
             'subjects': course_schedule,
             'pop_size': int(self.entries['pop_size'].get()),
@@ -190,49 +314,120 @@ class ScheduleGAInterface:
             'elitism_size': int(self.entries['elitism_size'].get()),
             'mutation_rate': float(self.entries['mu_rate'].get()),
             'tournament_size': int(self.entries['tournament_size'].get()),
+            'workers': int(self.entries['workers'].get()),
+            'shape': shape,
+            'seed': int(self.entries['seed'].get()) if self.entries['seed'].get().strip() else None,
         }
-        self.ga = ScheduleGA(**params)
-        self.future = self.executor.submit(self.ga.run)
-        self.root.after(100, self.check_future)
-
-    def check_future(self):
-        if self.future.done():
-            best_sched = self.future.result()
-            fitness = self.ga._fitness(best_sched)
-            gens, bests = self.ga.export_history()
-            self.update_plot(gens, bests)
-            self.result_label.config(text=f"Best Fitness: {fitness:.4f}")
-            self.update_table(best_sched)
+        self.reset_plot()
+        self.solver = SolverProcess(params)
+        self.solver.start()
+        self.root.after(50, self.poll_solver)
+
+    def on_stop(self):
+        if self.solver is not None:
+            self.solver.cancel()
+        self.stop_button.config(state=DISABLED)
+
+    def poll_solver(self):
+        # Apply whatever the solver process sent since the last poll, then poll again
+        finished = False
+        # checked before draining, so anything sent before the process exited is read below
+        alive = self.solver.is_alive()
+        for message in self.solver.messages():
+            kind = message[0]
+            if kind == "progress":
+                stats = message[1]
+                self.extend_plot([s.generation for s in stats], [s.best for s in stats])
+                latest = stats[-1]
+                self.result_label.config(text=f"Best Fitness: {latest.best:.4f} (gen {latest.generation})")
+            elif kind == "best":
+                self.show_best(message[1], message[2])
+            elif kind == "done":
+                self.show_best(message[1], message[2])
+                self.result_label.config(text=f"Best Fitness: {message[2].fitness:.4f} ({message[3]})")
+                finished = True
+            elif kind == "error":
+                self.result_label.config(text=f"Run failed: {message[1]}")
+                finished = True
+        if not finished and not alive:
+            self.result_label.config(text="Run failed: the solver process exited")
+            finished = True
+        if finished:
+            self.solver.close()
+            self.solver = None
+            self.fit_plot()
             self.run_button.config(state=NORMAL)
+            self.stop_button.config(state=DISABLED)
         else:
-            self.root.after(100, self.check_future)
+            self.root.after(50, self.poll_solver)
 
-    def update_plot(self, x, y):
-        self.ax.clear()
-        self.ax.set_facecolor("#2E2E2E")
-        self.ax.plot(x, y, color="cyan", label="Best Fitness")
-        self.ax.set_title("Best Fitness over Generations", color="white")
-        self.ax.tick_params(colors="white")
-        self.ax.set_xlabel("Generation", color="white")
-        self.ax.set_ylabel("Fitness", color="white")
-        self.ax.legend(facecolor="#2E2E2E", edgecolor="white", labelcolor="white")
+    def show_best(self, rows, result):
+        self.breakdown_label.config(text=(f"Conflicts: {result.conflicts}\n"
+                                          f"Doubles: {result.doubles}\n"
+                                          f"Triples: {result.triples}\n"
+                                          f"Quadruples: {result.quadruples}\n"
+                                          f"Free slots OK: {'yes' if result.free_slots_status else 'no'}"))
+        self.update_table(rows)
+
+    def on_draw(self, event):
+        # After a full redraw: keep the static background and blit the line back on
+        self.plot_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+
+    def reset_plot(self):
+        self.plot_x, self.plot_y = [], []
+        self.line.set_data([], [])
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 1)
         self.canvas.draw()
 
-    def update_table(self, sched):
+    def extend_plot(self, xs, ys):
+        # Append points; redraw the whole figure only when they leave the axes, else blit the line
+        self.plot_x.extend(xs)
+        self.plot_y.extend(ys)
+        self.line.set_data(self.plot_x, self.plot_y)
+        (_, x_high), (y_low, y_high) = self.ax.get_xlim(), self.ax.get_ylim()
+        if max(xs) > x_high or max(ys) > y_high or min(ys) < y_low:
+            # grow the limits geometrically so full redraws stay rare on long runs
+            self.ax.set_xlim(0, max(x_high, 2 * max(xs)))
+            self.ax.set_ylim(min(y_low, min(ys)), max(y_high, 1.5 * max(ys)))
+            self.canvas.draw()
+        elif self.plot_background is not None:
+            self.canvas.restore_region(self.plot_background)
+            self.ax.draw_artist(self.line)
+            self.canvas.blit(self.ax.bbox)
+
+    def fit_plot(self):
+        # Tighten the axes around the finished run with one full redraw
+        if self.plot_x:
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self.canvas.draw()
+
+    def reset_table(self):
         self.tree.delete(*self.tree.get_children())
-        # Map (term,day,slot)->subject
-        sched_map = {(slot.term, slot.day, slot.slot):
-                     (slot.subject.subject_name if slot.subject else 'Free')
-                     for slot in sched.slots}
-        # Insert a row per term
-        for term in range(1,7):
-            row = []
-            for d in self.days:
-                for s in self.slots:
-                    row.append(sched_map.get((term, d, s), ''))
-            self.tree.insert('', 'end', values=row, tags=('row',))
+        self.table_items = []  # Treeview item of each term's row
+        self.table_rows = []   # values currently shown in each row
+
+    def update_table(self, rows):
+        # Rows are inserted once per term; afterwards only cells whose subject changed are set
+        cols = self.tree["columns"]
+        for term, names in enumerate(rows):
+            values = [name or 'Free' for name in names]
+            if term == len(self.table_items):
+                self.table_items.append(self.tree.insert('', 'end', values=values, tags=('row',)))
+                self.table_rows.append(values)
+                continue
+            item = self.table_items[term]
+            for col, old, new in zip(cols, self.table_rows[term], values):
+                if old != new:
+                    self.tree.set(item, col, new)
+            self.table_rows[term] = values
 
     def on_close(self):
+        if self.solver is not None:
+            self.solver.close()
         self.executor.shutdown(wait=False)
         self.root.quit()
         self.root.destroy()
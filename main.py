@@ -51,7 +51,11 @@ course_schedule = [
 schedule = WeeklySchedule()
 schedule.assign_subjects_randomly(course_schedule)
 
-print("Conflicts:", schedule.count_schedule_conflicts())
-print("Double aggregations:", schedule.count_double_aggregations())
-print("Triple aggregations:", schedule.count_triple_aggregations())
-print("Quadruple aggregations:", schedule.count_quadruple_aggregations())
+result = schedule.evaluate()
+
+print("Conflicts:", result.conflicts)
+print("Double aggregations:", result.doubles)
+print("Triple aggregations:", result.triples)
+print("Quadruple aggregations:", result.quadruples)
+print("Free slots status:", result.free_slots_status)
+print("Fitness:", result.fitness)
@@ -0,0 +1,111 @@
+import random
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from ag_timetable.BatchedScheduleGA import BatchedScheduleGA
+from ag_timetable.CrossoverOperators import (CROSSOVER_OPERATORS, crossover_mask, crossover_masks,
+                                             repair_lectures, term_lectures)
+from ag_timetable.GridShape import GridShape
+from ag_timetable.ScheduleGA import ScheduleGA
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.SyntheticCatalog import generate_catalog
+
+
+def term_counts(genes: np.ndarray):
+    return [Counter(term.reshape(-1).tolist()) for term in genes]
+
+
+class MaskTest(unittest.TestCase):
+    def check(self, name: str, mask: np.ndarray, terms: int):
+        per_term = mask.all(axis=1) | ~mask.any(axis=1)
+        if name != "day":
+            # term-level operators take whole terms from one parent
+            self.assertTrue(per_term.all())
+        from_first = mask[:, 0].tolist()
+        if name == "one_point":
+            cut = from_first.index(False)
+            self.assertTrue(1 <= cut < terms and not any(from_first[cut:]))
+        elif name == "two_point":
+            low = from_first.index(False)
+            high = low + from_first[low:].index(True) if True in from_first[low:] else terms
+            self.assertTrue(low >= 1 and all(from_first[high:]) and not any(from_first[low:high]))
+
+    def test_single_and_vectorized_masks(self):
+        shape = GridShape(6, 5, 4)
+        rng, np_rng = random.Random(1), np.random.default_rng(1)
+        for name in CROSSOVER_OPERATORS:
+            with self.subTest(operator=name):
+                for _ in range(100):
+                    mask = crossover_mask(name, shape, rng)
+                    self.assertEqual(mask.shape, (shape.terms, shape.days))
+                    self.check(name, mask, shape.terms)
+                masks = crossover_masks(name, shape, np_rng, 100)
+                self.assertEqual(masks.shape, (100, shape.terms, shape.days))
+                for mask in masks:
+                    self.check(name, mask, shape.terms)
+
+    def test_single_term_copies_the_first_parent(self):
+        shape = GridShape(1, 5, 4)
+        for name in ("one_point", "two_point"):
+            self.assertTrue(crossover_mask(name, shape, random.Random(1)).all())
+            self.assertTrue(crossover_masks(name, shape, np.random.default_rng(1), 10).all())
+
+
+class RepairTest(unittest.TestCase):
+    def test_counts_are_restored(self):
+        rng = random.Random(2)
+        required = {0: 4, 1: 6, 2: 3, 3: 7}
+        for _ in range(200):
+            cells = [rng.choice(list(required)) for _ in range(20)]
+            before = list(cells)
+            repair_lectures(cells, required, rng)
+            self.assertEqual(Counter(cells), Counter(required))
+            # only surplus cells are overwritten
+            surplus = sum(max(0, n - required[value]) for value, n in Counter(before).items())
+            self.assertEqual(sum(new != old for new, old in zip(cells, before)), surplus)
+
+
+class CrossoverTest(unittest.TestCase):
+    def setUp(self):
+        self.subjects = generate_catalog(instructors=4, sharing=0.9, fill=0.8, seed=11)
+        self.catalog = SubjectCatalog(self.subjects)
+        self.shape = GridShape()
+
+    def test_term_lectures(self):
+        lectures = term_lectures(self.catalog, self.shape)
+        self.assertEqual(len(lectures), self.shape.terms)
+        for counts in lectures:
+            self.assertEqual(sum(counts.values()), self.shape.slots_per_term)
+            # fill=0.8 puts 16 lectures in each term of 20 cells
+            self.assertEqual(counts[0], 4)
+
+    def test_children_keep_lecture_counts(self):
+        for name in CROSSOVER_OPERATORS:
+            for use_genome in (False, True):
+                with self.subTest(operator=name, use_genome=use_genome):
+                    ga = ScheduleGA(self.subjects, pop_size=6, seed=1, use_genome=use_genome, crossover=name)
+                    expected = term_counts(ScheduleGenome.from_schedule(ga.export_best(), self.catalog).genes)
+                    buffer = ga.population[0].copy()
+                    for _ in range(50):
+                        p1, p2 = ga.rng.sample(ga.population, 2)
+                        for child in (ga._crossover(p1, p2), ga._crossover(p1, p2, buffer)):
+                            genes = child.genes if use_genome else ScheduleGenome.from_schedule(child, self.catalog).genes
+                            self.assertEqual(term_counts(genes), expected)
+                            self.assertIsNone(child.cached_evaluation)
+
+    def test_batched_children_keep_lecture_counts(self):
+        for name in CROSSOVER_OPERATORS:
+            for replacement in ("generational", "steady_state"):
+                with self.subTest(operator=name, replacement=replacement):
+                    ga = BatchedScheduleGA(self.subjects, pop_size=12, generations=5, seed=1, crossover=name,
+                                           crossover_prob=1.0, mutation_rate=0.0, replacement=replacement)
+                    expected = term_counts(ga.genes[0])
+                    ga.run()
+                    self.assertTrue(all(term_counts(row) == expected for row in ga.genes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from ag_timetable.BatchedScheduleGA import BatchedScheduleGA
+from ag_timetable.FitnessMemo import FitnessMemo
+from ag_timetable.ScheduleGA import ScheduleGA
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SyntheticCatalog import generate_catalog
+
+
+class FitnessMemoTest(unittest.TestCase):
+    def test_hits_and_misses(self):
+        memo = FitnessMemo(2)
+        self.assertIsNone(memo.get(b"a"))
+        memo.put(b"a", 1)
+        memo.put(b"b", 2)
+        self.assertEqual(memo.get(b"a"), 1)
+        self.assertEqual((memo.hits, memo.misses), (1, 1))
+        # b is now the least recently used entry, so it makes room for c
+        memo.put(b"c", 3)
+        self.assertEqual(len(memo), 2)
+        self.assertIsNone(memo.get(b"b"))
+        self.assertEqual((memo.get(b"a"), memo.get(b"c")), (1, 3))
+        self.assertEqual((memo.hits, memo.misses), (3, 2))
+
+    def test_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            FitnessMemo(0)
+
+
+class GAMemoTest(unittest.TestCase):
+    def setUp(self):
+        self.subjects = generate_catalog(seed=3)
+
+    def test_seen_genome_is_not_scored_again(self):
+        ga = ScheduleGA(self.subjects, pop_size=10, generations=1, seed=1, use_genome=True, memo_size=100)
+        genome = ga.population[0]
+        evaluations, misses = ga.evaluations, ga.memo.misses
+        first = ga.evaluate(ScheduleGenome(ga.catalog, genome.genes.copy(), ga.shape))
+        self.assertEqual((ga.evaluations, ga.memo.misses), (evaluations + 1, misses + 1))
+        # a fresh individual with the same genes, and a WeeklySchedule holding them, hit the memo
+        hits = ga.memo.hits
+        self.assertEqual(ga.evaluate(ScheduleGenome(ga.catalog, genome.genes.copy(), ga.shape)), first)
+        self.assertEqual(ga.evaluate(genome.to_schedule()), first)
+        self.assertEqual((ga.evaluations, ga.memo.hits), (evaluations + 1, hits + 2))
+
+    def test_memo_saves_evaluations_without_changing_the_run(self):
+        for cls, options in [(ScheduleGA, {}), (ScheduleGA, {"use_genome": True}), (BatchedScheduleGA, {})]:
+            with self.subTest(cls=cls.__name__, **options):
+                runs = [cls(self.subjects, pop_size=20, generations=10, seed=4, crossover_prob=0.5,
+                            memo_size=memo_size, **options) for memo_size in (0, 1000)]
+                for ga in runs:
+                    ga.run()
+                plain, memoized = runs
+                self.assertEqual(memoized.history_best, plain.history_best)
+                self.assertEqual(memoized.export_best().slots, plain.export_best().slots)
+                self.assertGreater(memoized.memo.hits, 0)
+                self.assertLess(memoized.evaluations, plain.evaluations)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+
+import numpy as np
+
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.GridShape import GridShape
+from ag_timetable.LocalSearch import LocalSearch
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.SyntheticCatalog import generate_catalog
+
+
+class TabuTest(unittest.TestCase):
+    def setUp(self):
+        # one instructor teaching one lecture in each of three terms, all in the first of
+        # three slots; every schedule scores 0, so no move can beat the best one seen
+        self.shape = GridShape(3, 1, 3)
+        self.catalog = SubjectCatalog([CourseSubject(term, f"Course {term}", "Same", 1) for term in (1, 2, 3)])
+
+    def walk(self, steps: int) -> np.ndarray:
+        genes = np.zeros(self.shape.dims, dtype=np.int16)
+        genes[:, 0, 0] = [self.catalog.term_subject_ids(term)[0] for term in (1, 2, 3)]
+        search = LocalSearch(self.catalog, self.shape, "tabu", steps=steps, tabu_tenure=3, rng=random.Random(0))
+        search.improve(genes)
+        return genes
+
+    def test_moved_cells_stay_put_while_tabu(self):
+        # after two steps both clashing lectures sit on cells the steps moved, so the
+        # third step has no allowed move even though free cells are left
+        after_two = self.walk(2)
+        self.assertEqual(ScheduleGenome(self.catalog, after_two, self.shape).count_schedule_conflicts(), 1)
+        np.testing.assert_array_equal(self.walk(3), after_two)
+
+
+class ImproveTest(unittest.TestCase):
+    def test_result_matches_full_evaluation(self):
+        subjects = generate_catalog(sharing=0.9, instructors=6, seed=1)
+        catalog = SubjectCatalog(subjects)
+        for method in ("hill_climbing", "tabu"):
+            search = LocalSearch(catalog, GridShape(), method, steps=30, rng=random.Random(1))
+            for seed in range(5):
+                with self.subTest(method=method, seed=seed):
+                    genome = ScheduleGenome(catalog)
+                    genome.assign_subjects_randomly(random.Random(seed))
+                    result = search.improve(genome.genes)
+                    self.assertEqual(result, genome.evaluate())
+
+
+if __name__ == "__main__":
+    unittest.main()
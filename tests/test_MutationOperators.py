@@ -0,0 +1,125 @@
+import random
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from ag_timetable.GridShape import GridShape
+from ag_timetable.MutationOperators import OPERATORS, MutationOperators
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.SyntheticCatalog import generate_catalog
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+
+def term_counts(genes: np.ndarray):
+    return [Counter(term.reshape(-1).tolist()) for term in genes]
+
+
+class MutationOperatorsTest(unittest.TestCase):
+    def setUp(self):
+        self.subjects = generate_catalog(instructors=4, sharing=0.9, fill=0.8, seed=11)
+        self.catalog = SubjectCatalog(self.subjects)
+        self.shape = GridShape()
+
+    def random_genome(self, rng: random.Random) -> ScheduleGenome:
+        genome = ScheduleGenome(self.catalog, shape=self.shape)
+        genome.assign_subjects_randomly(rng)
+        return genome
+
+    def test_lecture_counts_are_kept(self):
+        for name in OPERATORS:
+            with self.subTest(operator=name):
+                rng = random.Random(1)
+                mutator = MutationOperators(self.catalog, self.shape, [name], rng=rng)
+                genome = self.random_genome(rng)
+                counts = term_counts(genome.genes)
+                sched = genome.to_schedule()
+                tracked = genome.to_schedule()
+                tracked.evaluate()
+                tracked.apply_swap(0, 1)
+                tracked_counts = term_counts(ScheduleGenome.from_schedule(tracked, self.catalog).genes)
+                for _ in range(200):
+                    self.assertEqual(mutator.mutate(genome), name)
+                    self.assertEqual(mutator.mutate(sched), name)
+                    # a schedule with swap totals is rescored incrementally
+                    mutator.mutate(tracked)
+                self.assertEqual(term_counts(genome.genes), counts)
+                self.assertEqual(term_counts(ScheduleGenome.from_schedule(sched, self.catalog).genes), counts)
+                self.assertEqual(term_counts(ScheduleGenome.from_schedule(tracked, self.catalog).genes),
+                                 tracked_counts)
+                self.assertEqual(tracked.cached_evaluation, WeeklySchedule(tracked.slots, tracked.shape).evaluate())
+                self.assertIsNone(genome.cached_evaluation)
+
+    def test_pairs_stay_in_one_term(self):
+        rng = random.Random(2)
+        mutator = MutationOperators(self.catalog, self.shape, rng=rng)
+        flat = self.random_genome(rng).genes.reshape(-1)
+        per_term, per_day = self.shape.slots_per_term, self.shape.slots_per_day
+        for name in OPERATORS:
+            for _ in range(100):
+                pairs = mutator.swap_pairs(name, flat)
+                with self.subTest(operator=name, pairs=pairs):
+                    self.assertTrue(all(a // per_term == b // per_term and a != b for a, b in pairs))
+                    if name == "multi_swap":
+                        self.assertEqual(len(pairs), mutator.swaps)
+                    if name == "block":
+                        # runs of consecutive cells, each within one day, on two different days
+                        self.assertGreaterEqual(len(pairs), 2)
+                        for cells in zip(*pairs):
+                            self.assertEqual(list(cells), list(range(cells[0], cells[0] + len(cells))))
+                            self.assertEqual(len({cell // per_day for cell in cells}), 1)
+                        self.assertNotEqual(pairs[0][0] // per_day, pairs[0][1] // per_day)
+
+    def test_conflict_moves_a_clashing_cell(self):
+        rng = random.Random(3)
+        mutator = MutationOperators(self.catalog, self.shape, ["conflict"], rng=rng)
+        genome = self.random_genome(rng)
+        flat = genome.genes.reshape(-1)
+        per_term = self.shape.slots_per_term
+        self.assertGreater(genome.count_schedule_conflicts(), 0)
+        for _ in range(100):
+            (cell, _), = mutator.swap_pairs("conflict", flat)
+            instructor = self.catalog.subject_instructor[flat[cell]]
+            timeslot = cell % per_term
+            clashes = [other for other in range(timeslot, len(flat), per_term)
+                       if other != cell and flat[other] and self.catalog.subject_instructor[flat[other]] == instructor]
+            self.assertTrue(flat[cell] and clashes)
+
+    def test_mutate_genes_on_batched_rows(self):
+        rng = random.Random(4)
+        mutator = MutationOperators(self.catalog, self.shape, rng=rng)
+        genes = np.stack([self.random_genome(rng).genes for _ in range(5)])
+        counts = [term_counts(g) for g in genes]
+        flat = genes.reshape(len(genes), -1)
+        for _ in range(100):
+            for row in flat:
+                self.assertIn(mutator.mutate_genes(row), OPERATORS)
+        self.assertEqual([term_counts(g) for g in genes], counts)
+
+    def test_adaptive_probabilities_follow_success(self):
+        mutator = MutationOperators(self.catalog, self.shape, ["swap", "block"], adaptive=True,
+                                    min_probability=0.1, rng=random.Random(5))
+        for _ in range(100):
+            mutator.record("swap", 1.0, 2.0)
+            mutator.record("block", 1.0, 0.5)
+        swap, block = mutator.probabilities
+        self.assertAlmostEqual(swap + block, 1.0)
+        self.assertAlmostEqual(block, 0.1, places=3)
+        stats = mutator.export_stats()
+        self.assertEqual((stats["swap"]["improvements"], stats["swap"]["total_gain"]), (100, 100.0))
+        self.assertEqual(stats["block"]["improvement_rate"], 0.0)
+        # fixed rates only gather statistics
+        fixed = MutationOperators(self.catalog, self.shape, ["swap", "block"], rng=random.Random(5))
+        fixed.record("swap", 1.0, 2.0)
+        self.assertEqual(fixed.probabilities, [0.5, 0.5])
+
+    def test_invalid_settings(self):
+        for options in ({"operators": ["swap", "swap"]}, {"operators": []}, {"operators": ["teleport"]},
+                        {"swaps": 0}, {"min_probability": 0.5}):
+            with self.subTest(**options), self.assertRaises(ValueError):
+                MutationOperators(self.catalog, self.shape, **options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import random
+import unittest
+
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.ParallelEvaluator import ParallelEvaluator
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.SyntheticCatalog import generate_catalog
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+
+class ParallelEvaluatorTest(unittest.TestCase):
+    def test_batches_match_single_evaluation(self):
+        # "Free" lectures make the free-slot status vary between individuals
+        subjects = generate_catalog(instructors=4, sharing=0.9, fill=0.8, seed=11)
+        subjects += [CourseSubject(term, "Free", "Unknow", 2) for term in range(1, 7)]
+        catalog = SubjectCatalog(subjects)
+        rng = random.Random(1)
+        individuals = []
+        for i in range(41):
+            if i % 2:
+                genome = ScheduleGenome(catalog)
+                genome.assign_subjects_randomly(rng)
+                individuals.append(genome)
+            else:
+                sched = WeeklySchedule()
+                sched.assign_subjects_randomly(subjects, rng)
+                individuals.append(sched)
+        expected = [ind.evaluate() if isinstance(ind, ScheduleGenome)
+                    else ScheduleGenome.from_schedule(ind, catalog).evaluate() for ind in individuals]
+        self.assertTrue(any(r.free_slots_status for r in expected))
+        with ParallelEvaluator(catalog, 3) as evaluator:
+            self.assertEqual(evaluator.evaluate(individuals), expected)
+            self.assertEqual(evaluator.evaluate([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
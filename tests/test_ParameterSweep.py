@@ -0,0 +1,18 @@
+import unittest
+
+from ag_timetable.ParameterSweep import ParameterSweep
+from ag_timetable.SyntheticCatalog import generate_catalog
+
+
+class ParameterSweepTest(unittest.TestCase):
+    def test_batched_sweep_accepts_use_genome(self):
+        # the GUI sweeps with use_genome=True in base_params, whichever GA class runs
+        sweep = ParameterSweep(generate_catalog(seed=3), {"mutation_rate": [0.1, 0.3]}, seeds=2, batched=True,
+                               base_params={"pop_size": 16, "generations": 4, "use_genome": True})
+        rows = sweep.run()
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(all(row["use_genome"] for row in rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
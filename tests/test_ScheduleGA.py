@@ -0,0 +1,275 @@
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from ag_timetable.__main__ import main
+from ag_timetable.BatchedScheduleGA import BatchedScheduleGA
+from ag_timetable.CrossoverOperators import CROSSOVER_OPERATORS
+from ag_timetable.GridShape import GridShape
+from ag_timetable.IslandGA import IslandGA
+from ag_timetable.ParameterSweep import ParameterSweep
+from ag_timetable.ScheduleGA import ScheduleGA
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SyntheticCatalog import generate_catalog
+
+
+def lecture_counts_kept(ga, subjects) -> bool:
+    # every individual places each subject exactly lecture_count times in its term
+    for ind in ga.population:
+        sched = ind.to_schedule() if hasattr(ind, "to_schedule") else ind
+        placed = Counter((s.term, s.subject.subject_name) for s in sched.slots if s.subject)
+        if any(placed[(s.term, s.subject_name)] != s.lecture_count for s in subjects):
+            return False
+    return True
+
+
+class OneTermTest(unittest.TestCase):
+    """A single-term grid leaves no cut point for term-level crossover."""
+
+    def setUp(self):
+        self.subjects = generate_catalog(terms=1, seed=2)
+        self.shape = GridShape(1, 5, 4)
+
+    def test_every_crossover_and_replacement(self):
+        for cls, options in [(ScheduleGA, {}), (ScheduleGA, {"use_genome": True}), (BatchedScheduleGA, {})]:
+            for crossover in CROSSOVER_OPERATORS:
+                for replacement in ("generational", "steady_state"):
+                    with self.subTest(cls=cls.__name__, crossover=crossover, replacement=replacement, **options):
+                        ga = cls(self.subjects, pop_size=10, generations=5, shape=self.shape, seed=1,
+                                 crossover=crossover, replacement=replacement, **options)
+                        ga.run()
+                        self.assertEqual(len(ga.history_best), 5)
+                        self.assertTrue(lecture_counts_kept(ga, self.subjects))
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            catalog = os.path.join(tmp, "one_term.json")
+            with open(catalog, "w", encoding="utf-8") as fh:
+                json.dump([[s.term, s.subject_name, s.instructor, s.lecture_count] for s in self.subjects], fh)
+            for extra in ([], ["--batched"]):
+                with self.subTest(extra=extra), contextlib.redirect_stderr(io.StringIO()):
+                    result = os.path.join(tmp, "result.json")
+                    self.assertEqual(main([catalog, "--generations", "3", "--seed", "1", "-o", result] + extra), 0)
+                    with open(result, encoding="utf-8") as fh:
+                        self.assertEqual(json.load(fh)["params"]["shape"], [1, 5, 4])
+
+
+class CommandLineTest(unittest.TestCase):
+    def test_help_does_not_load_the_solver(self):
+        # the solver and NumPy are only imported once a catalog is solved
+        code = ("import sys\n"
+                "from ag_timetable.__main__ import main\n"
+                "try:\n"
+                "    main(['--help'])\n"
+                "except SystemExit:\n"
+                "    pass\n"
+                "print('numpy' in sys.modules, 'ag_timetable.ScheduleGA' in sys.modules)")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.split()[-2:], ["False", "False"])
+
+
+class CancelTest(unittest.TestCase):
+    def test_cancel_before_the_run_is_kept(self):
+        for cls in (ScheduleGA, BatchedScheduleGA):
+            with self.subTest(cls=cls.__name__):
+                ga = cls(generate_catalog(seed=3), pop_size=10, generations=20, seed=1)
+                ga.cancel()
+                ga.run()
+                self.assertEqual(ga.stop_reason, "cancelled")
+                self.assertEqual(len(ga.history_best), 1)
+                # the request ended with that run
+                ga.evolve(3)
+                self.assertEqual(ga.stop_reason, "generations")
+                self.assertEqual(len(ga.history_best), 4)
+
+
+class SeedingTest(unittest.TestCase):
+    """The same seed and parameters give the same run, whatever the worker count."""
+
+    def setUp(self):
+        self.subjects = generate_catalog(seed=3)
+
+    def test_worker_count_does_not_change_the_run(self):
+        for options in ({}, {"use_genome": True}, {"local_search": "tabu", "greedy_init": 0.3}):
+            with self.subTest(**options):
+                runs = []
+                for workers in (1, 2):
+                    ga = ScheduleGA(self.subjects, pop_size=20, generations=8, workers=workers, seed=42, **options)
+                    ga.run()
+                    runs.append((ga.history_best, ga.export_best().slots))
+                self.assertEqual(runs[0], runs[1])
+
+    def test_global_random_state_is_ignored(self):
+        runs = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)
+            np.random.seed(global_seed)
+            for cls in (ScheduleGA, BatchedScheduleGA):
+                ga = cls(self.subjects, pop_size=20, generations=8, seed=7, local_search="hill_climbing")
+                ga.run()
+                runs.append(ga.history_best)
+        self.assertEqual(runs[:2], runs[2:])
+
+    def test_islands_and_sweeps_are_reproducible(self):
+        islands = [IslandGA(self.subjects, islands=3, generations=6, migration_interval=2, topology="random",
+                            seed=11, pop_size=16) for _ in range(2)]
+        for island in islands:
+            island.run()
+        self.assertEqual(islands[0].history_best, islands[1].history_best)
+        rows = []
+        for workers in (1, 2):
+            sweep = ParameterSweep(self.subjects, {"mutation_rate": [0.1, 0.3]}, seeds=2, workers=workers,
+                                   base_params={"pop_size": 16, "generations": 5})
+            rows.append([(row["seed"], row["best_fitness"]) for row in sweep.run()])
+        self.assertEqual(rows[0], rows[1])
+
+    def test_different_seeds_differ(self):
+        histories = []
+        for seed in (1, 2):
+            ga = ScheduleGA(self.subjects, pop_size=20, generations=8, seed=seed)
+            ga.run()
+            histories.append([s.subject for s in ga.population[0].slots])
+        self.assertNotEqual(histories[0], histories[1])
+
+
+class SteadyStateTest(unittest.TestCase):
+    def setUp(self):
+        self.subjects = generate_catalog(sharing=0.9, instructors=6, seed=1)
+
+    def test_local_search_on_all_covers_the_population(self):
+        for options in ({}, {"use_genome": True}):
+            with self.subTest(**options):
+                # only half of the population is bred, so the other half must be improved too
+                ga = ScheduleGA(self.subjects, pop_size=12, generations=1, elitism_size=6, seed=1,
+                                replacement="steady_state", local_search="hill_climbing",
+                                local_search_targets="all", **options)
+                improved = []
+                improve = ga._improve
+                ga._improve = lambda ind: (improved.append(ind), improve(ind))
+                ga.run()
+                self.assertTrue(all(any(ind is seen for seen in improved) for ind in ga.population))
+        ga = BatchedScheduleGA(self.subjects, pop_size=12, generations=1, elitism_size=6, seed=1,
+                               replacement="steady_state", local_search="hill_climbing",
+                               local_search_targets="all")
+        rows = set()
+        improve_rows = ga._improve_rows
+        ga._improve_rows = lambda targets: (rows.update(int(r) for r in targets), improve_rows(targets))
+        ga.run()
+        self.assertEqual(rows, set(range(12)))
+
+
+class LocalSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.subjects = generate_catalog(sharing=0.9, instructors=6, seed=1)
+
+    def test_batched_local_search_scoring_is_counted(self):
+        # without mutations no child is scored twice, so every full scoring is one evaluation
+        for replacement in ("generational", "steady_state"):
+            with self.subTest(replacement=replacement):
+                ga = BatchedScheduleGA(self.subjects, pop_size=20, generations=4, seed=1, mutation_rate=0.0,
+                                       replacement=replacement, local_search="tabu")
+                scorings = []
+                score, improve = ga._score, ga._local_search.improve
+                ga._score = lambda genes: (scorings.append(len(genes)), score(genes))[1]
+                ga._local_search.improve = lambda genes: (scorings.append(1), improve(genes))[1]
+                before = ga.evaluations
+                ga.run()
+                self.assertEqual(ga.evaluations - before, sum(scorings))
+                self.assertEqual(ga.history_evaluations, [18] * 4)
+
+
+class MemoTest(unittest.TestCase):
+    def setUp(self):
+        self.subjects = generate_catalog(seed=3)
+
+    def test_batched_memo_holds_breakdowns(self):
+        ga = BatchedScheduleGA(self.subjects, pop_size=16, generations=3, seed=5, memo_size=64)
+        ga.run()
+        for genome in ga.population:
+            # every row is in the memo, filled by the batched scoring
+            fresh = ScheduleGenome(genome.catalog, genome.genes.copy(), genome.shape)
+            self.assertEqual(ga.evaluate(fresh), genome.evaluate())
+            self.assertEqual(ga._fitness(fresh), genome.evaluate().fitness)
+        hits = ga.memo.hits
+        ga.evaluate(ScheduleGenome(ga.catalog, ga.genes[0].copy(), ga.shape))
+        self.assertEqual(ga.memo.hits, hits + 1)
+
+
+class IslandTest(unittest.TestCase):
+    def test_worker_pools_are_rejected(self):
+        subjects = generate_catalog(seed=3)
+        with self.assertRaises(ValueError):
+            IslandGA(subjects, islands=2, workers=2)
+        with self.assertRaises(ValueError):
+            IslandGA(subjects, islands=2, island_overrides=[{}, {"workers": 2}])
+        island = IslandGA(subjects, islands=2, workers=2, island_overrides=[{"workers": 1}, {"workers": 1}])
+        self.assertEqual([params["workers"] for params in island.island_params], [1, 1])
+
+
+class ResumeTest(unittest.TestCase):
+    def setUp(self):
+        self.subjects = generate_catalog(seed=3)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "run.ckpt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resume_matches_uninterrupted_run(self):
+        configurations = [
+            (ScheduleGA, {}),
+            (ScheduleGA, {"use_genome": True, "duplicates": "mutate"}),
+            (ScheduleGA, {"use_genome": True, "mutation_operators": ["swap", "block", "conflict"],
+                          "adaptive_mutation": True, "crossover": "day"}),
+            (ScheduleGA, {"replacement": "steady_state", "local_search": "tabu"}),
+            (BatchedScheduleGA, {"use_tournament": False}),
+            (BatchedScheduleGA, {"replacement": "steady_state", "mutation_operators": ["multi_swap"]}),
+        ]
+        for cls, options in configurations:
+            with self.subTest(cls=cls.__name__, **options):
+                full = cls(self.subjects, pop_size=16, generations=12, seed=5, **options)
+                full.run()
+                part = cls(self.subjects, pop_size=16, generations=12, seed=5,
+                           checkpoint_path=self.path, checkpoint_every=6, **options)
+                for _ in part.iter_generations(6):
+                    pass
+                resumed = cls.resume(self.path)
+                self.assertEqual(resumed.history_best, full.history_best)
+                self.assertEqual(resumed.history_evaluations, full.history_evaluations)
+                self.assertEqual(resumed.export_best().slots, full.export_best().slots)
+                self.assertEqual(resumed.export_mutation_stats(), full.export_mutation_stats())
+
+    def test_stopped_run_is_not_extended(self):
+        for cls in (ScheduleGA, BatchedScheduleGA):
+            with self.subTest(cls=cls.__name__):
+                ga = cls(self.subjects, pop_size=20, generations=50, seed=5, stagnation_limit=3,
+                         checkpoint_path=self.path, checkpoint_every=1)
+                ga.run()
+                self.assertEqual(ga.stop_reason, "stagnation")
+                resumed = cls.resume(self.path)
+                self.assertEqual(resumed.stop_reason, "stagnation")
+                self.assertEqual(resumed.history_best, ga.history_best)
+
+    def test_batched_population_outlives_the_checkpoint_file(self):
+        ga = BatchedScheduleGA(self.subjects, pop_size=20, generations=4, seed=5,
+                               checkpoint_path=self.path, checkpoint_every=2)
+        ga.run()
+        restored = BatchedScheduleGA.load_checkpoint(self.path)
+        # owns its buffer rather than viewing a mapping of the file save_checkpoint replaces
+        self.assertTrue(restored.genes.flags.owndata)
+        genes = restored.genes.copy()
+        restored.save_checkpoint(self.path)
+        np.testing.assert_array_equal(restored.genes, genes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+import numpy as np
+
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.GridShape import GridShape
+from ag_timetable.ScheduleGenome import ScheduleGenome
+from ag_timetable.SubjectCatalog import SubjectCatalog
+from ag_timetable.SyntheticCatalog import generate_catalog
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+
+def catalog_with_free(terms: int = 6, slots_per_term: int = 20, seed: int = 11):
+    # many clashes, "Free" lectures and some empty cells per term
+    subjects = generate_catalog(terms=terms, instructors=4, sharing=0.9, slots_per_term=slots_per_term,
+                                fill=0.8, seed=seed)
+    return subjects + [CourseSubject(term, "Free", "Unknow", 2) for term in range(1, terms + 1)]
+
+
+def random_schedules(subjects, shape: GridShape, n: int, seed: int):
+    rng = random.Random(seed)
+    schedules = []
+    for _ in range(n):
+        sched = WeeklySchedule(shape=shape)
+        sched.assign_subjects_randomly(subjects, rng)
+        schedules.append(sched)
+    return schedules
+
+
+class GenomeEvaluationTest(unittest.TestCase):
+    """ScheduleGenome scoring must agree with WeeklySchedule.evaluate."""
+
+    def check(self, subjects, shape: GridShape):
+        catalog = SubjectCatalog(subjects)
+        schedules = random_schedules(subjects, shape, 50, seed=shape.days)
+        genomes = [ScheduleGenome.from_schedule(sched, catalog) for sched in schedules]
+        expected = [sched.evaluate() for sched in schedules]
+        self.assertEqual([genome.evaluate() for genome in genomes], expected)
+        self.assertEqual([genome.to_schedule().evaluate() for genome in genomes], expected)
+        self.assertEqual(ScheduleGenome.evaluate_breakdowns(catalog, np.stack([g.genes for g in genomes])), expected)
+        conflicts, doubles, triples, quadruples, fitness = \
+            ScheduleGenome.evaluate_population(catalog, np.stack([g.genes for g in genomes]))
+        self.assertEqual(conflicts.tolist(), [r.conflicts for r in expected])
+        self.assertEqual(doubles.tolist(), [r.doubles for r in expected])
+        self.assertEqual(triples.tolist(), [r.triples for r in expected])
+        self.assertEqual(quadruples.tolist(), [r.quadruples for r in expected])
+        self.assertEqual(fitness.tolist(), [r.fitness for r in expected])
+        self.assertTrue(any(r.conflicts for r in expected))
+        self.assertTrue(any(r.free_slots_status for r in expected))
+
+    def test_default_grid(self):
+        self.check(catalog_with_free(), GridShape())
+
+    def test_other_grids(self):
+        for terms, days, per_day in ((3, 4, 6), (2, 3, 3)):
+            with self.subTest(shape=(terms, days, per_day)):
+                self.check(catalog_with_free(terms, days * per_day), GridShape(terms, days, per_day))
+
+    def test_bytes_round_trip(self):
+        subjects = catalog_with_free()
+        catalog = SubjectCatalog(subjects)
+        sched = random_schedules(subjects, GridShape(), 1, seed=1)[0]
+        genome = ScheduleGenome.from_schedule(sched, catalog)
+        clone = ScheduleGenome.from_bytes(catalog, genome.to_bytes())
+        np.testing.assert_array_equal(clone.genes, genome.genes)
+        self.assertEqual([s.subject for s in clone.to_schedule().slots], [s.subject for s in sched.slots])
+
+
+class ConflictCountTest(unittest.TestCase):
+    """Bitmask conflict counting and its fallback for more than 64 shared instructors."""
+
+    def test_fallback_for_many_shared_instructors(self):
+        shape = GridShape(3, 5, 16)
+        subjects = [CourseSubject(term, f"T{term} Subject {i}", f"Instructor {i % 70}", 1)
+                    for term in (1, 2, 3) for i in range(75)]
+        catalog = SubjectCatalog(subjects)
+        self.assertEqual(len(catalog.shared_instructors), 70)
+        self.assertIsNone(catalog.conflict_bits)
+        self.check(subjects, catalog, shape)
+
+    def test_fallback_matches_bitmasks(self):
+        subjects = catalog_with_free()
+        catalog = SubjectCatalog(subjects)
+        self.assertIsNotNone(catalog.conflict_bits)
+        self.check(subjects, catalog, GridShape())
+        catalog.conflict_bits = None
+        self.check(subjects, catalog, GridShape())
+
+    def check(self, subjects, catalog: SubjectCatalog, shape: GridShape):
+        schedules = random_schedules(subjects, shape, 30, seed=2)
+        genomes = [ScheduleGenome.from_schedule(sched, catalog) for sched in schedules]
+        expected = [sched.evaluate().conflicts for sched in schedules]
+        self.assertTrue(any(expected))
+        self.assertEqual([genome.count_schedule_conflicts() for genome in genomes], expected)
+        conflicts = ScheduleGenome.evaluate_population(catalog, np.stack([g.genes for g in genomes]))[0]
+        self.assertEqual(conflicts.tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import random
+import unittest
+
+from ag_timetable.CourseSubject import CourseSubject
+from ag_timetable.FitnessBreakdown import FitnessBreakdown
+from ag_timetable.GridShape import GridShape
+from ag_timetable.SyntheticCatalog import generate_catalog
+from ag_timetable.WeeklySchedule import WeeklySchedule
+
+
+def catalog():
+    # few shared instructors (many clashes), "Free" lectures and some empty cells per term
+    subjects = generate_catalog(instructors=4, sharing=0.9, fill=0.8, seed=11)
+    return subjects + [CourseSubject(term, "Free", "Unknow", 2) for term in range(1, 7)]
+
+
+class EvaluateTest(unittest.TestCase):
+    """evaluate() on a small hand-built schedule whose counts are known."""
+
+    def setUp(self):
+        self.lecture = CourseSubject(1, "Lecture", "Same", 4)
+        self.free = CourseSubject(1, "Free", "Unknow", 2)
+        self.other = CourseSubject(2, "Other", "Same", 1)
+        self.sched = WeeklySchedule(shape=GridShape(2, 2, 4))
+        for slot in range(1, 5):
+            self.sched.slot_at(1, 1, slot).subject = self.lecture
+        # the instructor also teaches term 2 at day 1, slot 1
+        self.sched.slot_at(2, 1, 1).subject = self.other
+
+    def place_free(self, *cells):
+        for s in self.sched.term_slots(1):
+            if s.subject is self.free:
+                s.subject = None
+        for day, slot in cells:
+            self.sched.slot_at(1, day, slot).subject = self.free
+
+    def test_breakdown(self):
+        self.place_free((2, 1), (2, 4))
+        expected = FitnessBreakdown(conflicts=1, doubles=3, triples=2, quadruples=1, free_slots_status=1,
+                                    fitness=(20 * 3 + 30 * 2 + 40 * 1) / 100)
+        self.assertEqual(self.sched.evaluate(), expected)
+        self.assertEqual(self.sched.count_schedule_conflicts(), 1)
+        self.assertEqual(self.sched.count_double_aggregations(), 3)
+        self.assertEqual(self.sched.count_triple_aggregations(), 2)
+        self.assertEqual(self.sched.count_quadruple_aggregations(), 1)
+        self.assertEqual(self.sched.free_class_slots_status(), 1)
+
+    def test_free_slot_status(self):
+        for cells, status in [(((2, 1), (2, 2)), 1), (((2, 3), (2, 4)), 1), (((2, 2), (2, 3)), 0),
+                              (((2, 1), (2, 3)), 0), (((2, 4), (2, 1)), 1)]:
+            with self.subTest(cells=cells):
+                self.place_free(*cells)
+                self.assertEqual(self.sched.evaluate().free_slots_status, status)
+
+    def test_conflict_free_fitness(self):
+        self.sched.slot_at(2, 1, 1).subject = None
+        self.sched.slot_at(2, 2, 1).subject = self.other
+        self.place_free((2, 2), (2, 3))
+        result = self.sched.evaluate()
+        self.assertEqual(result.conflicts, 0)
+        # the adjacent Free lectures add a double; the denominator is floored at 1
+        self.assertEqual(result.fitness, 20 * 4 + 30 * 2 + 40 * 1)
+
+
+class IncrementalSwapTest(unittest.TestCase):
+    """preview_swap, swap_delta and apply_swap must agree with a full evaluate()."""
+
+    def setUp(self):
+        self.subjects = catalog()
+
+    def random_schedule(self, rng: random.Random) -> WeeklySchedule:
+        sched = WeeklySchedule()
+        sched.assign_subjects_randomly(self.subjects, rng)
+        return sched
+
+    def random_pair(self, sched: WeeklySchedule, rng: random.Random):
+        # two cells of one term, occasionally the same cell
+        term = sched.shape.term_slice(rng.randint(1, sched.shape.terms))
+        cells = range(term.start, term.stop)
+        idx1 = rng.choice(cells)
+        return idx1, idx1 if rng.random() < 0.05 else rng.choice(cells)
+
+    def test_random_swap_sequences(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            sched = self.random_schedule(rng)
+            for step in range(300):
+                idx1, idx2 = self.random_pair(sched, rng)
+                before = sched.evaluate()
+                preview = sched.preview_swap(idx1, idx2)
+                delta = sched.swap_delta(idx1, idx2)
+                applied = sched.apply_swap(idx1, idx2)
+                after = sched.evaluate()
+                with self.subTest(seed=seed, step=step, swap=(idx1, idx2)):
+                    self.assertEqual(preview, after)
+                    self.assertEqual(applied, after)
+                    self.assertEqual(sched.cached_evaluation, after)
+                    self.assertAlmostEqual(delta, after.fitness - before.fitness)
+
+    def test_preview_leaves_schedule_unchanged(self):
+        rng = random.Random(3)
+        sched = self.random_schedule(rng)
+        subjects = [s.subject for s in sched.slots]
+        before = sched.evaluate()
+        for _ in range(100):
+            sched.preview_swap(*self.random_pair(sched, rng))
+        self.assertEqual([s.subject for s in sched.slots], subjects)
+        self.assertEqual(sched.evaluate(), before)
+
+    def test_copies_keep_independent_swap_state(self):
+        rng = random.Random(4)
+        sched = self.random_schedule(rng)
+        sched.apply_swap(*self.random_pair(sched, rng))
+        clone = sched.copy()
+        for _ in range(50):
+            clone.apply_swap(*self.random_pair(clone, rng))
+        for target in (sched, clone):
+            for _ in range(50):
+                target.apply_swap(*self.random_pair(target, rng))
+                self.assertEqual(target.cached_evaluation, target.evaluate())
+
+    def test_swap_across_terms_is_rejected(self):
+        sched = self.random_schedule(random.Random(5))
+        with self.assertRaises(ValueError):
+            sched.preview_swap(0, sched.shape.slots_per_term)
+
+
+if __name__ == "__main__":
+    unittest.main()